@@ -0,0 +1,221 @@
+# log_follow.py
+# 목적: 로그 파일에 새로 추가된 줄만 읽어서 JSON Lines 파일(.jsonl)에 이어 쓰는 프로그램.
+#
+# [동작 방식]
+# - 마지막으로 처리한 바이트 위치와 파일의 inode 번호를 체크포인트 파일에 저장
+# - 다음 실행 때는 그 위치부터 새로 생긴 바이트만 읽음 (전체 로그를 다시 읽지 않음)
+# - 로그 회전(파일이 새 파일로 교체됨): inode가 바뀌면 예전 파일의 남은 부분을 마저 읽고
+#   새 파일은 처음부터 읽음
+# - 로그 잘림(파일 크기가 줄었거나 이미 읽은 부분의 내용이 바뀜): 처음부터 다시 읽음
+# - 아직 줄바꿈으로 끝나지 않은 마지막 줄은 다음 차례에 처리
+
+import argparse
+import glob
+import json
+import os
+import time
+
+from main import parse_log_line
+
+# 새 데이터를 한 번에 읽는 최대 바이트 수 (메모리 사용량 제한)
+READ_CHUNK_SIZE = 1 << 20
+
+# 잘림 확인용으로 체크포인트 직전 몇 바이트를 저장할지
+FINGERPRINT_SIZE = 64
+
+
+def load_checkpoint(checkpoint_filename):
+    """체크포인트 파일을 읽어오는 함수 (없거나 깨졌으면 None)"""
+    try:
+        with open(checkpoint_filename, 'r', encoding='utf-8') as file:
+            return json.load(file)
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def save_checkpoint(checkpoint_filename, checkpoint):
+    """
+    체크포인트를 저장하는 함수
+    임시 파일에 먼저 쓰고 os.replace()로 바꿔치기하므로 중간에 종료되어도 파일이 깨지지 않음
+    """
+    temp_filename = checkpoint_filename + '.tmp'
+    with open(temp_filename, 'w', encoding='utf-8') as file:
+        json.dump(checkpoint, file)
+    os.replace(temp_filename, checkpoint_filename)
+
+
+def read_fingerprint(path, offset):
+    """
+    offset 바로 앞 FINGERPRINT_SIZE 바이트를 16진수 문자열로 돌려주는 함수
+    파일이 잘린 뒤 다시 커져서 크기만으로는 알 수 없는 경우를 찾아내기 위함
+    """
+    start = max(0, offset - FINGERPRINT_SIZE)
+    with open(path, 'rb') as file:
+        file.seek(start)
+        return file.read(offset - start).hex()
+
+
+def _find_rotated_file(log_filename, device, inode):
+    """
+    회전되어 이름이 바뀐 예전 로그 파일을 inode 번호로 찾는 함수
+    (예: mission_computer_main.log → mission_computer_main.log.1)
+    """
+    for path in glob.glob(log_filename + '*'):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        if stat.st_ino == inode and stat.st_dev == device:
+            return path
+    return None
+
+
+def _append_new_records(path, offset, output_file):
+    """
+    path 파일의 offset 바이트부터 끝까지 완성된 줄만 읽어 output_file에 기록하는 함수
+
+    Returns:
+    - tuple: (처리를 마친 바이트 위치, 기록한 레코드 수)
+    """
+    count = 0
+    with open(path, 'rb') as file:
+        file.seek(offset)
+        # 파일의 처음부터 읽는 경우에는 첫 줄(헤더)을 건너뜀
+        if offset == 0:
+            header = file.readline()
+            if not header.endswith(b'\n'):
+                return 0, 0
+            offset = len(header)
+
+        carry = b''
+        while True:
+            chunk = file.read(READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            data = carry + chunk
+            last_newline = data.rfind(b'\n')
+            if last_newline == -1:
+                carry = data
+                continue
+
+            complete = data[:last_newline + 1]
+            carry = data[last_newline + 1:]
+            for raw_line in complete.split(b'\n')[:-1]:
+                record = parse_log_line(raw_line.decode('utf-8'))
+                if record is None:
+                    continue
+                timestamp, event, message = record
+                output_file.write(json.dumps(
+                    {'timestamp': timestamp, 'event': event, 'message': message},
+                    ensure_ascii=False) + '\n')
+                count += 1
+            offset += len(complete)
+
+    return offset, count
+
+
+def process_new_data(log_filename, output_filename, checkpoint_filename):
+    """
+    체크포인트 이후에 추가된 로그만 처리하는 함수
+
+    Parameters:
+    - log_filename (str): 로그 파일 경로
+    - output_filename (str): 이어 쓸 JSON Lines 파일 경로
+    - checkpoint_filename (str): 체크포인트 파일 경로
+
+    Returns:
+    - int: 이번에 추가로 기록한 레코드 수
+    """
+    stat = os.stat(log_filename)
+    checkpoint = load_checkpoint(checkpoint_filename)
+    count = 0
+
+    # 'a' 모드: 기존 내용 뒤에 이어 쓰기
+    with open(output_filename, 'a', encoding='utf-8') as output_file:
+        offset = 0
+        if checkpoint is not None:
+            same_file = (checkpoint['inode'] == stat.st_ino
+                         and checkpoint['device'] == stat.st_dev)
+            if same_file:
+                # 파일이 잘렸으면(크기가 줄었거나 이미 읽은 부분이 바뀜) 처음부터 다시 읽음
+                offset = checkpoint['offset']
+                fingerprint = read_fingerprint(log_filename, offset)
+                if stat.st_size < offset or fingerprint != checkpoint.get('fingerprint'):
+                    offset = 0
+            else:
+                # 로그 회전: 예전 파일에 남아 있던 부분을 먼저 마저 처리
+                rotated = _find_rotated_file(log_filename, checkpoint['device'],
+                                             checkpoint['inode'])
+                if rotated is not None:
+                    _, rotated_count = _append_new_records(rotated, checkpoint['offset'],
+                                                           output_file)
+                    count += rotated_count
+
+        offset, new_count = _append_new_records(log_filename, offset, output_file)
+        count += new_count
+        # 체크포인트보다 출력이 먼저 디스크에 기록되도록 함
+        output_file.flush()
+        os.fsync(output_file.fileno())
+
+    save_checkpoint(checkpoint_filename, {
+        'inode': stat.st_ino,
+        'device': stat.st_dev,
+        'offset': offset,
+        'fingerprint': read_fingerprint(log_filename, offset)
+    })
+    return count
+
+
+def follow(log_filename, output_filename, checkpoint_filename, interval=1.0):
+    """
+    로그 파일을 계속 지켜보며 새 줄이 생길 때마다 처리하는 함수 (Ctrl+C로 종료)
+    """
+    print(f'=== {log_filename} 감시 시작 (종료: Ctrl+C) ===')
+    try:
+        while True:
+            try:
+                count = process_new_data(log_filename, output_filename,
+                                         checkpoint_filename)
+                if count:
+                    print(f'새 로그 {count}건 추가')
+            except FileNotFoundError:
+                # 회전 중에 잠깐 파일이 없을 수 있으므로 다음 차례에 다시 시도
+                pass
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        print('\n감시를 종료합니다.')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='미션 로그의 새 줄만 JSON Lines로 이어 쓰기')
+    parser.add_argument('--log', default='mission_computer_main.log',
+                        help='로그 파일 경로')
+    parser.add_argument('--output', default='mission_computer_main.jsonl',
+                        help='이어 쓸 JSON Lines 파일 경로')
+    parser.add_argument('--checkpoint', default=None,
+                        help='체크포인트 파일 경로 (기본값: 로그 파일명 + .ckpt)')
+    parser.add_argument('--follow', action='store_true',
+                        help='종료하지 않고 계속 새 줄을 감시')
+    parser.add_argument('--interval', type=float, default=1.0,
+                        help='감시 모드에서 파일을 확인하는 간격 (초)')
+    args = parser.parse_args(argv)
+
+    checkpoint_filename = args.checkpoint or args.log + '.ckpt'
+
+    if args.follow:
+        follow(args.log, args.output, checkpoint_filename, args.interval)
+        return
+
+    try:
+        count = process_new_data(args.log, args.output, checkpoint_filename)
+        print(f'새 로그 {count}건을 {args.output}에 추가했습니다.')
+    except FileNotFoundError:
+        print(f'오류: {args.log} 파일을 찾을 수 없습니다.')
+    except UnicodeDecodeError:
+        print(f'오류: {args.log} 파일 디코딩 중 문제가 발생했습니다.')
+    except Exception as e:
+        print(f'예상치 못한 오류가 발생했습니다: {e}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,245 @@
+# log_index.py
+# 목적: 로그 파일 옆에 '시간 → 바이트 위치' 색인 파일을 만들어 두고,
+#       특정 시간 구간(예: 11:30 ~ 12:00)의 로그만 빠르게 꺼내 보는 프로그램.
+#
+# [동작 방식]
+# - 색인은 희소(sparse) 색인: 모든 줄이 아니라 약 block_size 바이트마다 한 줄씩만 기록
+# - 색인 항목(시간, 바이트 위치)은 NumPy 바이너리 파일(.idx.npy)에,
+#   로그 크기/수정 시각 같은 정보는 작은 JSON 파일(.idx.json)에 따로 저장
+# - 조회 시 .idx.npy를 mmap으로 열어(np.load(mmap_mode='r')) 전체를 읽지 않고
+#   np.searchsorted(이진 탐색)로 시작 위치를 찾고, 로그도 mmap으로 그 구간의 바이트만 읽음
+# - 로그 파일의 크기나 수정 시각이 바뀌면 색인을 자동으로 다시 만듦
+
+import argparse
+import json
+import mmap
+import os
+
+import numpy as np
+
+from main import parse_log_line
+
+# 색인 항목 사이의 간격 (바이트)
+DEFAULT_BLOCK_SIZE = 4096
+
+# 색인 파일 형식 버전 (형식이 바뀌면 기존 색인을 다시 만들기 위함)
+INDEX_VERSION = 2
+
+
+def default_index_path(log_filename):
+    """
+    로그 파일 옆에 둘 색인 파일 경로(확장자 제외)를 돌려주는 함수
+    (예: xxx.log → xxx.log.idx → 실제 파일은 xxx.log.idx.npy / xxx.log.idx.json)
+    """
+    return log_filename + '.idx'
+
+
+def _entries_path(index_filename):
+    return index_filename + '.npy'
+
+
+def _meta_path(index_filename):
+    return index_filename + '.json'
+
+
+def _entries_dtype(width):
+    # 시간 문자열은 고정 길이 바이트로 저장 (정렬 순서가 문자열 비교와 같음)
+    return np.dtype([('timestamp', f'S{max(width, 1)}'), ('offset', '<i8')])
+
+
+def _write_atomic(filename, write):
+    """임시 파일에 쓰고 os.replace()로 바꿔치기하는 함수 (중간에 종료되어도 파일이 깨지지 않음)"""
+    temp_filename = filename + '.tmp'
+    with open(temp_filename, 'wb') as file:
+        write(file)
+    os.replace(temp_filename, filename)
+
+
+def build_index(log_filename, index_filename=None, block_size=DEFAULT_BLOCK_SIZE):
+    """
+    로그 파일을 한 번 훑어서 희소 색인을 만들고 파일로 저장하는 함수
+
+    Parameters:
+    - log_filename (str): 로그 파일 경로
+    - index_filename (str): 색인 파일 경로 (None이면 로그 파일 옆에 .idx.npy / .idx.json)
+    - block_size (int): 색인 항목 사이의 최소 간격 (바이트)
+
+    Returns:
+    - dict: 색인 내용
+      timestamps/offsets: 같은 위치끼리 짝을 이루는 (시간, 줄 시작 바이트) 배열
+      (timestamps는 bytes 배열, 예: b'2023-08-27 11:30:00')
+      data_offset: 헤더 다음 첫 데이터 줄의 바이트 위치
+      sorted: 로그가 시간 오름차순인지 여부 (아니면 조회 시 전체를 훑음)
+    """
+    if index_filename is None:
+        index_filename = default_index_path(log_filename)
+
+    stat = os.stat(log_filename)
+    timestamps = []
+    offsets = []
+    is_sorted = True
+    last_timestamp = None
+    next_mark = 0
+
+    # 바이너리 모드로 읽어야 줄마다 정확한 바이트 위치를 알 수 있음
+    with open(log_filename, 'rb') as file:
+        header = file.readline()
+        offset = len(header)
+        data_offset = offset
+
+        for raw_line in file:
+            record = parse_log_line(raw_line.decode('utf-8'))
+            if record is not None:
+                timestamp = record[0]
+                if last_timestamp is not None and timestamp < last_timestamp:
+                    is_sorted = False
+                last_timestamp = timestamp
+
+                # block_size 바이트를 넘어설 때마다 한 줄씩만 색인에 기록
+                if offset >= next_mark:
+                    timestamps.append(timestamp.encode('utf-8'))
+                    offsets.append(offset)
+                    next_mark = offset + block_size
+            offset += len(raw_line)
+
+    entries = np.empty(len(offsets),
+                       dtype=_entries_dtype(max(map(len, timestamps), default=1)))
+    entries['timestamp'] = timestamps
+    entries['offset'] = offsets
+
+    meta = {
+        'version': INDEX_VERSION,
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'block_size': block_size,
+        'data_offset': data_offset,
+        'sorted': is_sorted,
+        'count': len(entries)
+    }
+
+    # 항목 파일을 먼저 바꾸고 정보 파일을 나중에 바꿈
+    # (중간에 종료되면 정보 파일이 옛 로그 기준으로 남아 다음 조회 때 다시 만들어짐)
+    _write_atomic(_entries_path(index_filename), lambda file: np.save(file, entries))
+    _write_atomic(_meta_path(index_filename),
+                  lambda file: file.write(json.dumps(meta).encode('utf-8')))
+
+    return dict(meta, timestamps=entries['timestamp'], offsets=entries['offset'])
+
+
+def load_index(log_filename, index_filename=None, block_size=DEFAULT_BLOCK_SIZE):
+    """
+    색인 파일을 읽어오는 함수
+    색인이 없거나, 로그 파일의 크기/수정 시각이 색인과 다르면 새로 만듦
+
+    - 색인 항목은 mmap으로 열기 때문에 실제로 읽히는 것은 이진 탐색이 건드리는 부분뿐
+    """
+    if index_filename is None:
+        index_filename = default_index_path(log_filename)
+
+    stat = os.stat(log_filename)
+    try:
+        with open(_meta_path(index_filename), 'r', encoding='utf-8') as meta_file:
+            meta = json.load(meta_file)
+    except (FileNotFoundError, ValueError):
+        # 색인 파일이 없거나 깨진 경우
+        return build_index(log_filename, index_filename, block_size)
+
+    if (meta.get('version') != INDEX_VERSION
+            or meta.get('size') != stat.st_size
+            or meta.get('mtime_ns') != stat.st_mtime_ns
+            or meta.get('block_size') != block_size):
+        return build_index(log_filename, index_filename, block_size)
+
+    try:
+        # 항목이 없는 배열은 mmap으로 열 수 없으므로 그냥 읽음
+        mmap_mode = 'r' if meta.get('count') else None
+        entries = np.load(_entries_path(index_filename), mmap_mode=mmap_mode,
+                          allow_pickle=False)
+    except (OSError, ValueError):
+        return build_index(log_filename, index_filename, block_size)
+    if len(entries) != meta.get('count') or entries.dtype.names != ('timestamp', 'offset'):
+        # 항목 파일과 정보 파일이 서로 맞지 않는 경우
+        return build_index(log_filename, index_filename, block_size)
+
+    return dict(meta, timestamps=entries['timestamp'], offsets=entries['offset'])
+
+
+def iter_range(log_filename, start, end, index_filename=None,
+               block_size=DEFAULT_BLOCK_SIZE):
+    """
+    start <= 시간 <= end 인 로그만 하나씩 돌려주는 제너레이터
+
+    Parameters:
+    - log_filename (str): 로그 파일 경로
+    - start (str): 시작 시간 (예: '2023-08-27 11:30:00'), None이면 처음부터
+    - end (str): 끝 시간 (예: '2023-08-27 12:00:00'), None이면 끝까지
+
+    Yields:
+    - tuple: (timestamp, event, message)
+    """
+    index = load_index(log_filename, index_filename, block_size)
+
+    # 빈 파일은 mmap을 만들 수 없으므로 바로 종료
+    if index['size'] == 0:
+        return
+
+    timestamps = index['timestamps']
+    offsets = index['offsets']
+    is_sorted = index['sorted']
+
+    # 시작 위치 찾기: start보다 작은 마지막 색인 항목부터 읽기 시작
+    position = index['data_offset']
+    if is_sorted and start is not None and len(timestamps):
+        block = int(np.searchsorted(timestamps, start.encode('utf-8'), side='left')) - 1
+        if block >= 0:
+            position = int(offsets[block])
+
+    with open(log_filename, 'rb') as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = len(mm)
+            while position < size:
+                # 다음 줄바꿈 위치를 찾아 한 줄만 잘라냄
+                newline = mm.find(b'\n', position)
+                if newline == -1:
+                    newline = size
+                record = parse_log_line(mm[position:newline].decode('utf-8'))
+                position = newline + 1
+
+                if record is None:
+                    continue
+                timestamp = record[0]
+                if start is not None and timestamp < start:
+                    continue
+                if end is not None and timestamp > end:
+                    # 정렬된 로그라면 이후 줄은 모두 구간 밖이므로 읽기를 멈춤
+                    if is_sorted:
+                        break
+                    continue
+                yield record
+
+
+def query_range(log_filename, start, end, index_filename=None,
+                block_size=DEFAULT_BLOCK_SIZE):
+    """iter_range()의 결과를 리스트로 돌려주는 함수"""
+    return list(iter_range(log_filename, start, end, index_filename, block_size))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='시간 구간으로 미션 로그 조회')
+    parser.add_argument('--log', default='mission_computer_main.log',
+                        help='로그 파일 경로')
+    parser.add_argument('--start', help="시작 시간 (예: '2023-08-27 11:30:00')")
+    parser.add_argument('--end', help="끝 시간 (예: '2023-08-27 12:00:00')")
+    args = parser.parse_args(argv)
+
+    try:
+        for timestamp, event, message in iter_range(args.log, args.start, args.end):
+            print(f'{timestamp},{event},{message}')
+    except FileNotFoundError:
+        print(f'오류: {args.log} 파일을 찾을 수 없습니다.')
+    except Exception as e:
+        print(f'예상치 못한 오류가 발생했습니다: {e}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,245 @@
+# log_search.py
+# 목적: 로그 메시지의 단어와 이벤트 종류(INFO/WARNING/ERROR ...)로 로그를 빠르게 찾는 프로그램.
+#
+# [역색인(inverted index)이란?]
+# - '단어 → 그 단어가 들어 있는 줄의 바이트 위치 목록(posting list)' 형태의 색인
+# - 'oxygen'을 찾을 때 전체 로그를 훑지 않고 색인에서 바로 위치 목록을 꺼냄
+#
+# [저장 방식]
+# - 파이썬 내장 sqlite3 데이터베이스 파일(로그 파일명 + .search.db)에 저장
+# - postings 테이블은 (term, offset)을 기본 키로 하여 단어별 위치가 정렬된 상태로 저장됨
+# - 마지막으로 색인한 바이트 위치를 함께 저장해 두고, 로그가 늘어나면 새 줄만 추가로 색인
+# - 로그가 잘리거나 회전(inode 변경)되거나 색인 버전이 다르면 위치 정보가 맞지 않으므로 처음부터 다시 색인
+
+import argparse
+import os
+import re
+import sqlite3
+
+from main import parse_log_line
+from log_follow import read_fingerprint
+
+# 메시지에서 단어를 뽑아내는 정규식 (한글 등을 포함한 유니코드 문자/숫자 묶음)
+TOKEN_PATTERN = re.compile(r'\w+')
+
+# 단어를 나누는 방식이 바뀌면 올려서 이전 색인을 처음부터 다시 만들게 함
+INDEX_VERSION = 2
+
+# 이벤트 종류는 일반 단어와 섞이지 않도록 앞에 붙이는 접두어
+LEVEL_PREFIX = 'level:'
+
+# 한 번에 데이터베이스에 넣을 posting 수 (메모리 사용량 제한)
+BATCH_SIZE = 50000
+
+
+def tokenize(text):
+    """문자열을 소문자 단어 목록으로 나누는 함수 (중복 제거)"""
+    return set(TOKEN_PATTERN.findall(text.lower()))
+
+
+def level_term(level):
+    """이벤트 종류를 색인용 단어로 바꾸는 함수 (예: 'ERROR' → 'level:error')"""
+    return LEVEL_PREFIX + level.strip().lower()
+
+
+def default_index_path(log_filename):
+    """로그 파일 옆에 둘 색인 데이터베이스 경로"""
+    return log_filename + '.search.db'
+
+
+def open_index(index_filename):
+    """색인 데이터베이스를 열고, 테이블이 없으면 만드는 함수"""
+    connection = sqlite3.connect(index_filename)
+    connection.execute(
+        'CREATE TABLE IF NOT EXISTS postings ('
+        ' term TEXT NOT NULL,'
+        ' offset INTEGER NOT NULL,'
+        ' PRIMARY KEY (term, offset)'
+        ') WITHOUT ROWID'
+    )
+    connection.execute(
+        'CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value)'
+    )
+    return connection
+
+
+def _load_meta(connection):
+    return dict(connection.execute('SELECT key, value FROM meta'))
+
+
+def update_index(log_filename, index_filename=None):
+    """
+    로그 파일에서 아직 색인하지 않은 줄만 읽어 색인에 추가하는 함수
+
+    Returns:
+    - int: 이번에 새로 색인한 줄 수
+    """
+    if index_filename is None:
+        index_filename = default_index_path(log_filename)
+
+    stat = os.stat(log_filename)
+    connection = open_index(index_filename)
+    count = 0
+
+    try:
+        meta = _load_meta(connection)
+        offset = meta.get('offset', 0)
+
+        # 같은 파일이고 이미 색인한 부분이 그대로인지 확인
+        same_file = (meta.get('version') == INDEX_VERSION
+                     and meta.get('inode') == stat.st_ino
+                     and meta.get('device') == stat.st_dev
+                     and stat.st_size >= offset
+                     and read_fingerprint(log_filename, offset) == meta.get('fingerprint'))
+        if not same_file:
+            connection.execute('DELETE FROM postings')
+            offset = 0
+
+        batch = []
+        with open(log_filename, 'rb') as file:
+            file.seek(offset)
+            if offset == 0:
+                # 헤더 줄 건너뛰기
+                header = file.readline()
+                offset = len(header) if header.endswith(b'\n') else 0
+
+            if offset:
+                for raw_line in file:
+                    # 줄바꿈으로 끝나지 않은 마지막 줄은 아직 쓰는 중일 수 있으므로 다음 차례에 처리
+                    if not raw_line.endswith(b'\n'):
+                        break
+                    record = parse_log_line(raw_line.decode('utf-8'))
+                    if record is not None:
+                        _, event, message = record
+                        batch.append((level_term(event), offset))
+                        batch.extend((term, offset) for term in tokenize(message))
+                        count += 1
+                        if len(batch) >= BATCH_SIZE:
+                            connection.executemany(
+                                'INSERT OR IGNORE INTO postings VALUES (?, ?)', batch)
+                            batch = []
+                    offset += len(raw_line)
+
+        if batch:
+            connection.executemany('INSERT OR IGNORE INTO postings VALUES (?, ?)', batch)
+
+        connection.executemany('INSERT OR REPLACE INTO meta VALUES (?, ?)', [
+            ('version', INDEX_VERSION),
+            ('inode', stat.st_ino),
+            ('device', stat.st_dev),
+            ('offset', offset),
+            ('fingerprint', read_fingerprint(log_filename, offset))
+        ])
+        connection.commit()
+    finally:
+        connection.close()
+
+    return count
+
+
+def _term_query(terms):
+    """단어 목록을 'term IN (...)' 조건의 SQL 조각과 인자로 만드는 함수"""
+    placeholders = ', '.join('?' for _ in terms)
+    return f'SELECT offset FROM postings WHERE term IN ({placeholders})', list(terms)
+
+
+def search_offsets(index_filename, all_words=(), any_words=(), levels=()):
+    """
+    조건에 맞는 로그 줄의 바이트 위치 목록을 돌려주는 함수
+
+    Parameters:
+    - all_words: 모두 들어 있어야 하는 단어들 (AND)
+    - any_words: 하나 이상 들어 있어야 하는 단어들 (OR)
+    - levels: 이벤트 종류 중 하나와 일치해야 함 (OR)
+    - 세 조건은 서로 AND로 묶임
+
+    Returns:
+    - list: 파일 순서대로 정렬된 바이트 위치
+    """
+    parts = []
+    params = []
+
+    # 구문을 여러 단어로 넣어도 되도록 단어로 다시 나눔 (예: 'Oxygen tank' → oxygen, tank)
+    all_tokens = [tokenize(word) for word in all_words]
+    any_tokens = [tokenize(word) for word in any_words]
+    # 단어로 나눠지지 않는 검색어(예: '!!!')는 어떤 줄과도 일치할 수 없음
+    # → 조건을 빼 버리면 다른 조건만으로 검색되므로, 결과가 없는 것으로 처리
+    if not all(all_tokens) or (any_tokens and not any(any_tokens)):
+        return []
+
+    for word in set().union(*all_tokens):
+        sql, args = _term_query([word])
+        parts.append(sql)
+        params.extend(args)
+
+    any_terms = set().union(*any_tokens)
+    if any_terms:
+        sql, args = _term_query(sorted(any_terms))
+        parts.append(sql)
+        params.extend(args)
+
+    if levels:
+        sql, args = _term_query(sorted(level_term(level) for level in levels))
+        parts.append(sql)
+        params.extend(args)
+
+    if not parts:
+        return []
+
+    connection = open_index(index_filename)
+    try:
+        # INTERSECT: 모든 조건을 만족하는 위치만 남김
+        query = ' INTERSECT '.join(parts) + ' ORDER BY offset'
+        return [row[0] for row in connection.execute(query, params)]
+    finally:
+        connection.close()
+
+
+def search(log_filename, all_words=(), any_words=(), levels=(), index_filename=None,
+           update=True):
+    """
+    조건에 맞는 로그를 (timestamp, event, message) 목록으로 돌려주는 함수
+
+    update가 True면 검색 전에 새로 늘어난 로그를 먼저 색인함
+    """
+    if index_filename is None:
+        index_filename = default_index_path(log_filename)
+    if update:
+        update_index(log_filename, index_filename)
+
+    offsets = search_offsets(index_filename, all_words, any_words, levels)
+
+    results = []
+    with open(log_filename, 'rb') as file:
+        for offset in offsets:
+            file.seek(offset)
+            record = parse_log_line(file.readline().decode('utf-8'))
+            if record is not None:
+                results.append(record)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='단어와 이벤트 종류로 미션 로그 검색')
+    parser.add_argument('words', nargs='*', help='모두 포함해야 하는 단어 (AND)')
+    parser.add_argument('--any', nargs='+', default=[], dest='any_words',
+                        help='하나 이상 포함해야 하는 단어 (OR)')
+    parser.add_argument('--level', action='append', default=[],
+                        help='이벤트 종류 (여러 번 지정 가능, 예: --level WARNING --level ERROR)')
+    parser.add_argument('--log', default='mission_computer_main.log',
+                        help='로그 파일 경로')
+    args = parser.parse_args(argv)
+
+    try:
+        results = search(args.log, args.words, args.any_words, args.level)
+        for timestamp, event, message in results:
+            print(f'{timestamp},{event},{message}')
+        print(f'\n검색 결과: {len(results)}건')
+    except FileNotFoundError:
+        print(f'오류: {args.log} 파일을 찾을 수 없습니다.')
+    except Exception as e:
+        print(f'예상치 못한 오류가 발생했습니다: {e}')
+
+
+if __name__ == '__main__':
+    main()
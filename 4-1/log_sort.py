@@ -0,0 +1,232 @@
+# log_sort.py
+# 목적: 메모리보다 큰 여러 개의 로그 파일(mission_computer_main*.log)을
+#       시간순으로 합쳐 하나의 JSON 파일로 저장하는 프로그램 (외부 정렬).
+#
+# [동작 방식]
+# 1. 각 파일이 이미 시간 오름차순/내림차순인지 한 번 훑어서 확인
+#    - 이미 정렬된 파일은 정렬하지 않고 그대로 하나의 '런(run)'으로 사용 (O(n))
+#    - 오름차순 파일은 필요하면 파일 끝에서부터 거꾸로 읽음
+# 2. 정렬되지 않은 파일은 run_size 줄씩 메모리에서 정렬해 임시 파일(런)로 저장
+# 3. 모든 런을 heapq.merge(힙)로 k-way 병합하며 결과를 바로 JSON에 기록
+
+import argparse
+import glob
+import heapq
+import os
+import tempfile
+
+from main import parse_log_line, write_json_stream
+
+# 정렬되지 않은 입력을 메모리에서 한 번에 정렬할 최대 줄 수
+DEFAULT_RUN_SIZE = 1000000
+
+# 한 번에 병합할 최대 런 수 (동시에 열어 둘 파일 수 제한)
+DEFAULT_FAN_IN = 64
+
+# 거꾸로 읽을 때 한 번에 읽는 바이트 수
+READ_BLOCK_SIZE = 1 << 16
+
+ASCENDING = 'asc'
+DESCENDING = 'desc'
+
+
+def _record_key(record):
+    """정렬 기준: 날짜시간 문자열"""
+    return record[0]
+
+
+def iter_file_records(filename):
+    """헤더를 제외한 로그 레코드를 파일 순서대로 돌려주는 제너레이터"""
+    with open(filename, 'r', encoding='utf-8') as file:
+        file.readline()
+        for line in file:
+            record = parse_log_line(line)
+            if record is not None:
+                yield record
+
+
+def iter_file_records_reversed(filename):
+    """
+    로그 레코드를 파일의 끝에서부터 거꾸로 돌려주는 제너레이터
+    파일 전체를 읽어 뒤집지 않고, 끝에서부터 블록 단위로 읽으므로 메모리 사용량이 일정함
+    """
+    with open(filename, 'rb') as file:
+        data_start = len(file.readline())
+        position = os.path.getsize(filename)
+        carry = b''
+
+        while position > data_start:
+            block_start = max(data_start, position - READ_BLOCK_SIZE)
+            file.seek(block_start)
+            block = file.read(position - block_start) + carry
+            position = block_start
+
+            lines = block.split(b'\n')
+            # 맨 앞 조각은 앞 블록과 이어지는 줄일 수 있으므로 다음 차례로 넘김
+            carry = lines[0]
+            for raw_line in reversed(lines[1:]):
+                record = parse_log_line(raw_line.decode('utf-8'))
+                if record is not None:
+                    yield record
+
+        record = parse_log_line(carry.decode('utf-8'))
+        if record is not None:
+            yield record
+
+
+def detect_order(filename):
+    """
+    로그 파일이 이미 정렬되어 있는지 한 번 훑어서 확인하는 함수
+
+    Returns:
+    - 'asc': 시간 오름차순 (모든 값이 같거나 비어 있는 경우 포함)
+    - 'desc': 시간 내림차순
+    - None: 정렬되어 있지 않음
+    """
+    ascending = True
+    descending = True
+    previous = None
+
+    for record in iter_file_records(filename):
+        timestamp = record[0]
+        if previous is not None:
+            if timestamp < previous:
+                ascending = False
+            elif timestamp > previous:
+                descending = False
+            if not ascending and not descending:
+                return None
+        previous = timestamp
+
+    return ASCENDING if ascending else DESCENDING
+
+
+def _write_run(records, temp_dir):
+    """정렬된 레코드들을 로그 형식 그대로 임시 파일에 저장하고 경로를 돌려주는 함수"""
+    fd, path = tempfile.mkstemp(suffix='.run', dir=temp_dir)
+    with os.fdopen(fd, 'w', encoding='utf-8') as run_file:
+        # iter_file_records()로 다시 읽을 수 있도록 헤더를 함께 기록
+        run_file.write('timestamp,event,message\n')
+        for timestamp, event, message in records:
+            run_file.write(f'{timestamp},{event},{message}\n')
+    return path
+
+
+def _spill_runs(filename, descending, run_size, temp_dir):
+    """정렬되지 않은 파일을 run_size 줄씩 정렬해 런 파일들로 저장하는 함수"""
+    runs = []
+    batch = []
+    for record in iter_file_records(filename):
+        batch.append(record)
+        if len(batch) >= run_size:
+            batch.sort(key=_record_key, reverse=descending)
+            runs.append(_write_run(batch, temp_dir))
+            batch = []
+    if batch:
+        batch.sort(key=_record_key, reverse=descending)
+        runs.append(_write_run(batch, temp_dir))
+    return runs
+
+
+def _merge_runs(sources, descending):
+    """
+    정렬된 레코드 묶음들을 힙으로 병합하는 제너레이터
+    sources: (파일 경로, 거꾸로 읽을지 여부) 목록
+    """
+    iterators = []
+    for path, reverse in sources:
+        if reverse:
+            iterators.append(iter_file_records_reversed(path))
+        else:
+            iterators.append(iter_file_records(path))
+    return heapq.merge(*iterators, key=_record_key, reverse=descending)
+
+
+def iter_sorted_records(filenames, descending=True, run_size=DEFAULT_RUN_SIZE,
+                        fan_in=DEFAULT_FAN_IN, temp_dir=None):
+    """
+    여러 로그 파일의 레코드를 시간순으로 합쳐서 돌려주는 제너레이터
+
+    Parameters:
+    - filenames (list): 입력 로그 파일 경로들
+    - descending (bool): True면 최신 시간이 먼저 (main.py와 같은 순서)
+    - run_size (int): 정렬되지 않은 파일을 한 번에 정렬할 최대 줄 수
+    - fan_in (int): 한 번에 병합할 최대 런 수
+    - temp_dir (str): 런 파일을 저장할 디렉터리 (None이면 시스템 기본 위치)
+
+    Yields:
+    - tuple: (timestamp, event, message)
+    """
+    wanted = DESCENDING if descending else ASCENDING
+
+    with tempfile.TemporaryDirectory(dir=temp_dir) as work_dir:
+        # (경로, 거꾸로 읽을지 여부) 목록
+        sources = []
+        for filename in filenames:
+            order = detect_order(filename)
+            if order is None:
+                sources.extend((path, False) for path in
+                               _spill_runs(filename, descending, run_size, work_dir))
+            else:
+                # 이미 정렬된 파일: 방향만 맞춰서 그대로 사용
+                sources.append((filename, order != wanted))
+
+        # 런이 너무 많으면 fan_in개씩 먼저 병합해 런 수를 줄임
+        while len(sources) > fan_in:
+            merged = []
+            for i in range(0, len(sources), fan_in):
+                group = sources[i:i + fan_in]
+                merged.append((_write_run(_merge_runs(group, descending), work_dir), False))
+            sources = merged
+
+        yield from _merge_runs(sources, descending)
+
+
+def external_sort(filenames, json_filename, descending=True,
+                  run_size=DEFAULT_RUN_SIZE, fan_in=DEFAULT_FAN_IN, temp_dir=None):
+    """
+    여러 로그 파일을 시간순으로 합쳐 JSON 파일로 저장하는 함수
+
+    Returns:
+    - int: 기록한 항목 수
+    """
+    records = iter_sorted_records(filenames, descending, run_size, fan_in, temp_dir)
+    return write_json_stream(records, json_filename)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='여러 미션 로그 파일을 시간순으로 병합')
+    parser.add_argument('files', nargs='*',
+                        help='입력 로그 파일 (기본값: mission_computer_main*.log)')
+    parser.add_argument('--output', default='mission_computer_main.json',
+                        help='저장할 JSON 파일 경로')
+    parser.add_argument('--ascending', action='store_true',
+                        help='오래된 시간이 먼저 오도록 정렬 (기본값: 최신 시간이 먼저)')
+    parser.add_argument('--run-size', type=int, default=DEFAULT_RUN_SIZE,
+                        help='메모리에서 한 번에 정렬할 최대 줄 수')
+    parser.add_argument('--temp-dir', help='임시 런 파일을 저장할 디렉터리')
+    args = parser.parse_args(argv)
+
+    filenames = args.files or sorted(glob.glob('mission_computer_main*.log'))
+    if not filenames:
+        print('오류: 입력 로그 파일이 없습니다.')
+        return
+
+    try:
+        count = external_sort(filenames, args.output,
+                              descending=not args.ascending,
+                              run_size=args.run_size,
+                              temp_dir=args.temp_dir)
+        print('=== 로그 병합 완료 ===')
+        print(f'입력 파일 수: {len(filenames)}, 항목 수: {count}')
+        print(f'파일명: {args.output}')
+    except FileNotFoundError as e:
+        print(f'오류: {e.filename} 파일을 찾을 수 없습니다.')
+    except UnicodeDecodeError:
+        print('오류: 로그 파일 디코딩 중 문제가 발생했습니다.')
+    except Exception as e:
+        print(f'예상치 못한 오류가 발생했습니다: {e}')
+
+
+if __name__ == '__main__':
+    main()
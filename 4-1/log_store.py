@@ -0,0 +1,254 @@
+# log_store.py
+# 목적: 파싱한 로그를 열(column) 단위 NumPy 배열로 보관해서
+#       수천만 줄의 로그도 적은 메모리로 정렬/구간 필터링/JSON 저장을 할 수 있게 하는 모듈.
+#
+# [main.py 방식과의 차이]
+# - main.py: [날짜시간 문자열, 메시지 문자열] 리스트를 한 줄마다 하나씩 만듦 (줄당 200바이트 이상)
+# - log_store.py:
+#   timestamps  → int64 배열 (1970-01-01 기준 초, 문자열 비교 대신 정수 비교로 정렬)
+#   levels      → int8 배열 (INFO/WARNING/ERROR ... 를 작은 정수 코드로 저장)
+#   messages    → 모든 메시지를 이어 붙인 하나의 bytes + 각 메시지의 시작 위치(int64 배열)
+#   줄당 약 17바이트 + 메시지 길이만 사용
+
+import argparse
+import json
+from array import array
+
+import numpy as np
+
+from main import parse_log_line
+
+# 한 번에 날짜시간 문자열을 배열로 변환할 줄 수
+PARSE_BATCH_SIZE = 100000
+
+# 날짜시간을 해석할 수 없을 때 사용하는 값 (정렬 시 가장 앞에 옴)
+MISSING_TIMESTAMP = np.iinfo(np.int64).min
+
+
+def parse_timestamps(strings):
+    """
+    'YYYY-MM-DD HH:MM:SS' 문자열 목록을 int64(초) 배열로 한 번에 변환하는 함수
+    해석할 수 없는 값은 MISSING_TIMESTAMP로 채움
+    """
+    try:
+        return np.array(strings, dtype='datetime64[s]').astype(np.int64)
+    except ValueError:
+        # 잘못된 값이 섞여 있으면 하나씩 변환
+        result = np.empty(len(strings), dtype=np.int64)
+        for i, text in enumerate(strings):
+            try:
+                result[i] = np.datetime64(text, 's').astype(np.int64)
+            except ValueError:
+                result[i] = MISSING_TIMESTAMP
+        return result
+
+
+def format_timestamps(seconds):
+    """int64(초) 배열을 'YYYY-MM-DD HH:MM:SS' 문자열 배열로 되돌리는 함수"""
+    text = np.datetime_as_string(seconds.astype('datetime64[s]'))
+    if len(text) == 0:
+        return text
+    # 해석할 수 없었던 값('NaT')은 그대로 두고 날짜와 시간 사이의 'T'만 공백으로 바꿈
+    return np.where(text == 'NaT', text, np.char.replace(text, 'T', ' '))
+
+
+class LogStore:
+    """
+    열 단위로 저장된 로그 레코드 묶음
+
+    정렬이나 필터링을 하면 데이터를 복사하지 않고,
+    같은 열 배열을 공유하면서 '어떤 줄을 어떤 순서로 볼지'를 나타내는
+    index 배열만 새로 만든 LogStore를 돌려줌
+    """
+
+    def __init__(self, timestamps, levels, level_names, message_offsets, message_buffer,
+                 index=None):
+        self.timestamps_all = timestamps          # int64, 줄 번호 순서
+        self.levels_all = levels                  # int8, level_names의 위치
+        self.level_names = level_names            # 코드 → 이벤트 이름 목록
+        self.message_offsets = message_offsets    # int64, 길이 n + 1
+        self.message_buffer = message_buffer      # 모든 메시지를 이어 붙인 UTF-8 bytes
+        if index is None:
+            index = np.arange(len(timestamps), dtype=np.intp)
+        self.index = index
+
+    @classmethod
+    def from_records(cls, records):
+        """
+        (timestamp, event, message) 레코드들로 LogStore를 만드는 함수
+        레코드를 리스트에 모아 두지 않고 배열에 바로 이어 붙임
+        """
+        timestamp_parts = []
+        pending = []
+        levels = array('b')
+        level_codes = {}
+        offsets = array('q', [0])
+        buffer = bytearray()
+
+        for timestamp, event, message in records:
+            pending.append(timestamp)
+            if len(pending) >= PARSE_BATCH_SIZE:
+                timestamp_parts.append(parse_timestamps(pending))
+                pending = []
+
+            code = level_codes.get(event)
+            if code is None:
+                code = level_codes[event] = len(level_codes)
+            levels.append(code)
+
+            buffer += message.encode('utf-8')
+            offsets.append(len(buffer))
+
+        if pending:
+            timestamp_parts.append(parse_timestamps(pending))
+
+        if timestamp_parts:
+            timestamps = np.concatenate(timestamp_parts)
+        else:
+            timestamps = np.empty(0, dtype=np.int64)
+
+        return cls(timestamps,
+                   np.frombuffer(levels, dtype=np.int8).copy(),
+                   list(level_codes),
+                   np.frombuffer(offsets, dtype=np.int64).copy(),
+                   bytes(buffer))
+
+    @classmethod
+    def from_file(cls, filename):
+        """로그 파일을 한 줄씩 읽어 LogStore를 만드는 함수"""
+        def records():
+            with open(filename, 'r', encoding='utf-8') as file:
+                file.readline()   # 헤더 건너뛰기
+                for line in file:
+                    record = parse_log_line(line)
+                    if record is not None:
+                        yield record
+        return cls.from_records(records())
+
+    def _select(self, index):
+        """같은 열 배열을 공유하고 index만 다른 LogStore를 만드는 함수"""
+        return LogStore(self.timestamps_all, self.levels_all, self.level_names,
+                        self.message_offsets, self.message_buffer, index)
+
+    def __len__(self):
+        return len(self.index)
+
+    @property
+    def timestamps(self):
+        """현재 순서대로의 int64(초) 배열"""
+        return self.timestamps_all[self.index]
+
+    @property
+    def levels(self):
+        """현재 순서대로의 이벤트 코드 배열"""
+        return self.levels_all[self.index]
+
+    def message(self, position):
+        """현재 순서에서 position번째 레코드의 메시지"""
+        row = self.index[position]
+        start, end = self.message_offsets[row], self.message_offsets[row + 1]
+        return self.message_buffer[start:end].decode('utf-8')
+
+    def iter_records(self):
+        """(timestamp 문자열, event, message) 레코드를 현재 순서대로 돌려주는 제너레이터"""
+        names = self.level_names
+        for position, (text, code) in enumerate(zip(format_timestamps(self.timestamps),
+                                                     self.levels)):
+            yield str(text), names[code], self.message(position)
+
+    def sorted(self, descending=True):
+        """
+        시간순으로 정렬된 LogStore를 돌려주는 함수
+
+        kind='stable': 같은 시간끼리는 원래 순서를 유지 (main.py의 sorted()와 같은 결과)
+        """
+        keys = self.timestamps
+        if descending:
+            # 내림차순 안정 정렬: 부호를 바꿔서 오름차순으로 정렬
+            # (MISSING_TIMESTAMP는 부호를 바꿀 수 없으므로 최솟값보다 1 큰 값으로 취급)
+            keys = -np.maximum(keys, MISSING_TIMESTAMP + 1)
+        order = np.argsort(keys, kind='stable')
+        return self._select(self.index[order])
+
+    def between(self, start=None, end=None):
+        """
+        start <= 시간 <= end 인 레코드만 남긴 LogStore를 돌려주는 함수
+        start/end는 'YYYY-MM-DD HH:MM:SS' 문자열, None이면 해당 방향으로 제한 없음
+        """
+        keys = self.timestamps
+        mask = np.ones(len(keys), dtype=bool)
+        if start is not None:
+            mask &= keys >= parse_timestamps([start])[0]
+        if end is not None:
+            mask &= keys <= parse_timestamps([end])[0]
+        return self._select(self.index[mask])
+
+    def with_levels(self, *names):
+        """지정한 이벤트 종류의 레코드만 남긴 LogStore를 돌려주는 함수"""
+        codes = [code for code, name in enumerate(self.level_names) if name in names]
+        mask = np.isin(self.levels, codes)
+        return self._select(self.index[mask])
+
+    def to_json(self, json_filename):
+        """
+        {날짜시간: 메시지} 형태의 JSON 파일로 저장하는 함수
+
+        main.py의 딕셔너리 컴프리헨션과 같은 결과를 내도록
+        같은 시간이 여러 번 나오면 첫 위치에 마지막 메시지를 기록함
+
+        Returns:
+        - int: 기록한 항목 수
+        """
+        keys = self.timestamps
+        if len(keys):
+            # 같은 시간 묶음의 시작 위치와 마지막 위치
+            boundaries = np.flatnonzero(keys[1:] != keys[:-1]) + 1
+            firsts = np.concatenate(([0], boundaries))
+            lasts = np.concatenate((boundaries - 1, [len(keys) - 1]))
+        else:
+            firsts = lasts = np.empty(0, dtype=np.intp)
+        texts = format_timestamps(keys[firsts])
+
+        with open(json_filename, 'w', encoding='utf-8') as json_file:
+            json_file.write('{')
+            for count, (text, last) in enumerate(zip(texts, lasts)):
+                json_file.write(',\n  ' if count else '\n  ')
+                json_file.write(json.dumps(str(text), ensure_ascii=False))
+                json_file.write(': ')
+                json_file.write(json.dumps(self.message(last), ensure_ascii=False))
+            json_file.write('\n}' if len(texts) else '}')
+
+        return len(texts)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='열 단위 저장소로 미션 로그 정렬/필터링')
+    parser.add_argument('--log', default='mission_computer_main.log', help='로그 파일 경로')
+    parser.add_argument('--output', default='mission_computer_main.json',
+                        help='저장할 JSON 파일 경로')
+    parser.add_argument('--start', help="시작 시간 (예: '2023-08-27 11:30:00')")
+    parser.add_argument('--end', help="끝 시간 (예: '2023-08-27 12:00:00')")
+    parser.add_argument('--level', action='append', default=[],
+                        help='남길 이벤트 종류 (여러 번 지정 가능)')
+    args = parser.parse_args(argv)
+
+    try:
+        store = LogStore.from_file(args.log)
+        if args.start or args.end:
+            store = store.between(args.start, args.end)
+        if args.level:
+            store = store.with_levels(*args.level)
+        count = store.sorted(descending=True).to_json(args.output)
+
+        print('=== JSON 파일 저장 완료 ===')
+        print(f'파일명: {args.output}, 항목 수: {count}')
+    except FileNotFoundError:
+        print(f'오류: {args.log} 파일을 찾을 수 없습니다.')
+    except UnicodeDecodeError:
+        print(f'오류: {args.log} 파일 디코딩 중 문제가 발생했습니다.')
+    except Exception as e:
+        print(f'예상치 못한 오류가 발생했습니다: {e}')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,51 +1,312 @@
 # json 모듈을 가져옵니다 (파이썬 내장 모듈)
 import json
+# argparse 모듈: 명령줄 옵션(--stream 등)을 처리하는 내장 모듈
+import argparse
+# multiprocessing 모듈: 여러 프로세스(CPU 코어)로 작업을 나누는 내장 모듈
+import multiprocessing
+import os
+import shutil
+import sys
 
-def main():
+
+def parse_log_line(line):
+    """
+    로그 한 줄을 (날짜시간, 이벤트, 메시지) 튜플로 나누는 함수
+    
+    Parameters:
+    - line (str): 'timestamp,event,message' 형식의 한 줄
+    
+    Returns:
+    - tuple: (timestamp, event, message), 형식이 맞지 않는 줄이면 None
+    """
+    # 줄 끝의 줄바꿈 문자만 제거 (메시지 안의 공백은 그대로 둠)
+    # split(',', 2): 메시지 안에 콤마가 있어도 최대 3개 부분으로만 나눔
+    parts = line.rstrip('\r\n').split(',', 2)
+    if len(parts) >= 3:
+        return parts[0], parts[1], parts[2]
+    return None
+
+
+def parse_log_lines(lines):
+    """
+    로그 줄 목록을 [날짜시간, 메시지] 리스트로 변환하는 함수
+    
+    Parameters:
+    - lines (list): 헤더를 제외한 로그 줄들
+    
+    Returns:
+    - list: [[datetime, message], ...]
+    """
+    # 빈 리스트 생성: 처리된 로그 데이터를 저장할 공간
+    logs_list = []
+    
+    # for 반복문: lines 리스트의 각 줄을 하나씩 처리
+    for line in lines:
+        # 문자열을 콤마(,)로 나누되, 최대 3개 부분으로만 나눕니다
+        # split(',', 2): 처음 2개 콤마만으로 나누어서 최대 3개 부분 생성
+        parts = line.split(',', 2)
+        
+        # if 조건문: parts 리스트의 길이가 3 이상인지 확인
+        # len(): 리스트나 문자열의 길이를 구하는 함수
+        if len(parts) >= 3:
+            # 리스트 인덱싱: [0]은 첫 번째, [2]는 세 번째 요소
+            datetime = parts[0]    # 날짜/시간 부분
+            message = parts[2]     # 실제 메시지 내용 (parts[1]은 event 타입이므로 건너뜀)
+            
+            # .append(): 리스트에 새로운 요소를 추가하는 메서드
+            logs_list.append([datetime, message])
+    
+    return logs_list
+
+
+def split_log_chunks(filename, chunk_count):
+    """
+    로그 파일을 줄 경계에 맞춘 바이트 구간들로 나누는 함수
+    
+    - 첫 줄(헤더)은 구간에서 제외
+    - 파일 끝의 공백/빈 줄도 제외 (기존 방식의 strip()과 같은 결과를 내기 위함)
+    - 각 구간의 끝은 항상 줄바꿈 바로 다음 위치이므로 한 줄이 두 구간에 걸치지 않음
+    
+    Returns:
+    - list: [(시작 바이트, 끝 바이트), ...] 파일 순서대로 정렬됨
+    """
+    size = os.path.getsize(filename)
+    
+    with open(filename, 'rb') as file:
+        data_start = len(file.readline())
+        
+        # 파일 끝에서부터 거꾸로 읽으며 마지막 공백이 아닌 바이트 위치를 찾음
+        data_end = size
+        while data_end > data_start:
+            block_start = max(data_start, data_end - 4096)
+            file.seek(block_start)
+            block = file.read(data_end - block_start).rstrip()
+            data_end = block_start + len(block)
+            if block:
+                break
+        
+        if data_end <= data_start:
+            return []
+        
+        # 구간 크기만큼 건너뛴 뒤 readline()으로 그 줄의 끝까지 이동
+        span = max(1, (data_end - data_start) // chunk_count)
+        chunks = []
+        start = data_start
+        while start < data_end:
+            file.seek(min(start + span, data_end))
+            file.readline()
+            end = min(file.tell(), data_end)
+            chunks.append((start, end))
+            start = end
+    
+    return chunks
+
+
+def parse_log_chunk(filename, start, end):
+    """
+    한 구간(start ~ end 바이트)만 읽어 파싱하는 함수 (작업 프로세스에서 실행)
+    
+    결과를 프로세스 사이로 보낼 때의 크기를 줄이기 위해
+    [날짜시간, 메시지] 리스트 대신 (날짜시간 목록, 메시지 목록) 두 리스트로 돌려줌
+    """
+    with open(filename, 'rb') as file:
+        file.seek(start)
+        data = file.read(end - start)
+    
+    # 텍스트 모드로 읽을 때처럼 '\r\n', '\r'을 '\n'으로 통일
+    text = data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+    logs_list = parse_log_lines(text.split('\n'))
+    
+    datetimes = [log[0] for log in logs_list]
+    messages = [log[1] for log in logs_list]
+    return datetimes, messages
+
+
+def parse_log_parallel(filename, workers):
+    """
+    로그 파일을 여러 프로세스로 나누어 파싱하는 함수
+    
+    구간 결과는 파일 순서대로 다시 이어 붙이므로
+    단일 프로세스 방식(parse_log_lines)과 완전히 같은 리스트를 돌려줌
+    
+    Parameters:
+    - filename (str): 로그 파일 경로
+    - workers (int): 사용할 프로세스 수
+    
+    Returns:
+    - list: [[datetime, message], ...]
+    """
+    # 작업량이 고르게 나뉘도록 프로세스 수보다 조금 더 잘게 나눔
+    chunks = split_log_chunks(filename, workers * 4)
+    
+    # Pool.starmap(): 결과를 입력 순서 그대로 돌려줌
+    with multiprocessing.Pool(workers) as pool:
+        results = pool.starmap(parse_log_chunk,
+                               [(filename, start, end) for start, end in chunks])
+    
+    logs_list = []
+    for datetimes, messages in results:
+        logs_list.extend([datetime, message]
+                         for datetime, message in zip(datetimes, messages))
+    return logs_list
+
+
+def iter_log_records(filename, echo=False):
+    """
+    로그 파일을 한 줄씩 읽으면서 파싱 결과를 하나씩 돌려주는 제너레이터
+    
+    [제너레이터란?]
+    - yield로 값을 하나씩 돌려주는 함수
+    - 파일 전체를 메모리에 올리지 않으므로 로그가 수 GB여도 메모리 사용량이 일정함
+    
+    Parameters:
+    - filename (str): 읽을 로그 파일 경로
+    - echo (bool): True면 읽은 원본 줄을 그대로 화면에 출력
+    
+    Yields:
+    - tuple: (timestamp, event, message)
+    """
+    with open(filename, 'r', encoding='utf-8') as file:
+        # 첫 줄은 헤더(timestamp,event,message)이므로 파싱하지 않음
+        header = file.readline()
+        if echo:
+            print(header, end='')
+        
+        # for line in file: 파일 객체를 직접 순회하면 한 줄씩만 읽어옴
+        for line in file:
+            if echo:
+                print(line, end='')
+            record = parse_log_line(line)
+            if record is not None:
+                yield record
+
+
+def write_json_stream(records, json_filename):
+    """
+    (timestamp, event, message) 레코드를 받는 즉시 JSON 파일에 기록하는 함수
+    
+    json.dump()는 딕셔너리 전체가 메모리에 있어야 하지만,
+    이 함수는 항목을 하나씩 써 내려가므로 메모리 사용량이 일정함.
+    출력 형식은 json.dump(..., ensure_ascii=False, indent=2)와 같음.
+    
+    Parameters:
+    - records (iterable): (timestamp, event, message) 튜플들
+    - json_filename (str): 저장할 JSON 파일 경로
+    
+    Returns:
+    - int: 기록한 항목 수
+    """
+    count = 0
+    with open(json_filename, 'w', encoding='utf-8') as json_file:
+        json_file.write('{')
+        for timestamp, _event, message in records:
+            # 두 번째 항목부터는 앞에 콤마를 붙여 구분
+            json_file.write(',\n  ' if count else '\n  ')
+            json_file.write(json.dumps(timestamp, ensure_ascii=False))
+            json_file.write(': ')
+            json_file.write(json.dumps(message, ensure_ascii=False))
+            count += 1
+        # 항목이 하나도 없으면 '{}'만 남도록 처리
+        json_file.write('\n}' if count else '}')
+    return count
+
+
+def run_stream(filename, json_filename, echo=True):
+    """
+    스트리밍 모드 - 로그를 한 줄씩 읽어 바로 JSON으로 기록
+    
+    전체 정렬에는 모든 줄이 메모리에 있어야 하므로, 이 모드는
+    로그 파일에 적힌 순서 그대로 저장합니다.
+    """
+    try:
+        if echo:
+            print('=== 로그 파일 전체 내용 ===')
+        count = write_json_stream(iter_log_records(filename, echo), json_filename)
+        
+        print('\n=== JSON 파일 저장 완료 (스트리밍 모드) ===')
+        print(f'파일명: {json_filename}, 항목 수: {count}')
+    
+    except FileNotFoundError:
+        print(f'오류: {filename} 파일을 찾을 수 없습니다.')
+    
+    except UnicodeDecodeError:
+        print(f'오류: {filename} 파일 디코딩 중 문제가 발생했습니다.')
+    
+    except Exception as e:
+        print(f'예상치 못한 오류가 발생했습니다: {e}')
+
+
+def parse_args(argv=None):
+    """
+    명령줄 옵션을 해석하는 함수
+    
+    사용 예시:
+    python main.py                 # 기존 방식 (전체 읽기 + 역순 정렬)
+    python main.py --stream        # 스트리밍 모드 (메모리 사용량 일정)
+    python main.py --no-echo       # 원본 로그 내용을 화면에 출력하지 않음
+    python main.py --workers 4     # 4개 프로세스로 나누어 파싱
+    """
+    parser = argparse.ArgumentParser(description='Mars 미션 컴퓨터 로그 분석')
+    parser.add_argument('--stream', action='store_true',
+                        help='로그를 한 줄씩 읽어 바로 JSON으로 기록 (파일 순서 유지)')
+    parser.add_argument('--no-echo', dest='echo', action='store_false',
+                        help='원본 로그 내용을 화면에 출력하지 않음')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='파싱에 사용할 프로세스 수 (기본값 1: 단일 프로세스)')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
     """
     메인 함수 - 로그 분석 프로그램의 핵심 기능
     함수란: 특정 작업을 수행하는 코드 묶음
     """
     
+    # 명령줄 옵션 읽기
+    args = parse_args(argv)
+    
     # 변수 선언: 읽어올 로그 파일의 이름을 저장
     filename = 'mission_computer_main.log'
+    json_filename = 'mission_computer_main.json'
+    
+    # 스트리밍 모드는 별도 함수에서 처리
+    if args.stream:
+        run_stream(filename, json_filename, echo=args.echo)
+        return
     
     # try-except 구문: 오류가 발생할 수 있는 코드를 안전하게 실행
     try:
-        # 파일을 읽기 모드('r')로 열고, UTF-8 인코딩으로 읽습니다
-        # with 구문: 파일을 자동으로 닫아주는 안전한 방법
-        with open(filename, 'r', encoding='utf-8') as file:
-            # file.read(): 파일의 모든 내용을 하나의 문자열로 읽어옵니다
-            log_content = file.read()
-        
-        # print(): 화면에 텍스트를 출력하는 함수
-        print('=== 로그 파일 전체 내용 ===')
-        print(log_content)  # 읽어온 파일 전체 내용을 출력
-        
-        # 문자열 처리:
-        # .strip(): 앞뒤 공백과 줄바꿈 제거
-        # .split('\n'): 줄바꿈 문자를 기준으로 문자열을 나누어 리스트로 만듦
-        # [1:]: 리스트의 첫 번째 요소(헤더)를 제외하고 나머지만 가져옴
-        lines = log_content.strip().split('\n')[1:]
-        
-        # 빈 리스트 생성: 처리된 로그 데이터를 저장할 공간
-        logs_list = []
+        # --workers 2 이상이면 여러 프로세스로 나누어 파싱
+        if args.workers > 1:
+            if args.echo:
+                print('=== 로그 파일 전체 내용 ===')
+                # 파일 전체를 문자열로 만들지 않고 조금씩 화면에 복사
+                with open(filename, 'r', encoding='utf-8') as file:
+                    shutil.copyfileobj(file, sys.stdout)
+                print()
+            
+            logs_list = parse_log_parallel(filename, args.workers)
         
-        # for 반복문: lines 리스트의 각 줄을 하나씩 처리
-        for line in lines:
-            # 문자열을 콤마(,)로 나누되, 최대 3개 부분으로만 나눕니다
-            # split(',', 2): 처음 2개 콤마만으로 나누어서 최대 3개 부분 생성
-            parts = line.split(',', 2)
+        else:
+            # 파일을 읽기 모드('r')로 열고, UTF-8 인코딩으로 읽습니다
+            # with 구문: 파일을 자동으로 닫아주는 안전한 방법
+            with open(filename, 'r', encoding='utf-8') as file:
+                # file.read(): 파일의 모든 내용을 하나의 문자열로 읽어옵니다
+                log_content = file.read()
+            
+            # print(): 화면에 텍스트를 출력하는 함수
+            # --no-echo 옵션이 있으면 원본 내용 출력을 건너뜀
+            if args.echo:
+                print('=== 로그 파일 전체 내용 ===')
+                print(log_content)  # 읽어온 파일 전체 내용을 출력
+            
+            # 문자열 처리:
+            # .strip(): 앞뒤 공백과 줄바꿈 제거
+            # .split('\n'): 줄바꿈 문자를 기준으로 문자열을 나누어 리스트로 만듦
+            # [1:]: 리스트의 첫 번째 요소(헤더)를 제외하고 나머지만 가져옴
+            lines = log_content.strip().split('\n')[1:]
             
-            # if 조건문: parts 리스트의 길이가 3 이상인지 확인
-            # len(): 리스트나 문자열의 길이를 구하는 함수
-            if len(parts) >= 3:
-                # 리스트 인덱싱: [0]은 첫 번째, [2]는 세 번째 요소
-                datetime = parts[0]    # 날짜/시간 부분
-                message = parts[2]     # 실제 메시지 내용 (parts[1]은 event 타입이므로 건너뜀)
-                
-                # .append(): 리스트에 새로운 요소를 추가하는 메서드
-                logs_list.append([datetime, message])
+            logs_list = parse_log_lines(lines)
         
         # 처리 결과 출력
         print('\n=== 원본 로그 리스트 ===')
@@ -75,14 +336,14 @@ def main():
         # JSON 파일 저장을 위한 try-except (중첩된 예외 처리)
         try:
             # JSON 파일을 쓰기 모드('w')로 열기
-            with open('mission_computer_main.json', 'w', encoding='utf-8') as json_file:
+            with open(json_filename, 'w', encoding='utf-8') as json_file:
                 # json.dump(): 파이썬 객체를 JSON 파일로 저장
                 # ensure_ascii=False: 한글 등 유니코드 문자를 그대로 저장
                 # indent=2: JSON 파일을 보기 좋게 들여쓰기 2칸으로 포맷팅
                 json.dump(logs_dict, json_file, ensure_ascii=False, indent=2)
             
             print('\n=== JSON 파일 저장 완료 ===')
-            print('파일명: mission_computer_main.json')
+            print(f'파일명: {json_filename}')
             
         # JSON 저장 중 오류 발생 시 처리
         except Exception as json_error:
@@ -6,6 +6,25 @@
 # 예: math.pi (원주율 3.14159...), math.sqrt (제곱근) 등
 import math
 
+# argparse: 명령줄 옵션(--batch 등)을 처리하는 내장 모듈
+# csv: 쉼표로 구분된 파일을 한 줄씩 읽고 쓰는 내장 모듈
+# sys: 표준 입력/출력(stdin/stdout)에 접근하기 위한 내장 모듈
+# time: 처리 속도(초당 설계 수)를 재기 위한 내장 모듈
+# functools.lru_cache: 같은 입력의 계산 결과를 기억해 두는 캐시
+import argparse
+import csv
+import sys
+import time
+from functools import lru_cache
+
+# numpy: 대량의 숫자 배열을 한 번에 계산하는 외부 라이브러리
+# 예: 설계안 수백만 개를 반복문 없이 한 번에 계산
+import numpy as np
+
+# material_catalog: 적재물 목록 CSV의 물질별 밀도를 한 번만 읽어 두는 모듈
+# (DENSITY에 없는 재질은 이 카탈로그에서 찾음)
+from material_catalog import get_catalog
+
 # ========== 전역 변수 선언 ==========
 # 전역 변수: 프로그램 어디서든 접근 가능한 변수
 # 함수 안에서 global 키워드를 사용하면 수정도 가능
@@ -41,6 +60,13 @@ DENSITY = {
 # 화성의 중력은 지구의 약 38%
 MARS_GRAVITY = 0.38
 
+# 배열 계산용 기본 재질 코드 (적재물 카탈로그의 재질까지 포함한 표는 get_materials())
+# MATERIAL_NAMES[코드] → 재질 이름, DENSITY_ARRAY[코드] → 밀도
+# 예: 코드 0은 '유리', DENSITY_ARRAY[0]은 2.4
+MATERIAL_NAMES = list(DENSITY)
+DENSITY_ARRAY = np.array([DENSITY[name] for name in MATERIAL_NAMES], dtype=np.float64)
+MATERIAL_CODES = {name: code for code, name in enumerate(MATERIAL_NAMES)}
+
 
 # ========== 메인 계산 함수 정의 ==========
 def sphere_area(diameter, material, thickness=1):
@@ -60,6 +86,7 @@ def sphere_area(diameter, material, thickness=1):
     
     material (str): 재질 이름
                    - 입력 가능한 값: '유리', '알루미늄', '탄소강'
+                     또는 적재물 목록에서 밀도가 숫자인 물질 이름 (예: 'Aluminum')
                    - 예: '유리'
                    - 필수 인자
     
@@ -103,9 +130,9 @@ def sphere_area(diameter, material, thickness=1):
     volume_cm3 = volume_m3 * 1000000
     
     # ========== 4단계: 재질의 밀도 가져오기 ==========
-    # DENSITY 딕셔너리에서 재질에 해당하는 밀도 값을 가져옴
+    # 재질 표(DENSITY + 적재물 카탈로그, 처음 한 번만 만듦)에서 재질에 해당하는 밀도 값을 가져옴
     # 예: material이 '유리'면 density는 2.4가 됨
-    density = DENSITY[material]
+    density = material_density(material)
     
     # ========== 5단계: 무게 계산 ==========
     # 무게 = 부피 × 밀도
@@ -126,6 +153,315 @@ def sphere_area(diameter, material, thickness=1):
     return area, weight_mars
 
 
+class MaterialTable:
+    """
+    재질 이름 → 코드 → 밀도 표 (sphere_area()와 sphere_area_batch()가 함께 사용)
+    
+    - names[코드]: 재질 이름, densities[코드]: 밀도 (g/cm³), codes[이름]: 코드
+    - 코드 0~2는 DENSITY의 기본 재질 (MATERIAL_CODES와 같은 번호)
+    - 그 뒤는 적재물 카탈로그에서 밀도가 숫자인 물질 (예: 'Aluminum', 'Glass')
+    """
+    
+    def __init__(self, names, densities):
+        self.names = list(names)
+        self.densities = np.asarray(densities, dtype=np.float64)
+        self.codes = {name: code for code, name in enumerate(self.names)}
+    
+    def __len__(self):
+        return len(self.names)
+    
+    def __contains__(self, name):
+        return name in self.codes
+    
+    def density(self, name):
+        """재질 이름으로 밀도를 찾는 함수 (없으면 KeyError)"""
+        return float(self.densities[self.codes[name]])
+
+
+# 처음 get_materials()를 호출할 때 한 번만 만드는 재질 표
+_materials = None
+
+
+def get_materials():
+    """
+    재질 표를 돌려주는 함수
+    
+    - 처음 호출할 때만 적재물 카탈로그를 읽어 표를 만들고, 이후에는 같은 표를 돌려줌
+      (계산할 때마다 CSV나 카탈로그 파일을 다시 확인하지 않음)
+    - 적재물 목록 파일이 없으면 DENSITY의 기본 재질만 사용
+    """
+    global _materials
+    if _materials is None:
+        names = list(MATERIAL_NAMES)
+        densities = list(DENSITY_ARRAY)
+        try:
+            catalog = get_catalog()
+        except OSError:
+            catalog = None
+        if catalog is not None:
+            # 'Various'처럼 밀도가 숫자가 아닌(NaN) 물질은 계산할 수 없으므로 제외
+            usable = ~np.isnan(catalog.densities)
+            for name, density in zip(catalog.names[usable], catalog.densities[usable]):
+                name = str(name)
+                if name not in MATERIAL_CODES:
+                    names.append(name)
+                    densities.append(density)
+        _materials = MaterialTable(names, densities)
+    return _materials
+
+
+def material_density(material):
+    """
+    재질 이름으로 밀도(g/cm³)를 찾는 함수
+    
+    [예외]
+    KeyError: 재질 표에 없거나 밀도가 숫자가 아닌('Various') 재질일 때
+    """
+    return get_materials().density(material)
+
+
+def is_valid_material(material):
+    """밀도를 알 수 있는 재질인지 확인하는 함수"""
+    return material in get_materials()
+
+
+# ========== 배열(일괄) 계산 함수 정의 ==========
+def encode_materials(materials):
+    """
+    재질 이름 배열을 재질 코드(정수) 배열로 바꾸는 함수
+    
+    [Parameters]
+    materials: 재질 이름들 (예: ['유리', '탄소강', '유리'])
+    
+    [Returns]
+    numpy 정수 배열 (예: [0, 2, 0])
+    
+    [예외]
+    KeyError: 재질 표(get_materials())에 없는 재질 이름이 있을 때
+    """
+    materials = np.asarray(materials)
+    codes = get_materials().codes
+    
+    # 같은 이름이 여러 번 나와도 사전 조회는 서로 다른 이름 개수만큼만 수행
+    unique_names, inverse = np.unique(materials, return_inverse=True)
+    unique_codes = np.array([codes[str(name)] for name in unique_names],
+                            dtype=np.intp)
+    return unique_codes[inverse].reshape(materials.shape)
+
+
+def sphere_area_batch(diameters, materials=None, thicknesses=1, density_table=None,
+                      densities=None):
+    """
+    여러 돔의 표면적과 무게를 한 번에 계산하는 함수 (sphere_area의 배열 버전)
+    
+    [Parameters]
+    diameters: 돔의 지름 배열 (미터, m)
+    materials: 재질 코드 배열 (정수, get_materials()의 코드)
+               또는 재질 이름 배열 (예: ['유리', 'Aluminum'])
+    thicknesses: 두께 배열 (센티미터, cm), 기본값 1
+    density_table: 재질 코드 → 밀도 배열 (기본값: get_materials().densities)
+                   예: material_catalog.get_catalog().densities를 넘기면
+                   materials에 카탈로그 ID를 사용할 수 있음
+    densities: 밀도 배열 (g/cm³) - 주면 재질 조회 없이 이 값을 바로 사용
+               (materials는 생략, 예: 표본마다 밀도가 다른 몬테카를로 계산)
+    
+    - 세 인자는 numpy 브로드캐스팅 규칙을 따름
+      예: 지름 배열 + 재질 하나 + 두께 하나도 가능
+    
+    [Returns]
+    areas: 표면적 배열 (m²)
+    weights: 화성 중력을 반영한 무게 배열 (kg)
+    
+    [사용 예시]
+    면적들, 무게들 = sphere_area_batch([10, 20], ['유리', '탄소강'], [1, 2])
+    
+    계산 순서가 sphere_area()와 같으므로 같은 입력이면 같은 값을 돌려줌
+    """
+    diameters = np.asarray(diameters, dtype=np.float64)
+    thicknesses = np.asarray(thicknesses, dtype=np.float64)
+    
+    if densities is not None:
+        densities = np.asarray(densities, dtype=np.float64)
+    elif materials is None:
+        raise ValueError('materials 또는 densities 중 하나가 필요합니다.')
+    else:
+        # 재질 이름이 들어오면 코드로 변환 (이름은 DENSITY 기준)
+        materials = np.asarray(materials)
+        if density_table is None:
+            density_table = get_materials().densities
+            if materials.dtype.kind in ('U', 'S', 'O'):
+                materials = encode_materials(materials)
+        codes = materials.astype(np.intp)
+        if codes.size and (codes.min() < 0 or codes.max() >= len(density_table)):
+            raise ValueError('유효하지 않은 재질 코드가 있습니다.')
+        
+        # 밀도 조회: 코드 배열로 밀도 배열을 한 번에 인덱싱
+        densities = density_table[codes]
+    
+    # sphere_area()와 같은 순서로 계산
+    # np.float_power(): 파이썬의 ** 연산과 같은 방식(C pow)으로 거듭제곱을 계산
+    # (배열 ** 2는 x * x로 바뀌어 마지막 자리 반올림이 달라질 수 있음)
+    radius = diameters / 2
+    areas = 2 * math.pi * np.float_power(radius, 2)
+    thickness_m = thicknesses / 100
+    volume_m3 = areas * thickness_m
+    volume_cm3 = volume_m3 * 1000000
+    weight_g = volume_cm3 * densities
+    weight_kg = weight_g / 1000
+    weights = weight_kg * MARS_GRAVITY
+    
+    # 브로드캐스팅 결과와 같은 모양으로 면적 배열도 맞춤
+    areas = np.broadcast_to(areas, weights.shape)
+    return areas, weights
+
+
+# ========== 일괄(배치) 처리 함수 정의 ==========
+# 캐시에 기억해 둘 최대 설계 수 (메모리 사용량 제한)
+DEFAULT_CACHE_SIZE = 4096
+
+
+def parse_design_row(row):
+    """
+    CSV 한 줄(지름, 재질, 두께)을 검사하고 (diameter, material, thickness)로 바꾸는 함수
+    
+    - 두께 칸이 없거나 비어 있으면 기본값 1
+    - 입력 검사는 main()의 대화형 입력과 같은 규칙을 따름
+    
+    [예외]
+    ValueError: 숫자가 아니거나, 0 이하이거나, 없는 재질일 때
+    """
+    if len(row) < 2:
+        raise ValueError('지름과 재질이 필요합니다.')
+    
+    try:
+        diameter = float(row[0])
+        thickness = 1.0 if len(row) < 3 or row[2].strip() == '' else float(row[2])
+    except ValueError:
+        raise ValueError('숫자를 입력해야 합니다.')
+    
+    if diameter <= 0:
+        raise ValueError('지름은 0보다 커야 합니다.')
+    
+    material = row[1].strip()
+    if not is_valid_material(material):
+        raise ValueError(f'유효하지 않은 재질입니다: {material}')
+    
+    if thickness <= 0:
+        raise ValueError('두께는 0보다 커야 합니다.')
+    
+    return diameter, material, thickness
+
+
+def run_batch(input_file, output_file, cache_size=DEFAULT_CACHE_SIZE, report_file=None):
+    """
+    설계 목록을 한 줄씩 읽어 계산하고 바로 결과를 쓰는 함수 (사용자 입력 없음)
+    
+    [Parameters]
+    input_file: 'diameter,material,thickness' 형식의 CSV를 읽을 파일 객체
+                (첫 줄이 'diameter'로 시작하면 헤더로 보고 건너뜀)
+    output_file: 결과 CSV를 쓸 파일 객체
+    cache_size (int): 최근 계산 결과를 기억해 둘 개수 (LRU 캐시)
+    report_file: 처리 결과 요약을 출력할 파일 객체 (기본값: 표준 에러)
+    
+    [Returns]
+    dict: 처리 건수, 오류 건수, 캐시 적중 수, 걸린 시간, 초당 처리 수
+    
+    - 한 줄씩 읽고 쓰므로 입력이 아무리 커도 메모리 사용량은 캐시 크기만큼만 늘어남
+    - 전역 변수(dome_area 등)는 사용하지 않음
+    """
+    if report_file is None:
+        report_file = sys.stderr
+    
+    # 같은 (지름, 재질, 두께) 조합은 다시 계산하지 않고 캐시에서 꺼냄
+    # 가장 오래 사용하지 않은 결과부터 버림 (LRU: Least Recently Used)
+    cached_sphere_area = lru_cache(maxsize=cache_size)(sphere_area)
+    
+    reader = csv.reader(input_file)
+    writer = csv.writer(output_file, lineterminator='\n')
+    writer.writerow(['diameter', 'material', 'thickness', 'area', 'weight'])
+    
+    processed = 0
+    errors = 0
+    start_time = time.perf_counter()
+    
+    for line_number, row in enumerate(reader, start=1):
+        # 빈 줄과 헤더 줄 건너뛰기
+        if not row or not ''.join(row).strip():
+            continue
+        if line_number == 1 and row[0].strip().lower() == 'diameter':
+            continue
+        
+        try:
+            diameter, material, thickness = parse_design_row(row)
+        except ValueError as e:
+            errors += 1
+            print(f'오류 ({line_number}번째 줄): {e}', file=report_file)
+            continue
+        
+        area, weight = cached_sphere_area(diameter, material, thickness)
+        writer.writerow([diameter, material, thickness, area, weight])
+        processed += 1
+    
+    elapsed = time.perf_counter() - start_time
+    cache_info = cached_sphere_area.cache_info()
+    rate = processed / elapsed if elapsed > 0 else float('inf')
+    
+    print(f'처리한 설계 수: {processed}, 오류: {errors}, '
+          f'캐시 적중: {cache_info.hits}, 걸린 시간: {elapsed:.3f}초, '
+          f'처리 속도: {rate:.1f} designs/sec', file=report_file)
+    
+    return {
+        'processed': processed,
+        'errors': errors,
+        'cache_hits': cache_info.hits,
+        'elapsed': elapsed,
+        'designs_per_sec': rate
+    }
+
+
+def parse_args(argv=None):
+    """
+    명령줄 옵션을 해석하는 함수
+    
+    사용 예시:
+    python design_dome.py                                  # 대화형 입력
+    python design_dome.py --batch designs.csv              # 파일을 읽어 결과를 화면(stdout)에 출력
+    python design_dome.py --batch - --output result.csv    # 표준 입력을 읽어 파일로 저장
+    """
+    parser = argparse.ArgumentParser(description='Mars 돔 구조물 설계 프로그램')
+    parser.add_argument('--batch', metavar='CSV',
+                        help="설계 목록 CSV 파일 ('-'이면 표준 입력)")
+    parser.add_argument('--output', metavar='CSV',
+                        help='결과를 저장할 CSV 파일 (기본값: 표준 출력)')
+    parser.add_argument('--cache-size', type=int, default=DEFAULT_CACHE_SIZE,
+                        help='같은 입력의 계산 결과를 기억해 둘 개수')
+    return parser.parse_args(argv)
+
+
+def main_batch(args):
+    """--batch 옵션으로 실행했을 때 입력/출력 파일을 열고 run_batch()를 호출하는 함수"""
+    try:
+        if args.batch == '-':
+            input_file = sys.stdin
+        else:
+            input_file = open(args.batch, 'r', encoding='utf-8', newline='')
+        
+        try:
+            if args.output:
+                with open(args.output, 'w', encoding='utf-8', newline='') as output_file:
+                    run_batch(input_file, output_file, args.cache_size)
+            else:
+                run_batch(input_file, sys.stdout, args.cache_size)
+        finally:
+            if input_file is not sys.stdin:
+                input_file.close()
+    
+    except FileNotFoundError as e:
+        print(f'오류: {e.filename} 파일을 찾을 수 없습니다.', file=sys.stderr)
+    except Exception as e:
+        print(f'오류 발생: {e}', file=sys.stderr)
+
+
 # ========== 메인 프로그램 함수 ==========
 def main():
     """
@@ -191,13 +527,12 @@ def main():
                 continue  # continue: 이번 반복을 건너뛰고 다음 반복으로
             
             # ========== 재질 입력 받기 ==========
-            print('\n사용 가능한 재질: 유리, 알루미늄, 탄소강')
+            print('\n사용 가능한 재질: 유리, 알루미늄, 탄소강 (또는 적재물 목록의 물질 이름, 예: Aluminum)')
             material = input('재질을 입력하세요: ')
             
             # ========== 재질 유효성 검사 ==========
-            # in: 값이 딕셔너리의 키에 있는지 확인
-            # not in: 값이 없으면 True
-            if material not in DENSITY:
+            # DENSITY 또는 적재물 카탈로그에 밀도가 있는 재질인지 확인
+            if not is_valid_material(material):
                 print('오류: 유효하지 않은 재질입니다.\n')
                 continue
             
@@ -254,5 +589,9 @@ def main():
 # 직접 실행하면 '__main__'이 됨
 # 다른 파일에서 import하면 '__main__'이 아님
 if __name__ == '__main__':
-    # main() 함수 호출
-    main()
+    # --batch 옵션이 있으면 일괄 처리, 없으면 기존 대화형 main() 함수 호출
+    options = parse_args()
+    if options.batch:
+        main_batch(options)
+    else:
+        main()
@@ -0,0 +1,269 @@
+# dome_montecarlo.py
+# 목적: 제작 공차(지름/두께/밀도의 오차)를 고려해 돔 무게의 분포를 추정하는 프로그램
+#       (몬테카를로 시뮬레이션).
+#
+# [몬테카를로 시뮬레이션이란?]
+# - 오차가 있는 값들을 무작위로 아주 많이 뽑아서 계산해 보고, 결과의 분포를 살펴보는 방법
+# - 예: "무게가 95%의 확률로 넘지 않는 값(p95)"은 얼마인가?
+#
+# [동작 방식]
+# - 지름, 두께, 밀도를 각각 정규분포로 가정하고 numpy로 큰 묶음(batch) 단위로 한 번에 뽑음
+# - sphere_area_batch()로 sphere_area()와 같은 공식을 적용
+# - 모든 표본을 저장하지 않고, 분위수 스케치(QuantileSketch)에 개수만 쌓아서 p50/p95/p99를 추정
+# - 묶음마다 정해진 시드(seed)를 쓰므로 프로세스 수와 상관없이 같은 결과가 나옴
+
+import argparse
+import math
+import multiprocessing
+
+import numpy as np
+
+from design_dome import MARS_GRAVITY, MATERIAL_NAMES, is_valid_material, material_density, \
+    sphere_area_batch
+
+# 한 묶음에서 뽑을 표본 수
+DEFAULT_BATCH_SIZE = 1000000
+
+# 분위수 스케치의 상대 오차 (0.001 → 추정값이 실제 분위수와 최대 0.1% 차이)
+DEFAULT_RELATIVE_ACCURACY = 0.001
+
+# 추정해서 보여줄 분위수
+DEFAULT_QUANTILES = (0.5, 0.95, 0.99)
+
+
+class QuantileSketch:
+    """
+    양수 값들의 분위수를 일정한 메모리로 추정하는 스케치 (로그 간격 히스토그램)
+
+    - 값 x를 γ^(i-1) < x <= γ^i 를 만족하는 칸 i에 넣고 칸별 개수만 기록
+      (γ = (1 + α) / (1 - α), α = 상대 오차)
+    - 칸 i의 대표값 2γ^i / (γ + 1)은 칸 안의 어떤 값과도 상대 오차 α 이내
+    - 칸 개수는 값의 범위에만 비례하고 표본 수와는 무관함
+    - 두 스케치의 칸별 개수를 더하면 그대로 합쳐짐 (여러 프로세스의 결과 병합)
+    """
+
+    def __init__(self, relative_accuracy=DEFAULT_RELATIVE_ACCURACY):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.offset = 0                               # counts[0]에 해당하는 칸 번호
+        self.counts = np.zeros(0, dtype=np.int64)     # 칸별 개수
+        self.zero_count = 0                           # 0 이하 값의 개수
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, values):
+        """값 배열을 한 번에 스케치에 추가하는 함수"""
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if values.size == 0:
+            return
+
+        self.count += values.size
+        self.total += float(values.sum())
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+
+        positive = values[values > 0]
+        self.zero_count += values.size - positive.size
+        if positive.size == 0:
+            return
+
+        keys = np.ceil(np.log(positive) / self.log_gamma).astype(np.int64)
+        low = int(keys.min())
+        # np.bincount: 칸 번호별 개수를 한 번에 셈 (정렬 없이 O(n))
+        self._add_counts(low, np.bincount(keys - low))
+
+    def _add_counts(self, low, counts):
+        """low번 칸부터 시작하는 개수 배열을 기존 칸에 더하는 함수 (필요하면 칸 범위를 늘림)"""
+        if self.counts.size == 0:
+            self.offset = low
+            self.counts = counts.astype(np.int64)
+            return
+
+        new_low = min(self.offset, low)
+        new_high = max(self.offset + self.counts.size, low + counts.size)
+        if new_low != self.offset or new_high != self.offset + self.counts.size:
+            grown = np.zeros(new_high - new_low, dtype=np.int64)
+            start = self.offset - new_low
+            grown[start:start + self.counts.size] = self.counts
+            self.counts = grown
+            self.offset = new_low
+
+        start = low - self.offset
+        self.counts[start:start + counts.size] += counts
+
+    def merge(self, other):
+        """다른 스케치의 내용을 이 스케치에 합치는 함수 (상대 오차가 같아야 함)"""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError('상대 오차가 다른 스케치는 합칠 수 없습니다.')
+        if other.count == 0:
+            return
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.zero_count += other.zero_count
+        if other.counts.size:
+            self._add_counts(other.offset, other.counts)
+
+    def quantile(self, q):
+        """q 분위수(0 <= q <= 1)의 추정값을 돌려주는 함수 (값이 없으면 NaN)"""
+        if self.count == 0:
+            return math.nan
+
+        rank = q * (self.count - 1)
+        if rank < self.zero_count:
+            return 0.0
+
+        cumulative = np.cumsum(self.counts)
+        position = int(np.searchsorted(cumulative, rank - self.zero_count, side='right'))
+        position = min(position, self.counts.size - 1)
+        key = self.offset + position
+        estimate = 2 * self.gamma ** key / (self.gamma + 1)
+        # 추정값이 실제 최솟값/최댓값 밖으로 나가지 않도록 자름
+        return min(max(estimate, self.min), self.max)
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else math.nan
+
+
+def _sample_batch(task):
+    """
+    표본 한 묶음을 뽑아 무게를 계산하고 스케치로 돌려주는 함수 (작업 프로세스에서 실행)
+    """
+    (seed, size, diameter, diameter_tol, thickness, thickness_tol,
+     density, density_tol, relative_accuracy) = task
+
+    rng = np.random.default_rng(seed)
+    diameters = rng.normal(diameter, diameter_tol, size) if diameter_tol else \
+        np.full(size, diameter)
+    thicknesses = rng.normal(thickness, thickness_tol, size) if thickness_tol else \
+        np.full(size, thickness)
+    densities = rng.normal(density, density_tol, size) if density_tol else \
+        np.full(size, density)
+
+    # 0 이하로 뽑힌 값은 물리적으로 불가능하므로 0으로 자름 (무게 0으로 기록됨)
+    np.maximum(diameters, 0, out=diameters)
+    np.maximum(thicknesses, 0, out=thicknesses)
+    np.maximum(densities, 0, out=densities)
+
+    # 표본마다 밀도가 다르므로 재질 조회 없이 밀도 배열을 바로 넘김
+    _, weights = sphere_area_batch(diameters, thicknesses=thicknesses, densities=densities)
+
+    sketch = QuantileSketch(relative_accuracy)
+    sketch.add(weights)
+    return sketch
+
+
+def _summary(sketch, quantiles):
+    """스케치에서 현재까지의 통계 요약을 만드는 함수"""
+    result = {
+        'samples': sketch.count,
+        'mean': sketch.mean,
+        'min': sketch.min,
+        'max': sketch.max
+    }
+    for q in quantiles:
+        result[f'p{q * 100:g}'] = sketch.quantile(q)
+    return result
+
+
+def iter_monte_carlo(diameter, material, thickness=1, diameter_tol=0.0, thickness_tol=0.0,
+                     density_tol=0.0, samples=10000000, batch_size=DEFAULT_BATCH_SIZE,
+                     seed=None, workers=1, quantiles=DEFAULT_QUANTILES,
+                     relative_accuracy=DEFAULT_RELATIVE_ACCURACY):
+    """
+    몬테카를로 시뮬레이션을 진행하면서 묶음마다 현재까지의 추정값을 돌려주는 제너레이터
+
+    [Parameters]
+    diameter, material, thickness: sphere_area()와 같은 설계 값
+                                   (material은 적재물 카탈로그의 물질 이름도 가능)
+    diameter_tol (float): 지름의 표준편차 (m)
+    thickness_tol (float): 두께의 표준편차 (cm)
+    density_tol (float): 밀도의 표준편차 (g/cm³)
+    samples (int): 전체 표본 수
+    batch_size (int): 한 묶음의 표본 수
+    seed (int): 난수 시드 (같은 시드면 같은 결과)
+    workers (int): 프로세스 수 (1이면 현재 프로세스에서 계산)
+    quantiles: 추정할 분위수 목록 (기본값: p50, p95, p99)
+
+    [Yields]
+    dict: samples, mean, min, max, p50, p95, p99 ... (화성 기준 무게, kg)
+    """
+    density = material_density(material)
+
+    # 묶음마다 독립적인 시드를 미리 나눠 둠 → 프로세스 수와 상관없이 같은 결과
+    batch_count = max(1, math.ceil(samples / batch_size))
+    seeds = np.random.SeedSequence(seed).spawn(batch_count)
+    tasks = []
+    remaining = samples
+    for child_seed in seeds:
+        size = min(batch_size, remaining)
+        remaining -= size
+        tasks.append((child_seed, size, diameter, diameter_tol, thickness, thickness_tol,
+                      density, density_tol, relative_accuracy))
+
+    total = QuantileSketch(relative_accuracy)
+
+    if workers == 1:
+        for task in tasks:
+            total.merge(_sample_batch(task))
+            yield _summary(total, quantiles)
+        return
+
+    with multiprocessing.Pool(workers) as pool:
+        # imap: 결과를 작업 순서대로 받아서 중간 추정값도 항상 같게 함
+        for sketch in pool.imap(_sample_batch, tasks):
+            total.merge(sketch)
+            yield _summary(total, quantiles)
+
+
+def run_monte_carlo(*args, **kwargs):
+    """iter_monte_carlo()를 끝까지 실행하고 최종 추정값만 돌려주는 함수"""
+    result = None
+    for result in iter_monte_carlo(*args, **kwargs):
+        pass
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='돔 무게의 제작 공차 분석 (몬테카를로)')
+    parser.add_argument('--diameter', type=float, required=True, help='지름 (m)')
+    parser.add_argument('--material', required=True,
+                        help=f'재질 ({", ".join(MATERIAL_NAMES)} 또는 적재물 목록의 물질 이름)')
+    parser.add_argument('--thickness', type=float, default=1.0, help='두께 (cm)')
+    parser.add_argument('--diameter-tol', type=float, default=0.0, help='지름 표준편차 (m)')
+    parser.add_argument('--thickness-tol', type=float, default=0.0, help='두께 표준편차 (cm)')
+    parser.add_argument('--density-tol', type=float, default=0.0,
+                        help='밀도 표준편차 (g/cm³)')
+    parser.add_argument('--samples', type=int, default=10000000, help='전체 표본 수')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                        help='한 묶음의 표본 수')
+    parser.add_argument('--seed', type=int, default=None, help='난수 시드')
+    parser.add_argument('--workers', type=int, default=1, help='프로세스 수')
+    args = parser.parse_args(argv)
+    if not is_valid_material(args.material):
+        parser.error(f'유효하지 않은 재질입니다: {args.material}')
+
+    print(f'=== 몬테카를로 공차 분석 (화성 중력 {MARS_GRAVITY}) ===\n')
+    try:
+        for result in iter_monte_carlo(args.diameter, args.material, args.thickness,
+                                       args.diameter_tol, args.thickness_tol,
+                                       args.density_tol, args.samples, args.batch_size,
+                                       args.seed, args.workers):
+            print(f'표본 {result["samples"]:>12,}개: '
+                  f'p50 ⇒ {result["p50"]:.3f}, p95 ⇒ {result["p95"]:.3f}, '
+                  f'p99 ⇒ {result["p99"]:.3f} kg')
+    except Exception as e:
+        print(f'오류 발생: {e}')
+        return
+
+    print(f'\n평균 ⇒ {result["mean"]:.3f} kg, '
+          f'최소 ⇒ {result["min"]:.3f} kg, 최대 ⇒ {result["max"]:.3f} kg')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,226 @@
+# dome_optimizer.py
+# 목적: 조건(최소 면적, 최대 무게, 사용할 재질, 두께 범위)을 만족하는 돔 설계 중
+#       파레토 최적(Pareto-optimal) 설계를 찾는 프로그램.
+#
+# [파레토 최적이란?]
+# - 면적은 넓을수록, 무게는 가벼울수록 좋은 설계
+# - 다른 어떤 설계와 비교해도 "면적이 같거나 넓으면서 무게도 같거나 가벼운" 설계가 없으면 파레토 최적
+# - 결과는 면적이 커질수록 무게도 커지는 설계 목록이 되며, 첫 번째가 최소 무게 설계
+#
+# [동작 방식]
+# 1. 해석적 가지치기: 면적/무게 공식을 거꾸로 풀어서 재질·두께마다 가능한 지름 범위를 바로 계산
+#    - 면적 = π × d² / 2  →  d >= √(2 × 최소 면적 / π)
+#    - 무게 = 면적 × 두께 × 밀도 × 10 × 화성 중력  →  d <= √(2 × 최대 무게 / (10 × 두께 × 밀도 × 중력 × π))
+#    - 이 범위가 비어 있는 재질·두께 조합은 계산하지 않음
+# 2. 남은 지름 구간만 작업 단위로 나누어 프로세스 풀에서 sphere_area_batch()로 계산
+# 3. 각 작업은 자기 구간의 파레토 설계만 돌려주고, 마지막에 합쳐서 다시 파레토 설계만 남김
+
+import argparse
+import math
+import multiprocessing
+
+import numpy as np
+
+from design_dome import MARS_GRAVITY, MATERIAL_NAMES, get_materials, sphere_area_batch
+
+# 결과 배열의 필드 구성
+DESIGN_DTYPE = [('diameter', 'f8'), ('material', 'i4'), ('thickness', 'f8'),
+                ('area', 'f8'), ('weight', 'f8')]
+
+# 한 작업에서 계산할 최대 지름 개수
+DEFAULT_CHUNK_SIZE = 1000000
+
+
+def pareto_front(designs):
+    """
+    설계 배열에서 파레토 최적 설계만 남기는 함수 (면적 최대화, 무게 최소화)
+
+    면적 내림차순으로 정렬한 뒤, 지금까지 본 설계보다 무게가 더 가벼운 설계만 남김
+
+    Returns:
+    - 면적 오름차순으로 정렬된 파레토 설계 배열
+    """
+    if len(designs) == 0:
+        return designs
+
+    # np.lexsort: 마지막 키가 1순위 (면적 내림차순, 같은 면적이면 무게 오름차순)
+    order = np.lexsort((designs['weight'], -designs['area']))
+    weights = designs['weight'][order]
+
+    # 앞에 있는 설계들의 최소 무게보다 엄격하게 가벼워야 살아남음
+    previous_min = np.minimum.accumulate(weights)
+    keep = np.empty(len(weights), dtype=bool)
+    keep[0] = True
+    keep[1:] = weights[1:] < previous_min[:-1]
+
+    return designs[order[keep]][::-1]
+
+
+def feasible_diameter_range(min_area, max_weight, density, thickness):
+    """
+    재질(밀도)과 두께가 정해졌을 때 조건을 만족하는 지름 범위를 계산하는 함수
+
+    Returns:
+    - tuple: (최소 지름, 최대 지름), 가능한 지름이 없으면 최소 > 최대
+    """
+    low = math.sqrt(2 * min_area / math.pi)
+    if math.isinf(max_weight):
+        return low, math.inf
+    area_limit = max_weight / (10 * thickness * density * MARS_GRAVITY)
+    return low, math.sqrt(2 * area_limit / math.pi)
+
+
+def _evaluate_chunk(task):
+    """
+    작업 하나(재질, 두께, 지름 구간)를 계산하고 그 구간의 파레토 설계를 돌려주는 함수
+    (작업 프로세스에서 실행)
+    """
+    code, thickness, start, stop, d_min, d_step, min_area, max_weight = task
+
+    diameters = d_min + d_step * np.arange(start, stop, dtype=np.float64)
+    areas, weights = sphere_area_batch(diameters, code, thickness)
+
+    # 해석적 범위는 반올림 오차를 고려해 조금 넓게 잡았으므로 여기서 정확히 다시 확인
+    mask = (areas >= min_area) & (weights <= max_weight)
+
+    designs = np.empty(int(mask.sum()), dtype=DESIGN_DTYPE)
+    designs['diameter'] = diameters[mask]
+    designs['material'] = code
+    designs['thickness'] = thickness
+    designs['area'] = areas[mask]
+    designs['weight'] = weights[mask]
+    return pareto_front(designs)
+
+
+def plan_tasks(min_area, max_weight, materials, thicknesses, diameter_range, diameter_step,
+               chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    가지치기를 마친 뒤 실제로 계산할 작업 목록을 만드는 함수
+
+    Returns:
+    - list: 작업 튜플 목록 (가능한 지름이 없는 조합은 포함되지 않음)
+    """
+    d_min, d_max = diameter_range
+    grid_size = int(math.floor((d_max - d_min) / diameter_step + 1e-9)) + 1
+
+    densities = get_materials().densities
+    tasks = []
+    for code in materials:
+        density = densities[code]
+        for thickness in thicknesses:
+            low, high = feasible_diameter_range(min_area, max_weight, density, thickness)
+            low, high = max(low, d_min), min(high, d_max)
+            if low > high:
+                continue
+
+            # 격자에서 [low, high]에 해당하는 위치 구간 (양쪽으로 1칸씩 여유)
+            start = max(0, int(math.ceil((low - d_min) / diameter_step)) - 1)
+            stop = min(grid_size, int(math.floor((high - d_min) / diameter_step)) + 2)
+
+            for chunk_start in range(start, stop, chunk_size):
+                chunk_stop = min(stop, chunk_start + chunk_size)
+                tasks.append((code, float(thickness), chunk_start, chunk_stop,
+                              d_min, diameter_step, min_area, max_weight))
+    return tasks
+
+
+def optimize_domes(min_area=0.0, max_weight=math.inf, materials=None,
+                   thickness_range=(1.0, 1.0), thickness_step=1.0,
+                   diameter_range=(0.1, 100.0), diameter_step=0.1,
+                   workers=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    조건을 만족하는 파레토 최적 돔 설계를 찾는 함수
+
+    [Parameters]
+    min_area (float): 최소 표면적 (m²)
+    max_weight (float): 화성 기준 최대 무게 (kg)
+    materials (list): 사용할 재질 이름 목록 (None이면 DENSITY의 기본 재질 3개)
+                      적재물 카탈로그의 물질 이름(예: 'Aluminum')도 사용 가능
+    thickness_range (tuple): (최소 두께, 최대 두께) (cm)
+    thickness_step (float): 두께 격자 간격 (cm)
+    diameter_range (tuple): (최소 지름, 최대 지름) (m)
+    diameter_step (float): 지름 격자 간격 (m)
+    workers (int): 프로세스 수 (None이면 CPU 코어 수, 1이면 현재 프로세스에서 계산)
+    chunk_size (int): 한 작업에서 계산할 최대 지름 개수
+
+    [Returns]
+    numpy 구조화 배열 (diameter, material, thickness, area, weight)
+    - 면적 오름차순, 첫 번째 행이 최소 무게 설계
+    - material은 재질 코드 (get_materials().names[코드]로 이름 확인)
+    """
+    if materials is None:
+        materials = MATERIAL_NAMES
+    table = get_materials()
+    for name in materials:
+        if name not in table:
+            raise ValueError(f'유효하지 않은 재질입니다: {name}')
+    codes = [table.codes[name] for name in materials]
+
+    t_min, t_max = thickness_range
+    if t_min <= 0 or t_max < t_min:
+        raise ValueError('두께 범위가 올바르지 않습니다.')
+    if diameter_range[0] <= 0 or diameter_range[1] < diameter_range[0]:
+        raise ValueError('지름 범위가 올바르지 않습니다.')
+    # 간격이 0이면 격자 크기를 계산할 때 0으로 나누게 되고, 음수면 격자가 비거나 거꾸로 만들어짐
+    if not thickness_step > 0:
+        raise ValueError('두께 간격은 0보다 커야 합니다.')
+    if not diameter_step > 0:
+        raise ValueError('지름 간격은 0보다 커야 합니다.')
+    thicknesses = t_min + thickness_step * np.arange(
+        int(math.floor((t_max - t_min) / thickness_step + 1e-9)) + 1)
+
+    tasks = plan_tasks(min_area, max_weight, codes, thicknesses,
+                       diameter_range, diameter_step, chunk_size)
+    if not tasks:
+        return np.empty(0, dtype=DESIGN_DTYPE)
+
+    if workers == 1 or len(tasks) == 1:
+        results = [_evaluate_chunk(task) for task in tasks]
+    else:
+        with multiprocessing.Pool(workers) as pool:
+            results = pool.map(_evaluate_chunk, tasks)
+
+    return pareto_front(np.concatenate(results))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='최소 무게 돔 설계 탐색')
+    parser.add_argument('--min-area', type=float, default=0.0, help='최소 표면적 (m²)')
+    parser.add_argument('--max-weight', type=float, default=math.inf,
+                        help='화성 기준 최대 무게 (kg)')
+    parser.add_argument('--material', action='append',
+                        help=f'사용할 재질 (여러 번 지정 가능, 기본값: {", ".join(MATERIAL_NAMES)}, '
+                             f'적재물 목록의 물질 이름도 가능)')
+    parser.add_argument('--thickness', type=float, nargs=2, default=(1.0, 1.0),
+                        metavar=('MIN', 'MAX'), help='두께 범위 (cm)')
+    parser.add_argument('--thickness-step', type=float, default=1.0, help='두께 간격 (cm)')
+    parser.add_argument('--diameter', type=float, nargs=2, default=(0.1, 100.0),
+                        metavar=('MIN', 'MAX'), help='지름 범위 (m)')
+    parser.add_argument('--diameter-step', type=float, default=0.1, help='지름 간격 (m)')
+    parser.add_argument('--workers', type=int, default=None, help='프로세스 수')
+    parser.add_argument('--limit', type=int, default=20, help='출력할 최대 설계 수')
+    args = parser.parse_args(argv)
+
+    try:
+        front = optimize_domes(args.min_area, args.max_weight, args.material,
+                               tuple(args.thickness), args.thickness_step,
+                               tuple(args.diameter), args.diameter_step, args.workers)
+    except Exception as e:
+        print(f'오류 발생: {e}')
+        return
+
+    print('=== 파레토 최적 돔 설계 ===\n')
+    if len(front) == 0:
+        print('조건을 만족하는 설계가 없습니다.')
+        return
+
+    names = get_materials().names
+    for design in front[:args.limit]:
+        print(f'재질 ⇒ {names[design["material"]]}, '
+              f'지름 ⇒ {design["diameter"]:.3f}, 두께 ⇒ {design["thickness"]:.3f}, '
+              f'면적 ⇒ {design["area"]:.3f}, 무게 ⇒ {design["weight"]:.3f} kg')
+    print(f'\n파레토 설계 수: {len(front)}')
+
+
+if __name__ == '__main__':
+    main()
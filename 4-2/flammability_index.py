@@ -0,0 +1,204 @@
+# flammability_index.py
+# 목적: 인화성 지수로 정렬된 색인 파일을 만들어 두고,
+#       기준값을 바꿔 가며 여러 번 조회할 때 CSV를 다시 읽거나 정렬하지 않도록 하는 모듈.
+#
+# [동작 방식]
+# - CSV 옆에 바이너리 색인 파일(.flam.npz)을 저장
+#   (인화성 내림차순으로 정렬된 인화성 배열 + 이름 배열 + 원래 순서)
+# - CSV는 mars_inventory_manager.iter_inventory()로 읽고, 파일 저장/검사는
+#   material_catalog의 스냅숏 함수(save_snapshot / load_snapshot)를 함께 사용
+# - CSV의 수정 시각이나 크기가 바뀌면 색인을 자동으로 다시 만듦
+# - 조회는 이진 탐색(np.searchsorted)으로 경계를 찾고 그 구간만 잘라내므로 O(log n + k)
+#   · at_least(x): 인화성 >= x 인 항목
+#   · between(low, high): low <= 인화성 <= high 인 항목
+#   · top(n): 인화성이 가장 높은 n개
+# - 인화성 값이 'Various'처럼 숫자가 아니거나 'nan'/'inf'처럼 유한한 수가 아닌 줄은
+#   색인에 넣지 않고 별도 목록(unparsed)에 보관해서 함께 보고
+
+import argparse
+import math
+import os
+
+import numpy as np
+
+from mars_inventory_manager import DANGER_THRESHOLD, input_file, iter_inventory, \
+    save_dangerous_items
+from material_catalog import load_snapshot, save_snapshot
+
+# 색인 파일 형식 버전
+INDEX_VERSION = 2
+
+
+def index_path(csv_filename):
+    """CSV 옆에 둘 색인 파일 경로 (예: xxx.csv → xxx.csv.flam.npz)"""
+    return csv_filename + '.flam.npz'
+
+
+class FlammabilityIndex:
+    """
+    인화성 내림차순으로 정렬된 적재물 색인
+
+    - 인화성이 같으면 CSV에서 먼저 나온 항목이 앞에 옴
+    - 이진 탐색을 위해 인화성에 -를 붙인 오름차순 배열(keys)을 함께 보관
+    """
+
+    def __init__(self, names, flammability, rows, unparsed_names, unparsed_values,
+                 mtime_ns, size):
+        self.names = names                    # 이름 배열 (인화성 내림차순)
+        self.flammability = flammability      # float64 배열 (내림차순)
+        self.rows = rows                      # 색인에 들어간(유한한 수) 항목 중 CSV에서의 순서 (0부터)
+        self.unparsed_names = unparsed_names  # 인화성이 숫자가 아니거나 nan/inf인 항목 이름
+        self.unparsed_values = unparsed_values  # 그 항목의 원래 인화성 문자열
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.keys = -flammability             # 오름차순 (이진 탐색용)
+
+    def __len__(self):
+        return len(self.names)
+
+    @classmethod
+    def build(cls, csv_filename):
+        """
+        CSV를 한 번 읽어 색인을 만드는 함수
+        (mars_inventory_manager.iter_inventory()로 읽으므로 줄을 나누는 규칙이 같음)
+        """
+        stat = os.stat(csv_filename)
+        unparsed = []
+        items = []
+        for name, value in iter_inventory(csv_filename, verbose=False, unparsed=unparsed):
+            if math.isfinite(value):
+                items.append((name, value))
+            else:
+                # 'nan'도 float()로 읽히지만 정렬/비교할 수 없으므로 색인에서 뺌
+                # (CSV 순서를 유지하도록 읽는 도중에 같은 목록에 추가)
+                unparsed.append((name, str(value)))
+
+        names = np.array([name for name, _ in items], dtype=str)
+        flammability = np.array([value for _, value in items], dtype=np.float64)
+        # 안정 정렬로 -인화성 오름차순(= 인화성 내림차순) 순서를 구함
+        order = np.argsort(-flammability, kind='stable')
+
+        return cls(names[order],
+                   flammability[order],
+                   order.astype(np.int64),
+                   np.array([name for name, _ in unparsed], dtype=str),
+                   np.array([value for _, value in unparsed], dtype=str),
+                   stat.st_mtime_ns, stat.st_size)
+
+    def save(self, filename):
+        """색인을 바이너리 파일로 저장하는 함수"""
+        save_snapshot(filename, INDEX_VERSION,
+                      names=self.names,
+                      flammability=self.flammability,
+                      rows=self.rows,
+                      unparsed_names=self.unparsed_names,
+                      unparsed_values=self.unparsed_values,
+                      mtime_ns=self.mtime_ns,
+                      size=self.size)
+
+    @classmethod
+    def load(cls, filename, stat=None):
+        """
+        바이너리 색인 파일을 읽어오는 함수
+        (stat을 주면 원본 CSV가 바뀐 색인은 ValueError)
+        """
+        data = load_snapshot(filename, INDEX_VERSION, stat)
+        return cls(data['names'], data['flammability'], data['rows'],
+                   data['unparsed_names'], data['unparsed_values'],
+                   int(data['mtime_ns']), int(data['size']))
+
+    def _items(self, start, stop):
+        """[start, stop) 구간을 [{'name': 이름, 'flammability': 인화성}, ...]로 만드는 함수"""
+        return [{'name': str(name), 'flammability': float(value)}
+                for name, value in zip(self.names[start:stop],
+                                       self.flammability[start:stop])]
+
+    def at_least(self, threshold):
+        """인화성 >= threshold 인 항목 (인화성 내림차순)"""
+        stop = int(np.searchsorted(self.keys, -threshold, side='right'))
+        return self._items(0, stop)
+
+    def between(self, low, high):
+        """low <= 인화성 <= high 인 항목 (인화성 내림차순)"""
+        start = int(np.searchsorted(self.keys, -high, side='left'))
+        stop = int(np.searchsorted(self.keys, -low, side='right'))
+        return self._items(start, max(start, stop))
+
+    def top(self, count):
+        """인화성이 가장 높은 count개 (인화성 내림차순)"""
+        return self._items(0, max(0, count))
+
+    def unparsed(self):
+        """인화성 값이 숫자가 아니거나 nan/inf여서 색인에서 빠진 항목 목록 (CSV 순서)"""
+        return [{'name': str(name), 'value': str(value)}
+                for name, value in zip(self.unparsed_names, self.unparsed_values)]
+
+
+def load_index(csv_filename=input_file):
+    """
+    색인을 돌려주는 함수
+    색인 파일이 없거나, CSV의 수정 시각/크기가 색인과 다르면 새로 만들어 저장함
+    """
+    stat = os.stat(csv_filename)
+    filename = index_path(csv_filename)
+
+    try:
+        return FlammabilityIndex.load(filename, stat)
+    except (OSError, ValueError, KeyError):
+        # 색인 파일이 없거나 깨졌거나 형식이 다르거나 CSV가 바뀐 경우
+        pass
+
+    index = FlammabilityIndex.build(csv_filename)
+    try:
+        index.save(filename)
+    except OSError:
+        # 저장할 수 없는 위치라도 조회는 계속 진행
+        pass
+    return index
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='인화성 지수 색인 조회')
+    parser.add_argument('--csv', default=input_file, help='입력 CSV 파일 경로')
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument('--min', type=float, default=None, help='인화성 >= MIN 인 항목')
+    group.add_argument('--range', type=float, nargs=2, metavar=('LOW', 'HIGH'),
+                       help='LOW <= 인화성 <= HIGH 인 항목')
+    group.add_argument('--top', type=int, help='인화성이 가장 높은 N개')
+    parser.add_argument('--output', help='결과를 저장할 CSV 파일 경로')
+    args = parser.parse_args(argv)
+
+    try:
+        index = load_index(args.csv)
+    except FileNotFoundError:
+        print(f'오류: {args.csv} 파일을 찾을 수 없습니다.')
+        return
+    except Exception as e:
+        print(f'오류 발생: {e}')
+        return
+
+    if args.range:
+        items = index.between(*args.range)
+    elif args.top is not None:
+        items = index.top(args.top)
+    else:
+        items = index.at_least(DANGER_THRESHOLD if args.min is None else args.min)
+
+    print('Substance,Flammability')
+    for item in items:
+        print(f'{item["name"]},{item["flammability"]}')
+    print(f'\n조회 결과: {len(items)}건')
+
+    unparsed = index.unparsed()
+    if unparsed:
+        print('\n[주의] 인화성 값이 숫자가 아닌 항목:')
+        for item in unparsed:
+            print(f'{item["name"]},{item["value"]}')
+
+    if args.output:
+        save_dangerous_items(items, args.output)
+        print(f'\n결과가 {args.output}에 저장되었습니다.')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,207 @@
+# inventory_columns.py
+# 목적: 적재물 CSV 전체를 열(column) 단위의 NumPy 배열로 한 번에 읽어서
+#       필터링과 정렬을 반복문 없이 배열 연산으로 처리하는 모듈.
+#
+# [mars_inventory_manager.py 방식과의 차이]
+# - line.split(',') 대신 csv 모듈 사용 → "Acid, Sulfuric"처럼 따옴표 안의 쉼표도 올바르게 처리
+# - 줄마다 float()를 부르지 않고, 열 전체를 한 번에 변환
+#   (서로 다른 문자열 값만 골라 변환하므로 'Various'처럼 반복되는 값은 한 번만 처리)
+# - 숫자가 아닌 값은 건너뛰지 않고 NaN으로 저장하고, 별도의 마스크(True = 값 없음)로 표시
+# - Strength('Very weak', 'High' ...)는 작은 정수 코드 + 범주 목록으로 저장
+
+import csv
+
+import numpy as np
+
+from mars_inventory_manager import DANGER_THRESHOLD
+
+# 열 종류
+TEXT = 'text'           # 문자열 배열
+FLOAT = 'float'         # float64 배열 + 마스크
+CATEGORY = 'category'   # 정수 코드 배열 + 범주 목록
+
+# 적재물 CSV의 열 구성 (열 이름, 종류)
+INVENTORY_SCHEMA = [
+    ('Substance', TEXT),
+    ('Weight (g/cm³)', FLOAT),
+    ('Specific Gravity', FLOAT),
+    ('Strength', CATEGORY),
+    ('Flammability', FLOAT)
+]
+
+# 범주형 열에서 값이 없다고 볼 문자열 (코드 -1로 저장)
+MISSING_CATEGORIES = ('', 'Various')
+
+
+def to_float_column(values):
+    """
+    문자열 배열을 float64 배열과 마스크로 바꾸는 함수
+
+    Returns:
+    - tuple: (float64 배열, 마스크 배열) - 숫자가 아닌 값은 NaN, 마스크는 True
+    """
+    values = np.asarray(values, dtype=str)
+    try:
+        # 모두 숫자라면 한 번에 변환
+        data = values.astype(np.float64)
+    except ValueError:
+        # 숫자가 아닌 값이 섞여 있으면 서로 다른 값만 하나씩 변환한 뒤 다시 펼침
+        unique_values, inverse = np.unique(values, return_inverse=True)
+        converted = np.empty(len(unique_values), dtype=np.float64)
+        for i, text in enumerate(unique_values):
+            try:
+                converted[i] = float(text)
+            except ValueError:
+                converted[i] = np.nan
+        data = converted[inverse].reshape(values.shape)
+    return data, np.isnan(data)
+
+
+def to_category_column(values):
+    """
+    문자열 배열을 정수 코드 배열과 범주 목록으로 바꾸는 함수
+    MISSING_CATEGORIES에 해당하는 값은 코드 -1
+
+    Returns:
+    - tuple: (int16 코드 배열, 범주 목록)
+    """
+    values = np.char.strip(np.asarray(values, dtype=str))
+    unique_values, inverse = np.unique(values, return_inverse=True)
+
+    categories = []
+    unique_codes = np.empty(len(unique_values), dtype=np.int16)
+    for i, text in enumerate(unique_values):
+        if text in MISSING_CATEGORIES:
+            unique_codes[i] = -1
+        else:
+            unique_codes[i] = len(categories)
+            categories.append(str(text))
+    return unique_codes[inverse].reshape(values.shape), categories
+
+
+class InventoryTable:
+    """
+    열 단위로 저장된 적재물 표
+
+    - columns[열 이름]: NumPy 배열 (문자열, float64, 또는 정수 코드)
+    - masks[열 이름]: FLOAT 열의 값 없음 표시 (True = 숫자가 아니었음)
+    - categories[열 이름]: CATEGORY 열의 코드 → 문자열 목록
+    """
+
+    def __init__(self, columns, masks, categories, schema=INVENTORY_SCHEMA):
+        self.columns = columns
+        self.masks = masks
+        self.categories = categories
+        self.schema = schema
+
+    def __len__(self):
+        first = self.schema[0][0]
+        return len(self.columns[first])
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def take(self, index):
+        """
+        index(정수 위치 배열 또는 불리언 배열)에 해당하는 행만 남긴 새 표를 돌려주는 함수
+        """
+        return InventoryTable({name: column[index] for name, column in self.columns.items()},
+                              {name: mask[index] for name, mask in self.masks.items()},
+                              self.categories, self.schema)
+
+    def sort_by(self, name, descending=True):
+        """
+        name 열 기준으로 정렬한 새 표를 돌려주는 함수
+
+        - 같은 값이면 원래 순서를 유지 (안정 정렬)
+        - 값이 없는(NaN) 행은 항상 맨 뒤
+        """
+        column = self.columns[name]
+        if descending and column.dtype.kind in 'fiu':
+            # 부호를 바꿔 오름차순 안정 정렬 = 내림차순 안정 정렬 (NaN은 그대로 맨 뒤)
+            order = np.argsort(-column, kind='stable')
+        elif descending:
+            # 문자열 등은 부호를 바꿀 수 없으므로 정렬 순위(np.unique의 inverse)로 바꾼 뒤
+            # 순위에 -를 붙여 안정 정렬 (order[::-1]로 뒤집으면 같은 값끼리의 순서도 뒤집힘)
+            _, ranks = np.unique(column, return_inverse=True)
+            order = np.argsort(-ranks.reshape(column.shape), kind='stable')
+        else:
+            order = np.argsort(column, kind='stable')
+        return self.take(order)
+
+    def where(self, name, low=None, high=None):
+        """
+        low <= name 열의 값 <= high 인 행만 남긴 새 표 (값이 없는 행은 제외)
+        """
+        column = self.columns[name]
+        keep = ~self.masks[name] if name in self.masks else np.ones(len(column), dtype=bool)
+        if low is not None:
+            keep &= column >= low
+        if high is not None:
+            keep &= column <= high
+        return self.take(keep)
+
+    def category_labels(self, name):
+        """CATEGORY 열을 문자열 배열로 되돌리는 함수 (값 없음은 빈 문자열)"""
+        labels = np.array(self.categories[name] + [''], dtype=str)
+        # 코드 -1은 마지막에 붙인 빈 문자열을 가리킴
+        return labels[self.columns[name]]
+
+    def dangerous(self, threshold=DANGER_THRESHOLD, name='Flammability'):
+        """
+        인화성 >= threshold 인 행만 인화성 내림차순으로 정렬한 새 표
+        (mars_inventory_manager.find_dangerous_items()와 같은 순서)
+        """
+        return self.where(name, low=threshold).sort_by(name, descending=True)
+
+    def to_items(self, name_column='Substance', value_column='Flammability'):
+        """[{'name': 이름, 'flammability': 값}, ...] 형태로 바꾸는 함수"""
+        return [{'name': str(name), 'flammability': float(value)}
+                for name, value in zip(self.columns[name_column],
+                                       self.columns[value_column])]
+
+
+def load_inventory(filename, schema=INVENTORY_SCHEMA):
+    """
+    적재물 CSV를 한 번 읽어 InventoryTable로 만드는 함수
+
+    Parameters:
+    - filename (str): CSV 파일 경로 (첫 줄은 헤더)
+    - schema (list): (열 이름, 종류) 목록 - 헤더에서 이름으로 열을 찾음
+
+    Returns:
+    - InventoryTable
+
+    [예외]
+    ValueError: schema의 열이 헤더에 없을 때
+    """
+    with open(filename, 'r', encoding='utf-8-sig', newline='') as file:
+        reader = csv.reader(file)
+        header = [name.strip() for name in next(reader, [])]
+
+        positions = []
+        for name, _ in schema:
+            if name not in header:
+                raise ValueError(f"'{name}' 열이 없습니다.")
+            positions.append(header.index(name))
+
+        # 열별 문자열 목록에 한 번에 모음 (행마다 딕셔너리를 만들지 않음)
+        raw = [[] for _ in schema]
+        for row in reader:
+            if not row or not ''.join(row).strip():
+                continue
+            for values, position in zip(raw, positions):
+                values.append(row[position].strip() if position < len(row) else '')
+
+    columns = {}
+    masks = {}
+    categories = {}
+    for (name, kind), values in zip(schema, raw):
+        if kind == FLOAT:
+            columns[name], masks[name] = to_float_column(values)
+        elif kind == CATEGORY:
+            columns[name], categories[name] = to_category_column(values)
+        else:
+            columns[name] = np.array(values, dtype=str)
+
+    return InventoryTable(columns, masks, categories, schema)
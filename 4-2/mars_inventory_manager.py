@@ -2,96 +2,342 @@
 # 목적: CSV 파일에서 적재물 목록을 읽고,
 #       인화성 지수 기준으로 정렬하고,
 #       위험 물품(인화성 >= 0.7)을 별도로 저장하는 프로그램.
+#
+# [동작 방식]
+# - 파일 전체를 readlines()로 읽지 않고 한 줄씩 읽으면서 바로 필터링
+# - 위험 물품만 힙(heapq)에 넣어 정렬 순서를 유지
+#   → 전체 항목을 정렬하지 않으므로 O(n log k) (k: 위험 물품 수)
+# - top_k를 지정하면 힙 크기를 k개로 제한해서 메모리 사용량도 일정하게 유지
+# - 다른 파일에서 import해서 find_dangerous_items()를 사용할 수 있음
+# - 여러 모듈의 적재물 CSV를 프로세스 풀로 동시에 처리해 하나의 보고서로 합칠 수 있음
+#   (merge_manifests(), 명령줄 옵션 --manifests)
 
-# ========== 파일 이름 설정 ==========
+# argparse: 명령줄 옵션(--manifests 등)을 처리하는 내장 모듈
+# glob: '*.csv' 같은 패턴으로 파일 목록을 찾는 내장 모듈
+# heapq: 항상 가장 작은 값을 빠르게 꺼낼 수 있는 힙 자료구조 (파이썬 내장 모듈)
+# multiprocessing: 여러 프로세스(CPU 코어)로 작업을 나누는 내장 모듈
+import argparse
+import glob
+import heapq
+import multiprocessing
+import os
+
+# ========== 파일 이름 및 기준 설정 ==========
 input_file = 'Mars_Base_Inventory_List.csv'     # 입력 CSV 파일 이름
 output_file = 'Mars_Base_Inventory_danger.csv'  # 결과를 저장할 CSV 파일 이름
+DANGER_THRESHOLD = 0.7                          # 위험 물품 기준 인화성 지수
+
+# 적재물 목록 CSV의 헤더 (이 헤더를 가진 파일만 --manifests 입력으로 사용)
+MANIFEST_COLUMNS = ('Substance', 'Weight (g/cm³)', 'Specific Gravity', 'Strength',
+                    'Flammability')
+
+
+def iter_inventory(filename, echo=False, verbose=True, unparsed=None):
+    """
+    CSV 파일을 한 줄씩 읽으며 (물질 이름, 인화성 지수)를 하나씩 돌려주는 제너레이터
 
-print('=== Mars 기지 적재물 목록 ===\n')
+    Parameters:
+    - filename (str): 입력 CSV 파일 경로 (첫 줄은 헤더)
+    - echo (bool): True면 읽은 원본 줄을 화면에 출력
+    - verbose (bool): True면 인화성 값이 숫자가 아닌 항목을 알림
+    - unparsed (list): 주면 인화성 값이 숫자가 아니어서 건너뛴 항목을
+                       (이름, 원래 값 문자열)로 이 목록에 추가
 
-try:
-    # ========== 1단계: 파일 읽기 ==========
+    Yields:
+    - tuple: (name, flammability)
+    """
     # open(): 파일을 여는 함수
     # 'r' -> 읽기 모드
     # encoding='utf-8': 한글 깨짐 방지
-    with open(input_file, 'r', encoding='utf-8') as file:
-        lines = file.readlines()   # 전체 줄을 리스트 형태로 읽어오기
-    
-    # 원본 내용 출력
-    for line in lines:
-        print(line.strip())   # strip(): 양쪽 공백과 줄바꿈 제거
-    
-    print('\n=== CSV 파싱 시작 ===\n')
-    
-    # 결과를 저장할 리스트
-    inventory_list = []
-    
-    # 첫 번째 줄은 헤더 (컬럼 이름들)
-    header = lines[0].strip().split(',')
-    
-    # ========== 2단계: CSV 파싱 ==========
-    # 1번째 줄부터 끝까지 순회
-    for i in range(1, len(lines)):
-        line = lines[i].strip()  # 공백 제거
-        if not line:             # 빈 줄이면 건너뜀
-            continue
-        
-        # 쉼표(,)로 데이터 분리
-        items = line.split(',')
-        
-        # 인화성 값 추출 (CSV의 마지막 열이 항상 인화성 값)
-        try:
-            flammability_value = float(items[-1])  # 문자열 → 실수(float) 변환
-        except ValueError:
-            # 'Various' 같은 경우 숫자가 아니므로 건너뜀
-            print(f"[주의] '{items[0]}' 항목은 인화성 값이 숫자가 아니어서 제외됩니다.")
+    with open(filename, 'r', encoding='utf-8') as file:
+        # 첫 번째 줄은 헤더 (컬럼 이름들)
+        header = file.readline()
+        if echo:
+            print(header.strip())
+
+        # for line in file: 한 줄씩만 읽어오므로 파일이 커도 메모리 사용량이 일정함
+        for line in file:
+            line = line.strip()  # 공백 제거
+            if echo:
+                print(line)
+            if not line:         # 빈 줄이면 건너뜀
+                continue
+
+            # 쉼표(,)로 데이터 분리
+            items = line.split(',')
+
+            # 인화성 값 추출 (CSV의 마지막 열이 항상 인화성 값)
+            try:
+                flammability_value = float(items[-1])  # 문자열 → 실수(float) 변환
+            except ValueError:
+                # 'Various' 같은 경우 숫자가 아니므로 건너뜀
+                if verbose:
+                    print(f"[주의] '{items[0]}' 항목은 인화성 값이 숫자가 아니어서 제외됩니다.")
+                if unparsed is not None:
+                    unparsed.append((items[0], items[-1]))
+                continue
+
+            yield items[0], flammability_value
+
+
+def select_dangerous(items, threshold=DANGER_THRESHOLD, top_k=None):
+    """
+    (이름, 인화성) 목록에서 위험 물품만 골라 인화성 내림차순으로 돌려주는 함수
+
+    - 읽는 즉시 기준 미만 항목은 버리고, 위험 물품만 힙에 넣음
+    - 인화성이 같으면 먼저 나온 항목이 앞에 옴 (sorted()의 결과와 같은 순서)
+
+    Parameters:
+    - items (iterable): (name, flammability) 튜플들
+    - threshold (float): 위험 물품 기준 (이 값 이상이면 위험)
+    - top_k (int): 인화성이 가장 높은 k개만 남김 (None이면 전부)
+
+    Returns:
+    - list: [{'name': 이름, 'flammability': 인화성}, ...]
+    """
+    heap = []
+
+    for index, (name, flammability) in enumerate(items):
+        # 'nan' 같은 값은 어떤 비교도 False이므로 '기준 미만' 대신 '기준 이상이 아님'으로 거름
+        if not flammability >= threshold:
             continue
-        
-        # 딕셔너리 형태로 저장 (이름과 인화성 값만 관리)
-        inventory_list.append({
-            'name': items[0],                         # 물질 이름
-            'flammability': flammability_value        # 인화성 지수 (실수)
-        })
-    
-    print(f'총 {len(inventory_list)}개의 항목이 파싱되었습니다.\n')
-    
-    # ========== 3단계: 인화성 지수 기준 정렬 ==========
-    # sorted(): 리스트 정렬
-    # key=lambda x: x['flammability'] → 인화성 지수를 기준으로 정렬
-    # reverse=True → 내림차순 정렬
-    sorted_inventory = sorted(
-        inventory_list, 
-        key=lambda x: x['flammability'], 
-        reverse=True
-    )
-    
-    print('=== 인화성 지수 기준 정렬 완료 ===\n')
-    
-    # ========== 4단계: 위험 물품 필터링 ==========
-    # 리스트 컴프리헨션 사용 → 조건 맞는 항목만 추출
-    # 조건: 인화성 지수가 0.7 이상
-    dangerous_items = [item for item in sorted_inventory if item['flammability'] >= 0.7]
-    
-    print('=== 위험 물품 목록 (인화성 지수 >= 0.7) ===\n')
-    print('Substance,Flammability')  # 출력 헤더
-    
-    # 위험 항목 출력
-    for item in dangerous_items:
-        print(f'{item["name"]},{item["flammability"]}')
-    
-    # ========== 5단계: 결과 파일 저장 ==========
+
+        if top_k is None:
+            # 최소 힙이므로 인화성에 -를 붙여 가장 높은 값이 먼저 나오게 함
+            # index: 인화성이 같을 때 먼저 나온 항목이 앞에 오도록 하기 위한 값
+            heapq.heappush(heap, (-flammability, index, name))
+        elif top_k > 0:
+            # 크기 k의 최소 힙: 맨 위에는 지금까지의 k개 중 가장 덜 위험한 항목이 있음
+            entry = (flammability, -index, name)
+            if len(heap) < top_k:
+                heapq.heappush(heap, entry)
+            elif entry > heap[0]:
+                heapq.heapreplace(heap, entry)
+
+    if top_k is None:
+        ordered = [heapq.heappop(heap) for _ in range(len(heap))]
+        return [{'name': name, 'flammability': -negative}
+                for negative, _, name in ordered]
+
+    ordered = sorted(heap, reverse=True)
+    return [{'name': name, 'flammability': flammability}
+            for flammability, _, name in ordered]
+
+
+def save_dangerous_items(dangerous_items, filename):
+    """위험 물품 목록을 CSV 파일로 저장하는 함수"""
     # 'w' -> 쓰기 모드, 기존 파일 있으면 내용 덮어쓰기
-    with open(output_file, 'w', encoding='utf-8') as f:
+    with open(filename, 'w', encoding='utf-8') as f:
         f.write('Substance,Flammability\n')   # 헤더 작성
         for item in dangerous_items:
             f.write(f'{item["name"]},{item["flammability"]}\n')
-    
-    print(f'\n위험 물품 목록이 {output_file}에 저장되었습니다.')
-
-# ========== 예외 처리 ==========
-# 파일을 못 찾았을 경우
-except FileNotFoundError:
-    print(f'오류: {input_file} 파일을 찾을 수 없습니다.')
-# 그 외 모든 오류 처리
-except Exception as e:
-    print(f'오류 발생: {e}')
+
+
+def find_dangerous_items(filename, threshold=DANGER_THRESHOLD, output_filename=None,
+                         top_k=None, verbose=False):
+    """
+    CSV 파일을 스트리밍으로 읽어 위험 물품 목록을 만들고, 필요하면 파일로 저장하는 함수
+
+    Parameters:
+    - filename (str): 입력 CSV 파일 경로
+    - threshold (float): 위험 물품 기준 인화성 지수
+    - output_filename (str): 결과를 저장할 CSV 파일 경로 (None이면 저장하지 않음)
+    - top_k (int): 인화성이 가장 높은 k개만 남김 (None이면 전부)
+    - verbose (bool): True면 숫자가 아닌 인화성 값을 알림
+
+    Returns:
+    - list: 인화성 내림차순 [{'name': 이름, 'flammability': 인화성}, ...]
+    """
+    dangerous_items = select_dangerous(iter_inventory(filename, verbose=verbose),
+                                       threshold, top_k)
+    if output_filename is not None:
+        save_dangerous_items(dangerous_items, output_filename)
+    return dangerous_items
+
+
+def is_manifest(filename):
+    """
+    적재물 CSV인지 헤더로 확인하는 함수
+
+    헤더가 MANIFEST_COLUMNS와 같은 파일만 적재물 목록으로 봄
+    (위험 물품 보고서 'Substance,Flammability'처럼 첫 열과 마지막 열만 같은 파일은 제외
+     → 같은 폴더에 있는 보고서를 입력으로 다시 읽어 항목이 두 번 세어지는 것을 막음)
+    """
+    try:
+        with open(filename, 'r', encoding='utf-8-sig') as file:
+            columns = tuple(column.strip() for column in file.readline().split(','))
+    except (OSError, UnicodeDecodeError):
+        return False
+    return columns == MANIFEST_COLUMNS
+
+
+def find_manifests(pattern, exclude=None):
+    """
+    폴더 경로 또는 glob 패턴으로 적재물 CSV 파일 목록을 찾는 함수
+
+    - 폴더를 주면 그 안의 모든 *.csv 파일
+    - exclude: 목록에서 뺄 파일 (예: 같은 폴더에 저장할 결과 파일)
+    - 헤더가 적재물 형식이 아닌 CSV(예: 부품 강도 파일, 위험 물품 보고서)는 경고를 출력하고 뺌
+    - 파일 순서를 일정하게 하기 위해 이름순으로 정렬
+    """
+    if os.path.isdir(pattern):
+        pattern = os.path.join(pattern, '*.csv')
+    filenames = sorted(glob.glob(pattern))
+    if exclude is not None:
+        excluded = os.path.abspath(exclude)
+        filenames = [name for name in filenames if os.path.abspath(name) != excluded]
+
+    manifests = []
+    for name in filenames:
+        if is_manifest(name):
+            manifests.append(name)
+        else:
+            print(f"[주의] '{name}'은(는) 적재물 목록 헤더({','.join(MANIFEST_COLUMNS)})가 "
+                  f"아니어서 제외됩니다.")
+    return manifests
+
+
+def _dangerous_subset(task):
+    """
+    파일 하나의 위험 물품만 골라 (인화성, 이름) 목록으로 돌려주는 함수 (작업 프로세스에서 실행)
+
+    딕셔너리 대신 튜플로 돌려주어 프로세스 사이로 보내는 데이터를 줄임
+    이미 인화성 내림차순으로 정렬되어 있으므로 합칠 때 다시 정렬할 필요가 없음
+    """
+    filename, threshold = task
+    return [(item['flammability'], item['name'])
+            for item in find_dangerous_items(filename, threshold)]
+
+
+def merge_manifests(filenames, threshold=DANGER_THRESHOLD, output_filename=output_file,
+                    workers=None):
+    """
+    여러 적재물 CSV를 동시에 처리해서 하나의 위험 물품 보고서로 합치는 함수
+
+    1. 프로세스 풀에서 파일마다 위험 물품을 골라 정렬된 목록을 만듦
+    2. heapq.merge()로 정렬된 목록들을 k-way 병합 (전체를 다시 정렬하지 않음)
+    3. 'Substance,Flammability,Source' 형식으로 저장 (Source: 원본 파일 이름)
+
+    - 인화성이 같으면 파일 목록 순서, 같은 파일 안에서는 원래 순서를 유지
+
+    Parameters:
+    - filenames (list): 입력 CSV 파일 경로들
+    - threshold (float): 위험 물품 기준 인화성 지수
+    - output_filename (str): 결과를 저장할 CSV 파일 경로
+    - workers (int): 프로세스 수 (None이면 CPU 코어 수, 1이면 현재 프로세스에서 처리)
+
+    Returns:
+    - int: 저장한 위험 물품 수
+    """
+    tasks = [(filename, threshold) for filename in filenames]
+    if workers == 1 or len(tasks) <= 1:
+        subsets = [_dangerous_subset(task) for task in tasks]
+    else:
+        with multiprocessing.Pool(workers) as pool:
+            subsets = pool.map(_dangerous_subset, tasks)
+
+    # 각 목록에 원본 파일 이름을 붙여서 병합
+    def tagged(subset, source):
+        for flammability, name in subset:
+            yield flammability, name, source
+
+    sources = [os.path.basename(filename) for filename in filenames]
+    merged = heapq.merge(*(tagged(subset, source) for subset, source in zip(subsets, sources)),
+                         key=lambda item: -item[0])
+
+    count = 0
+    with open(output_filename, 'w', encoding='utf-8') as f:
+        f.write('Substance,Flammability,Source\n')
+        for flammability, name, source in merged:
+            f.write(f'{name},{flammability},{source}\n')
+            count += 1
+    return count
+
+
+def parse_args(argv=None):
+    """
+    명령줄 옵션을 해석하는 함수
+
+    사용 예시:
+    python mars_inventory_manager.py                                # 기존 방식 (파일 하나)
+    python mars_inventory_manager.py --manifests 'manifests/*.csv'  # 여러 파일을 합친 보고서
+    """
+    parser = argparse.ArgumentParser(description='Mars 기지 적재물 위험 물품 분석')
+    parser.add_argument('--manifests', metavar='GLOB|DIR',
+                        help='여러 적재물 CSV를 찾을 glob 패턴 또는 폴더')
+    parser.add_argument('--threshold', type=float, default=DANGER_THRESHOLD,
+                        help='위험 물품 기준 인화성 지수')
+    parser.add_argument('--output', default=output_file, help='결과를 저장할 CSV 파일')
+    parser.add_argument('--workers', type=int, default=None, help='프로세스 수')
+    return parser.parse_args(argv)
+
+
+def main_manifests(args):
+    """--manifests 옵션으로 실행했을 때의 처리"""
+    # 결과 파일이 입력 패턴에 함께 잡히더라도 입력에서 제외
+    filenames = find_manifests(args.manifests, exclude=args.output)
+    if not filenames:
+        print(f'오류: {args.manifests}에 해당하는 파일이 없습니다.')
+        return
+
+    try:
+        count = merge_manifests(filenames, args.threshold, args.output, args.workers)
+        print(f'입력 파일 {len(filenames)}개에서 위험 물품 {count}건을 찾았습니다.')
+        print(f'위험 물품 목록이 {args.output}에 저장되었습니다.')
+    except FileNotFoundError as e:
+        print(f'오류: {e.filename} 파일을 찾을 수 없습니다.')
+    except Exception as e:
+        print(f'오류 발생: {e}')
+
+
+def main(threshold=DANGER_THRESHOLD, output_filename=output_file):
+    print('=== Mars 기지 적재물 목록 ===\n')
+
+    try:
+        # 파싱된 항목 수를 세는 변수 (아래 counted() 안에서 값을 바꾸기 위해 딕셔너리 사용)
+        parsed = {'count': 0}
+
+        def counted(items):
+            """항목 수를 세면서 그대로 넘겨주는 제너레이터"""
+            for item in items:
+                parsed['count'] += 1
+                yield item
+
+        # ========== 1~4단계: 파일 읽기 + CSV 파싱 + 위험 물품 필터링 ==========
+        # 원본 줄을 출력하면서 동시에 파싱하고, 위험 물품만 힙으로 정렬
+        items = counted(iter_inventory(input_file, echo=True))
+        dangerous_items = select_dangerous(items, threshold)
+
+        print('\n=== CSV 파싱 완료 ===\n')
+        print(f'총 {parsed["count"]}개의 항목이 파싱되었습니다.\n')
+        print('=== 인화성 지수 기준 정렬 완료 ===\n')
+
+        print(f'=== 위험 물품 목록 (인화성 지수 >= {threshold}) ===\n')
+        print('Substance,Flammability')  # 출력 헤더
+
+        # 위험 항목 출력
+        for item in dangerous_items:
+            print(f'{item["name"]},{item["flammability"]}')
+
+        # ========== 5단계: 결과 파일 저장 ==========
+        save_dangerous_items(dangerous_items, output_filename)
+
+        print(f'\n위험 물품 목록이 {output_filename}에 저장되었습니다.')
+
+    # ========== 예외 처리 ==========
+    # 파일을 못 찾았을 경우
+    except FileNotFoundError:
+        print(f'오류: {input_file} 파일을 찾을 수 없습니다.')
+    # 그 외 모든 오류 처리
+    except Exception as e:
+        print(f'오류 발생: {e}')
+
+
+# 이 파일이 직접 실행될 때만 main() 실행 (import할 때는 실행되지 않음)
+if __name__ == '__main__':
+    # --manifests 옵션이 있으면 여러 파일 병합, 없으면 기존 방식으로 실행
+    options = parse_args()
+    if options.manifests:
+        main_manifests(options)
+    else:
+        main(options.threshold, options.output)
@@ -1,8 +1,27 @@
+import argparse
+import glob
+import json
+import operator
+import os
+import re
+
 import numpy as np
 
-def read_csv(filename):
+# 캐시 파일 형식 버전 (형식이 바뀌면 기존 캐시를 다시 만들기 위함)
+CACHE_VERSION = 1
+
+# 캐시에 저장하는 레코드 구성: 부품명 코드(정수)와 strength
+CACHE_DTYPE = [('code', 'i4'), ('strength', 'f8')]
+
+# 기본 입력 파일 패턴과 작업 대상 조건
+DEFAULT_PATTERN = 'mars_base_main_parts-*.csv'
+DEFAULT_RULE = 'mean<50'
+
+
+def parse_csv(filename):
     """
-    CSV 파일을 읽어 구조화된 numpy 배열로 반환하는 함수입니다.
+    CSV 파일을 np.genfromtxt()로 직접 읽어 구조화된 numpy 배열로 반환하는 함수입니다.
+    (캐시가 없거나 오래된 경우에만 사용)
     
     Parameters:
     - filename (str): 읽을 CSV 파일 경로
@@ -15,75 +34,480 @@ def read_csv(filename):
     # dtype: 구조화 배열로 각 컬럼 타입 지정 (문자열 최대 50자, float64)
     # encoding='utf-8-sig': BOM(바이트순서표시자) 처리를 위한 인코딩 설정
     # np.genfromtxt()는 Python의 NumPy 라이브러리에서 제공하는 함수로, 텍스트 파일(주로 CSV 파일)을 읽어서 NumPy 배열로 변환해주는 함수.
-    return np.genfromtxt(filename, delimiter=',', skip_header=1,
-                       dtype=[('parts', 'U50'), ('strength', 'f8')],
-                       encoding='utf-8-sig')
+    # np.atleast_1d(): 데이터가 한 줄뿐이어도 1차원 배열이 되도록 함
+    return np.atleast_1d(np.genfromtxt(filename, delimiter=',', skip_header=1,
+                                       dtype=[('parts', 'U50'), ('strength', 'f8')],
+                                       encoding='utf-8-sig'))
+
+
+def cache_paths(filename):
+    """
+    CSV 옆에 둘 캐시 파일 경로들을 반환하는 함수
+    
+    - xxx.csv.parts.npy: (부품명 코드, strength) 레코드 배열 → 메모리 매핑으로 바로 읽음
+    - xxx.csv.parts.json: 부품명 문자열 표와 원본 CSV의 수정 시각/크기
+    """
+    return filename + '.parts.npy', filename + '.parts.json'
+
+
+def _write_cache(filename, stat, codes, names, strengths):
+    """캐시 파일을 저장하는 함수 (임시 파일에 쓰고 바꿔치기)"""
+    records_path, meta_path = cache_paths(filename)
+    
+    records = np.empty(len(codes), dtype=CACHE_DTYPE)
+    records['code'] = codes
+    records['strength'] = strengths
+    with open(records_path + '.tmp', 'wb') as f:
+        np.save(f, records)
+    os.replace(records_path + '.tmp', records_path)
+    
+    # 메타 정보는 레코드 파일을 다 쓴 뒤 마지막에 저장 (메타 파일이 있으면 캐시가 완성된 것)
+    meta = {
+        'version': CACHE_VERSION,
+        'mtime_ns': stat.st_mtime_ns,
+        'size': stat.st_size,
+        'names': [str(name) for name in names]
+    }
+    with open(meta_path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(meta, f, ensure_ascii=False)
+    os.replace(meta_path + '.tmp', meta_path)
 
 
-def main():
-    # 각 CSV 파일 경로
-    file1 = 'mars_base_main_parts-001.csv'
-    file2 = 'mars_base_main_parts-002.csv'
-    file3 = 'mars_base_main_parts-003.csv'
+def _read_cache(filename, stat):
+    """캐시가 원본 CSV와 맞으면 (codes, names, strengths)를, 아니면 None을 반환하는 함수"""
+    records_path, meta_path = cache_paths(filename)
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        if (meta.get('version') != CACHE_VERSION
+                or meta.get('mtime_ns') != stat.st_mtime_ns
+                or meta.get('size') != stat.st_size):
+            return None
+        # mmap_mode='r': 파일을 메모리에 복사하지 않고 필요한 부분만 읽어 옴
+        records = np.load(records_path, mmap_mode='r')
+    except (OSError, ValueError):
+        return None
+    
+    names = np.array(meta['names'], dtype=str)
+    return records['code'], names, records['strength']
+
+
+def read_parts(filename):
+    """
+    CSV 파일을 부품명 코드, 부품명 표, strength 배열로 읽는 함수입니다.
+    
+    - 부품명은 중복 없는 문자열 표(names)와 각 행의 표 위치(codes)로 저장 (사전 인코딩)
+      예: names = ['Brick', 'Concrete'], codes = [1, 0, 1] → 'Concrete', 'Brick', 'Concrete'
+    - 원본 CSV의 수정 시각/크기가 캐시와 같으면 np.genfromtxt() 없이 캐시를 메모리 매핑으로 읽음
+    
+    Parameters:
+    - filename (str): 읽을 CSV 파일 경로
+    
+    Returns:
+    - tuple: (codes, names, strengths)
+      codes: int32 배열, names: 문자열 배열, strengths: float64 배열
+    """
+    stat = os.stat(filename)
+    cached = _read_cache(filename, stat)
+    if cached is not None:
+        return cached
+    
+    arr = parse_csv(filename)
+    # np.unique(return_inverse=True): 중복 없는 부품명 표와 각 행의 표 위치를 한 번에 구함
+    names, codes = np.unique(arr['parts'], return_inverse=True)
+    # 문자열 표는 가장 긴 부품명 길이에 맞춘 dtype으로 다시 만듦 (캐시에서 읽을 때와 같게)
+    names = np.array(names.tolist(), dtype=str)
+    codes = codes.astype(np.int32)
+    strengths = arr['strength']
+    
+    try:
+        _write_cache(filename, stat, codes, names, strengths)
+    except OSError:
+        # 캐시를 저장할 수 없는 위치라도 분석은 계속 진행
+        pass
+    return codes, names, strengths
+
+
+def read_csv(filename):
+    """
+    CSV 파일을 읽어 구조화된 numpy 배열로 반환하는 함수입니다.
+    (read_parts()의 캐시를 사용하므로 같은 파일을 다시 읽을 때 빠름)
+    
+    Parameters:
+    - filename (str): 읽을 CSV 파일 경로
+    
+    Returns:
+    - numpy structured array: 각 행에 부품명(parts)와 strength를 필드로 가진 배열
+    """
+    codes, names, strengths = read_parts(filename)
+    
+    arr = np.empty(len(codes), dtype=[('parts', names.dtype), ('strength', 'f8')])
+    # names[codes]: 코드 배열로 문자열 표를 인덱싱해서 원래 부품명 순서로 되돌림
+    arr['parts'] = names[codes]
+    arr['strength'] = strengths
+    return arr
+
+
+class PartsStats:
+    """
+    여러 검사 파일의 strength를 한 파일씩 누적해서 부품별 통계를 구하는 클래스
+    
+    - 파일마다 strength 배열 하나만 더하므로 메모리는 O(부품 수)만 사용
+      (모든 파일을 (k, n) 행렬로 쌓지 않음)
+    - 분산은 웰포드(Welford) 알고리즘으로 누적 (큰 값에서도 오차가 적음)
+    - 평균은 합계 / 개수로 계산 (np.mean()과 같은 결과)
+    - 값이 없는(NaN) strength는 그 부품의 개수에 포함하지 않음
+    """
+    
+    def __init__(self, size):
+        self.count = np.zeros(size, dtype=np.int64)
+        self.total = np.zeros(size, dtype=np.float64)
+        self.running_mean = np.zeros(size, dtype=np.float64)
+        self.m2 = np.zeros(size, dtype=np.float64)
+        self.min = np.full(size, np.inf)
+        self.max = np.full(size, -np.inf)
+    
+    def __len__(self):
+        return len(self.count)
+    
+    def grow(self, size):
+        """새로 나타난 부품을 위해 통계 배열을 size 길이로 늘리는 함수"""
+        extra = size - len(self.count)
+        if extra <= 0:
+            return
+        self.count = np.concatenate([self.count, np.zeros(extra, dtype=np.int64)])
+        self.total = np.concatenate([self.total, np.zeros(extra)])
+        self.running_mean = np.concatenate([self.running_mean, np.zeros(extra)])
+        self.m2 = np.concatenate([self.m2, np.zeros(extra)])
+        self.min = np.concatenate([self.min, np.full(extra, np.inf)])
+        self.max = np.concatenate([self.max, np.full(extra, -np.inf)])
+    
+    def add(self, strengths):
+        """
+        파일 하나의 strength 배열을 누적하는 함수
+        (i번째 값이 i번째 부품의 값, 그 파일에 없는 부품은 NaN)
+        """
+        strengths = np.asarray(strengths, dtype=np.float64)
+        valid = ~np.isnan(strengths)
+        values = np.where(valid, strengths, 0.0)
+        
+        self.count += valid
+        self.total += values
+        
+        # 웰포드 알고리즘: 새 값과 이전 평균의 차이로 평균과 제곱합(m2)을 갱신
+        delta = np.where(valid, values - self.running_mean, 0.0)
+        self.running_mean += delta / np.maximum(self.count, 1)
+        self.m2 += np.where(valid, delta * (values - self.running_mean), 0.0)
+        
+        # np.fmin/fmax: NaN은 무시하고 작은/큰 값을 고름
+        np.fmin(self.min, strengths, out=self.min)
+        np.fmax(self.max, strengths, out=self.max)
+    
+    def _per_count(self, values, count):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(count > 0, values / np.maximum(count, 1), np.nan)
+    
+    @property
+    def mean(self):
+        return self._per_count(self.total, self.count)
+    
+    @property
+    def var(self):
+        """모분산 (np.var()와 같은 정의, ddof=0)"""
+        return self._per_count(self.m2, self.count)
+    
+    @property
+    def std(self):
+        return np.sqrt(self.var)
+    
+    def get(self, name):
+        """통계 이름('mean', 'std', 'var', 'min', 'max', 'count')으로 배열을 반환하는 함수"""
+        if name not in STAT_NAMES:
+            raise ValueError(f'알 수 없는 통계입니다: {name}')
+        if name in ('min', 'max'):
+            return np.where(self.count > 0, getattr(self, name), np.nan)
+        return getattr(self, name)
+
+
+# 조건식에서 사용할 수 있는 통계와 비교 연산자
+STAT_NAMES = ('mean', 'std', 'var', 'min', 'max', 'count')
+OPERATORS = {
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge
+}
+RULE_PATTERN = re.compile(r'^\s*([a-z]+)\s*(<=|>=|<|>)\s*([-+0-9.eE]+)\s*$')
+
+
+def parse_rule(text):
+    """
+    'mean<50' 같은 조건식을 통계 객체 → 불리언 배열 함수로 바꾸는 함수
+    
+    - 여러 조건은 'and' 또는 'or'로 연결 (예: 'mean<50 or min<10')
+      and가 or보다 먼저 계산됨
+    - 사용할 수 있는 통계: mean, std, var, min, max, count
+    
+    [예외]
+    ValueError: 조건식의 형식이 잘못되었을 때
+    """
+    groups = []
+    for group_text in re.split(r'\s+or\s+', text.strip()):
+        terms = []
+        for term_text in re.split(r'\s+and\s+', group_text):
+            match = RULE_PATTERN.match(term_text)
+            if match is None or match.group(1) not in STAT_NAMES:
+                raise ValueError(f'조건식을 해석할 수 없습니다: {term_text}')
+            terms.append((match.group(1), OPERATORS[match.group(2)], float(match.group(3))))
+        groups.append(terms)
+    
+    def predicate(stats):
+        result = np.zeros(len(stats.count), dtype=bool)
+        for terms in groups:
+            group_result = np.ones(len(stats.count), dtype=bool)
+            for name, compare, value in terms:
+                group_result &= compare(stats.get(name), value)
+            result |= group_result
+        return result
+    
+    return predicate
+
+
+def occurrence_numbers(codes):
+    """
+    각 행이 같은 부품명 중 몇 번째로 나온 행인지(0부터) 구하는 함수
+    예: codes = [3, 1, 3, 3] → [0, 0, 1, 2]
+    
+    - 안정 정렬로 같은 코드끼리 모은 뒤, 묶음 안에서의 위치를 한 번에 계산
+    """
+    codes = np.asarray(codes)
+    order = np.argsort(codes, kind='stable')
+    sorted_codes = codes[order]
+    # 각 묶음이 시작하는 위치를 묶음 안의 모든 행에 퍼뜨림
+    starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+    group_start = np.repeat(starts, np.diff(np.r_[starts, len(codes)]))
+    occurrences = np.empty(len(codes), dtype=np.int64)
+    occurrences[order] = np.arange(len(codes)) - group_start
+    return occurrences
+
+
+class PartsJoin:
+    """
+    여러 검사 파일을 부품명 기준으로 맞춰서(join) 통계를 누적하는 클래스
+    
+    - 파일마다 행 순서가 다르거나, 빠진 부품/추가된 부품이 있어도 부품명으로 맞춤
+    - 한 파일에 같은 부품명이 여러 번 나오면 k번째 행끼리 같은 부품으로 봄
+      (모든 파일의 순서가 같으면 위치 기준으로 맞춘 것과 결과가 같음)
+    - 결과 행 순서: 처음 나온 순서 (첫 파일의 순서 + 나중 파일에서 새로 나온 부품)
+    
+    [빠르게 처리하는 방법]
+    - 전체 부품명 사전은 정렬된 배열로 보관하고, 파일의 부품명 표(read_parts()의 names)를
+      np.searchsorted()로 한 번에 찾음 → 파일마다 O(부품명 수 × log)
+    - 행 위치는 (부품명 번호, 몇 번째) → 결과 행 번호 배열로 찾으므로 반복문이 없음
+    """
+    
+    def __init__(self):
+        self.sorted_names = np.array([], dtype=str)    # 전체 부품명 (정렬됨)
+        self.sorted_ids = np.array([], dtype=np.int64)  # sorted_names[i]의 부품명 번호
+        self.names = []                                 # 부품명 번호 → 부품명 (처음 나온 순서)
+        self.row_name_ids = np.array([], dtype=np.int64)  # 결과 행 → 부품명 번호
+        self.row_of = []        # row_of[k][부품명 번호] = k번째로 나온 그 부품의 결과 행 (-1: 없음)
+        self.stats = PartsStats(0)
+        self.files = []         # 지금까지 합친 파일 이름
+        self.missing = []       # 파일별로, 그 파일을 읽을 때 이미 있던 부품 중 빠진 결과 행
+        self.rows_before = []   # 파일별로, 그 파일을 다 읽은 뒤의 결과 행 수
+    
+    def __len__(self):
+        return len(self.row_name_ids)
+    
+    def _name_ids(self, names):
+        """파일의 부품명 표(정렬된 중복 없는 배열)를 전체 부품명 번호로 바꾸는 함수"""
+        positions = np.searchsorted(self.sorted_names, names)
+        found = positions < len(self.sorted_names)
+        found[found] = self.sorted_names[positions[found]] == names[found]
+        
+        ids = np.empty(len(names), dtype=np.int64)
+        ids[found] = self.sorted_ids[positions[found]]
+        
+        new_names = names[~found]
+        if len(new_names):
+            new_ids = np.arange(len(self.names), len(self.names) + len(new_names))
+            ids[~found] = new_ids
+            self.names.extend(new_names.tolist())
+            # 긴 부품명이 잘리지 않도록 두 배열 중 더 긴 문자열 dtype으로 맞춘 뒤 정렬 위치에 끼워 넣음
+            dtype = np.promote_types(self.sorted_names.dtype, new_names.dtype)
+            self.sorted_names = np.insert(self.sorted_names.astype(dtype),
+                                          positions[~found], new_names)
+            self.sorted_ids = np.insert(self.sorted_ids, positions[~found], new_ids)
+            for table in self.row_of:
+                table.resize(len(self.names), refcheck=False)
+                table[-len(new_names):] = -1
+        return ids
+    
+    def add_file(self, filename):
+        """파일 하나를 읽어 부품명 기준으로 맞춘 뒤 통계에 더하는 함수"""
+        codes, names, strengths = read_parts(filename)
+        name_ids = self._name_ids(np.asarray(names))[codes]
+        occurrences = occurrence_numbers(codes)
+        existing_rows = len(self)
+        
+        # 1. 이미 있는 결과 행 찾기 (몇 번째로 나왔는지별로 한 번에 조회, 보통 1~2번 반복)
+        rows = np.full(len(codes), -1, dtype=np.int64)
+        for k in range(min(len(self.row_of), int(occurrences.max(initial=-1)) + 1)):
+            selected = occurrences == k
+            rows[selected] = self.row_of[k][name_ids[selected]]
+        
+        # 2. 처음 나온 부품은 파일의 행 순서대로 새 결과 행을 붙임
+        new = rows < 0
+        new_count = int(new.sum())
+        if new_count:
+            rows[new] = np.arange(existing_rows, existing_rows + new_count)
+            while len(self.row_of) <= int(occurrences[new].max()):
+                self.row_of.append(np.full(len(self.names), -1, dtype=np.int64))
+            for k in np.unique(occurrences[new]):
+                selected = new & (occurrences == k)
+                self.row_of[k][name_ids[selected]] = rows[selected]
+            self.row_name_ids = np.concatenate([self.row_name_ids, name_ids[new]])
+            self.stats.grow(len(self))
+        
+        # 3. 결과 행 순서로 펼친 strength 배열 (이 파일에 없는 부품은 NaN)
+        aligned = np.full(len(self), np.nan)
+        aligned[rows] = strengths
+        self.stats.add(aligned)
+        
+        # 4. 이 파일을 읽기 전부터 있었는데 이 파일에는 없는 부품 기록
+        present = np.zeros(existing_rows, dtype=bool)
+        present[rows[~new]] = True
+        self.files.append(filename)
+        self.missing.append(np.flatnonzero(~present))
+        self.rows_before.append(len(self))
+        return len(codes)
+    
+    @property
+    def parts_names(self):
+        """결과 행 순서의 부품명 배열"""
+        return np.array(self.names, dtype=str)[self.row_name_ids]
+    
+    def missing_rows(self):
+        """
+        {파일 이름: 그 파일에 없는 부품의 결과 행 번호 배열}을 반환하는 함수
+        (그 파일보다 나중 파일에서 처음 나온 부품도 포함)
+        """
+        result = {}
+        for filename, missing, rows_after in zip(self.files, self.missing, self.rows_before):
+            result[filename] = np.concatenate([missing, np.arange(rows_after, len(self))])
+        return result
+
+
+def aggregate_files(filenames):
+    """
+    여러 CSV 파일을 한 파일씩 읽어 부품명 기준으로 맞추고 부품별 통계를 누적하는 함수
+    
+    Parameters:
+    - filenames (list): CSV 파일 경로들
+    
+    Returns:
+    - tuple: (부품명 배열, PartsStats, {파일 이름: 빠진 부품의 행 번호 배열})
+    
+    [예외]
+    ValueError: 파일이 없을 때
+    """
+    if not filenames:
+        raise ValueError('입력 파일이 없습니다.')
+    
+    join = PartsJoin()
+    for filename in filenames:
+        row_count = join.add_file(filename)
+        print(f'{filename} 읽기 완료: ({row_count},)')
+    
+    return join.parts_names, join.stats, join.missing_rows()
+
+
+def save_missing_report(parts_names, missing, filename):
+    """빠진 부품 목록을 file,part 형식의 CSV로 저장하는 함수"""
+    with open(filename, 'w', encoding='utf-8') as f:
+        f.write('file,part\n')
+        for source, rows in missing.items():
+            for i in rows:
+                f.write(f'{source},{parts_names[i]}\n')
+
+
+def parse_args(argv=None):
+    """
+    명령줄 옵션을 해석하는 함수
+    
+    사용 예시:
+    python mars_parts_analyzer.py                                   # 기본 파일 패턴, mean<50
+    python mars_parts_analyzer.py round-*.csv --rule 'mean<50 or min<10'
+    """
+    parser = argparse.ArgumentParser(description='Mars 부품 데이터 통합 분석')
+    parser.add_argument('files', nargs='*',
+                        help=f'입력 CSV 파일 (기본값: {DEFAULT_PATTERN})')
+    parser.add_argument('--rule', default=DEFAULT_RULE,
+                        help=f"작업 대상 조건 (기본값: '{DEFAULT_RULE}')")
+    parser.add_argument('--output', default='parts_to_work_on.csv', help='결과 CSV 파일')
+    parser.add_argument('--all-stats', action='store_true',
+                        help='결과에 표준편차/최소/최대/개수도 함께 저장')
+    parser.add_argument('--missing-report', help='파일별로 빠진 부품 목록을 저장할 CSV 파일')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    
+    # 입력 파일 목록 (지정하지 않으면 기본 패턴에 맞는 파일을 이름순으로)
+    filenames = args.files or sorted(glob.glob(DEFAULT_PATTERN))
 
     # 결과를 저장할 CSV 파일 이름
-    output_file = 'parts_to_work_on.csv'
+    output_file = args.output
 
     try:
+        predicate = parse_rule(args.rule)
+        
         print('=== Mars 부품 데이터 통합 분석 시작 ===\n')
         
-        # 1. 세 CSV 파일을 읽어서 구조화된 numpy 배열로 저장
-        arr1 = read_csv(file1)
-        arr2 = read_csv(file2)
-        arr3 = read_csv(file3)
-
-        print(f'{file1} 읽기 완료: {arr1.shape}')
-        print(f'{file2} 읽기 완료: {arr2.shape}')
-        print(f'{file3} 읽기 완료: {arr3.shape}\n')
-
-        # 2. 부품명(parts) 배열 가져오기 (첫 번째 파일 기준)
-        # 모든 파일의 부품명이 동일하다고 가정합니다.
-        parts_names = arr1['parts']
-
-        # 3. strength 데이터만 추출하여 float 배열로 변환
-        strength1 = arr1['strength']
-        strength2 = arr2['strength']
-        strength3 = arr3['strength']
-
-        # 4. 세 strength 배열을 모아서 2차원 배열 생성
-        # vstack: 배열을 수직으로 쌓아서 (3, 100)의 행렬 생성
-        # 각 행은 다른 CSV 파일의 strength 값, 각 열은 부품별 데이터
-        all_strengths = np.vstack((strength1, strength2, strength3))
-
-        # 5. 각 부품별 strength의 평균을 계산 (열 단위)
-        # axis=0 => 행들을 평균 내어 각 열별 평균을 구함 (즉 부품별 평균)
-        # mean 메서드는 NumPy 배열 내의 원소들의 산술 평균(Arithmetic Mean), 즉 모든 값을 더한 후 값의 개수로 나눈 결과를 계산하는 함수.
-        averages = np.mean(all_strengths, axis=0)
-
-        # 6. 평균값 출력
+        # 1. 파일을 하나씩 읽으면서 부품명 기준으로 맞추고 부품별 통계를 누적
+        parts_names, stats, missing = aggregate_files(filenames)
+        print()
+        
+        # 파일마다 빠진 부품이 있으면 알려줌
+        for source, rows in missing.items():
+            if len(rows):
+                print(f'[주의] {source}에 없는 부품 {len(rows)}개: '
+                      + ', '.join(str(parts_names[i]) for i in rows[:5])
+                      + (' ...' if len(rows) > 5 else ''))
+        if any(len(rows) for rows in missing.values()):
+            print()
+        if args.missing_report:
+            save_missing_report(parts_names, missing, args.missing_report)
+        
+        averages = stats.mean
+
+        # 2. 평균값 출력
         print('부품별 평균 strength 값:')
         for i, avg in enumerate(averages):
             print(f'  {parts_names[i]}: {avg:.3f}')
         print()
 
-        # 7. 평균 strength가 50 미만인 부품의 인덱스 찾기
-        low_avg_indices = np.where(averages < 50)[0]
-
-        # 8. 필터링된 부품명과 평균 strength 값 추출
-        filtered_parts = parts_names[low_avg_indices]
-        filtered_avgs = averages[low_avg_indices]
+        # 3. 조건을 만족하는 부품의 인덱스 찾기
+        selected_indices = np.where(predicate(stats))[0]
 
-        print(f'작업이 필요한 부품 수: {len(filtered_parts)}\n')
+        print(f'작업이 필요한 부품 수: {len(selected_indices)}\n')
 
-        # 9. 결과를 CSV 파일로 저장
+        # 4. 결과를 CSV 파일로 저장
         with open(output_file, 'w', encoding='utf-8') as f:
-            # 헤더 작성
-            f.write('part,average_strength\n')
-            
-            # 각 부품명과 평균 값 한 줄씩 기록
-            # zip() 함수는 두 리스트/배열을 한 쌍씩 묶어줍
-            for part, avg in zip(filtered_parts, filtered_avgs):
-                f.write(f'{part},{avg:.3f}\n')
+            if args.all_stats:
+                # std는 호출할 때마다 배열 전체를 새로 계산하므로 반복문 밖에서 한 번만 구함
+                std, minimum, maximum = stats.std, stats.get('min'), stats.get('max')
+                f.write('part,average_strength,std,min,max,count\n')
+                for i in selected_indices:
+                    f.write(f'{parts_names[i]},{averages[i]:.3f},{std[i]:.3f},'
+                            f'{minimum[i]:.3f},{maximum[i]:.3f},{stats.count[i]}\n')
+            else:
+                # 헤더 작성 후 각 부품명과 평균 값 한 줄씩 기록
+                f.write('part,average_strength\n')
+                for i in selected_indices:
+                    f.write(f'{parts_names[i]},{averages[i]:.3f}\n')
 
         print(f'{output_file}에 저장 완료!')
 
@@ -0,0 +1,196 @@
+# material_catalog.py
+# 목적: Mars_Base_Inventory_List.csv의 물질 정보(밀도, 인화성)를
+#       한 번만 읽어 여러 프로그램이 함께 쓰도록 제공하는 모듈.
+#
+# [동작 방식]
+# - 처음 get_catalog()를 호출할 때 CSV를 읽음 (import만 해서는 읽지 않음)
+# - 읽은 결과를 CSV 옆에 압축된 바이너리 파일(.catalog.npz)로 저장해 두고,
+#   다음 실행부터는 CSV의 수정 시각/크기가 같으면 CSV 대신 이 파일을 읽음
+# - 물질마다 정수 ID를 주고, 밀도는 numpy 배열(densities[ID])로 조회
+#   → 문자열 딕셔너리 조회 대신 배열 인덱싱으로 한 번에 여러 개를 찾을 수 있음
+# - 'Various'처럼 숫자가 아닌 값은 NaN(숫자 아님)으로 저장
+
+import csv
+import os
+
+import numpy as np
+
+# 기본 CSV 파일 경로 (이 모듈과 같은 폴더)
+DEFAULT_CSV = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                           'Mars_Base_Inventory_List.csv')
+
+# CSV에서 사용할 열 이름
+NAME_COLUMN = 'Substance'
+DENSITY_COLUMN = 'Weight (g/cm³)'
+FLAMMABILITY_COLUMN = 'Flammability'
+
+# 바이너리 스냅숏 형식 버전 (형식이 바뀌면 기존 스냅숏을 무시하기 위함)
+SNAPSHOT_VERSION = 1
+
+# 한 번 읽은 카탈로그를 기억해 두는 딕셔너리 {CSV 절대 경로: MaterialCatalog}
+_catalogs = {}
+
+
+def save_snapshot(filename, version, **arrays):
+    """
+    배열들을 바이너리 스냅숏 파일(.npz)로 저장하는 함수 (flammability_index 등도 함께 사용)
+    임시 파일에 먼저 쓰고 바꿔치기하므로 저장 도중 종료되어도 파일이 깨지지 않음
+    """
+    temp_filename = filename + '.tmp'
+    with open(temp_filename, 'wb') as file:
+        np.savez(file, version=version, **arrays)
+    os.replace(temp_filename, filename)
+
+
+def load_snapshot(filename, version, stat=None):
+    """
+    save_snapshot()으로 저장한 파일을 읽어 {이름: 배열} 딕셔너리로 돌려주는 함수
+
+    Parameters:
+    - version (int): 기대하는 형식 버전
+    - stat: 원본 CSV의 os.stat() 결과 (주면 저장된 mtime_ns/size와 같은지 확인)
+
+    [예외]
+    ValueError: 형식 버전이 다르거나 원본 파일이 바뀌었을 때
+    OSError / KeyError: 파일이 없거나 필요한 배열이 없을 때
+    """
+    with np.load(filename, allow_pickle=False) as data:
+        if int(data['version']) != version:
+            raise ValueError('스냅숏 형식이 다릅니다.')
+        if stat is not None and (int(data['mtime_ns']) != stat.st_mtime_ns
+                                 or int(data['size']) != stat.st_size):
+            raise ValueError('원본 파일이 스냅숏을 만든 뒤 바뀌었습니다.')
+        return {name: data[name] for name in data.files}
+
+
+def _to_float(text):
+    """문자열을 실수로 바꾸는 함수 (숫자가 아니면 NaN)"""
+    try:
+        return float(text)
+    except ValueError:
+        return float('nan')
+
+
+class MaterialCatalog:
+    """
+    물질 이름, 밀도, 인화성을 ID 순서대로 담은 카탈로그
+
+    names[ID], densities[ID], flammability[ID]가 같은 물질을 가리킴
+    """
+
+    def __init__(self, names, densities, flammability, mtime_ns=None, size=None):
+        self.names = names                  # 문자열 배열
+        self.densities = densities          # float64 배열 (g/cm³, 숫자가 아니면 NaN)
+        self.flammability = flammability    # float64 배열 (숫자가 아니면 NaN)
+        self.mtime_ns = mtime_ns            # 원본 CSV의 수정 시각
+        self.size = size                    # 원본 CSV의 크기
+        self.ids = {str(name): material_id for material_id, name in enumerate(names)}
+
+    def __len__(self):
+        return len(self.names)
+
+    def material_id(self, name):
+        """물질 이름으로 ID를 찾는 함수 (없으면 KeyError)"""
+        return self.ids[name]
+
+    def encode(self, names):
+        """
+        물질 이름 배열을 ID 배열로 바꾸는 함수
+        같은 이름이 여러 번 나와도 딕셔너리 조회는 서로 다른 이름 개수만큼만 수행
+        """
+        names = np.asarray(names)
+        unique_names, inverse = np.unique(names, return_inverse=True)
+        unique_ids = np.array([self.ids[str(name)] for name in unique_names], dtype=np.intp)
+        return unique_ids[inverse].reshape(names.shape)
+
+    def density(self, ids):
+        """ID(또는 ID 배열)로 밀도를 조회하는 함수"""
+        return self.densities[ids]
+
+    @classmethod
+    def from_csv(cls, csv_filename):
+        """
+        CSV 파일을 읽어 카탈로그를 만드는 함수
+        같은 이름이 여러 번 나오면 처음 나온 줄을 사용
+        """
+        stat = os.stat(csv_filename)
+        names = []
+        densities = []
+        flammability = []
+        seen = set()
+
+        # csv 모듈: 따옴표로 감싼 값 안의 쉼표도 올바르게 처리
+        with open(csv_filename, 'r', encoding='utf-8-sig', newline='') as file:
+            reader = csv.DictReader(file)
+            for row in reader:
+                name = (row.get(NAME_COLUMN) or '').strip()
+                if not name or name in seen:
+                    continue
+                seen.add(name)
+                names.append(name)
+                densities.append(_to_float(row.get(DENSITY_COLUMN) or ''))
+                flammability.append(_to_float(row.get(FLAMMABILITY_COLUMN) or ''))
+
+        return cls(np.array(names, dtype=str),
+                   np.array(densities, dtype=np.float64),
+                   np.array(flammability, dtype=np.float64),
+                   stat.st_mtime_ns, stat.st_size)
+
+    def save(self, snapshot_filename):
+        """카탈로그를 바이너리 스냅숏 파일로 저장하는 함수"""
+        save_snapshot(snapshot_filename, SNAPSHOT_VERSION,
+                      names=self.names,
+                      densities=self.densities,
+                      flammability=self.flammability,
+                      mtime_ns=self.mtime_ns,
+                      size=self.size)
+
+    @classmethod
+    def load(cls, snapshot_filename, stat=None):
+        """
+        바이너리 스냅숏 파일에서 카탈로그를 읽어오는 함수
+        (stat을 주면 원본 CSV가 바뀐 스냅숏은 ValueError)
+        """
+        data = load_snapshot(snapshot_filename, SNAPSHOT_VERSION, stat)
+        return cls(data['names'], data['densities'], data['flammability'],
+                   int(data['mtime_ns']), int(data['size']))
+
+
+def snapshot_path(csv_filename):
+    """CSV 옆에 둘 스냅숏 파일 경로 (예: xxx.csv → xxx.csv.catalog.npz)"""
+    return csv_filename + '.catalog.npz'
+
+
+def get_catalog(csv_filename=DEFAULT_CSV):
+    """
+    카탈로그를 돌려주는 함수
+
+    1. 이미 읽은 카탈로그가 있고 CSV가 바뀌지 않았으면 그대로 돌려줌
+    2. 스냅숏 파일이 CSV의 수정 시각/크기와 맞으면 스냅숏을 읽음
+    3. 둘 다 아니면 CSV를 읽고 스냅숏을 새로 저장
+    """
+    key = os.path.abspath(csv_filename)
+    stat = os.stat(key)
+
+    catalog = _catalogs.get(key)
+    if catalog is not None and catalog.mtime_ns == stat.st_mtime_ns \
+            and catalog.size == stat.st_size:
+        return catalog
+
+    snapshot = snapshot_path(key)
+    try:
+        catalog = MaterialCatalog.load(snapshot, stat)
+    except (OSError, ValueError, KeyError):
+        # 스냅숏이 없거나 깨졌거나 형식이 다르거나 CSV가 바뀐 경우
+        catalog = None
+
+    if catalog is None:
+        catalog = MaterialCatalog.from_csv(key)
+        try:
+            catalog.save(snapshot)
+        except OSError:
+            # 읽기 전용 폴더 등에서는 스냅숏 없이 계속 진행
+            pass
+
+    _catalogs[key] = catalog
+    return catalog
@@ -0,0 +1,26 @@
+# test_design_dome.py
+# 목적: design_dome.py의 재질 표(기본 재질 + 적재물 카탈로그)를 확인하는 테스트
+#       (실행: 4-2 폴더에서 python -m pytest)
+
+import pytest
+
+from design_dome import get_materials, sphere_area, sphere_area_batch
+
+
+def test_scalar_and_batch_agree_for_every_material():
+    table = get_materials()
+    for name in table.names:
+        area, weight = sphere_area(7.3, name, 2.5)
+        areas, weights = sphere_area_batch([7.3], [name], [2.5])
+        assert (areas[0], weights[0]) == (area, weight)
+
+
+def test_catalog_material_in_batch():
+    # 'Aluminum'은 DENSITY에는 없고 적재물 목록에만 있는 재질
+    _, weights = sphere_area_batch([10, 10], ['Aluminum', '알루미늄'])
+    assert weights[0] == weights[1] == sphere_area(10, 'Aluminum')[1]
+
+
+def test_unknown_material():
+    with pytest.raises(KeyError):
+        sphere_area_batch([10], ['Aluminum Can'])
@@ -0,0 +1,29 @@
+# test_dome_optimizer.py
+# 목적: dome_optimizer.py의 입력 검사와 파레토 탐색을 확인하는 테스트
+#       (실행: 4-2 폴더에서 python -m pytest)
+
+import math
+
+import pytest
+
+from dome_optimizer import optimize_domes
+
+
+@pytest.mark.parametrize('step', [0, -0.5, math.nan])
+def test_thickness_step_must_be_positive(step):
+    with pytest.raises(ValueError):
+        optimize_domes(100, 2000, thickness_range=(1.0, 2.0), thickness_step=step, workers=1)
+
+
+@pytest.mark.parametrize('step', [0, -0.1, math.nan])
+def test_diameter_step_must_be_positive(step):
+    with pytest.raises(ValueError):
+        optimize_domes(100, 2000, diameter_step=step, workers=1)
+
+
+def test_first_design_is_lightest():
+    front = optimize_domes(100, 2000, ['유리'], diameter_range=(1.0, 20.0),
+                           diameter_step=0.5, workers=1)
+    assert len(front) > 0
+    assert front['area'].min() >= 100
+    assert front['weight'][0] == front['weight'].min()
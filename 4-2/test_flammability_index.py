@@ -0,0 +1,33 @@
+# test_flammability_index.py
+# 목적: flammability_index.py의 인화성 색인 조회를 확인하는 테스트
+#       (실행: 4-2 폴더에서 python -m pytest)
+
+from flammability_index import FlammabilityIndex, load_index
+
+CSV = ('Substance,Weight (g/cm³),Specific Gravity,Strength,Flammability\n'
+       'Ethanol,0.789,0.79,Low,0.92\n'
+       'Mystery,Various,Various,Various,nan\n'
+       'Sand,Various,Various,Various,Various\n'
+       'Water,1.0,1.0,Low,0.0\n')
+
+
+def test_non_finite_values_are_reported_not_indexed(tmp_path):
+    path = tmp_path / 'inventory.csv'
+    path.write_text(CSV, encoding='utf-8')
+    index = FlammabilityIndex.build(str(path))
+
+    assert index.top(10) == [{'name': 'Ethanol', 'flammability': 0.92},
+                             {'name': 'Water', 'flammability': 0.0}]
+    assert index.unparsed() == [{'name': 'Mystery', 'value': 'nan'},
+                                {'name': 'Sand', 'value': 'Various'}]
+
+
+def test_saved_index_round_trip(tmp_path):
+    path = tmp_path / 'inventory.csv'
+    path.write_text(CSV, encoding='utf-8')
+    built = load_index(str(path))
+    loaded = load_index(str(path))
+
+    assert loaded.at_least(0.5) == built.at_least(0.5) == [{'name': 'Ethanol',
+                                                            'flammability': 0.92}]
+    assert loaded.unparsed() == built.unparsed()
@@ -0,0 +1,35 @@
+# test_inventory_columns.py
+# 목적: inventory_columns.py의 열 단위 표 정렬을 확인하는 테스트
+#       (실행: 4-2 폴더에서 python -m pytest)
+
+import numpy as np
+
+from inventory_columns import InventoryTable
+
+SCHEMA = [('Substance', 'text'), ('Strength', 'text'), ('Flammability', 'float')]
+
+
+def make_table():
+    columns = {
+        'Substance': np.array(['A', 'B', 'C', 'D', 'E']),
+        'Strength': np.array(['Low', 'High', 'Low', 'High', 'Medium']),
+        'Flammability': np.array([0.5, np.nan, 0.9, 0.5, 0.1])
+    }
+    masks = {'Flammability': np.isnan(columns['Flammability'])}
+    return InventoryTable(columns, masks, {}, SCHEMA)
+
+
+def test_sort_text_descending_keeps_ties_in_original_order():
+    table = make_table().sort_by('Strength', descending=True)
+    assert list(table['Strength']) == ['Medium', 'Low', 'Low', 'High', 'High']
+    assert list(table['Substance']) == ['E', 'A', 'C', 'B', 'D']
+
+
+def test_sort_text_ascending_is_stable():
+    table = make_table().sort_by('Strength', descending=False)
+    assert list(table['Substance']) == ['B', 'D', 'A', 'C', 'E']
+
+
+def test_sort_float_descending_is_stable_with_nan_last():
+    table = make_table().sort_by('Flammability', descending=True)
+    assert list(table['Substance']) == ['C', 'A', 'D', 'E', 'B']
@@ -0,0 +1,38 @@
+# test_mars_inventory_manager.py
+# 목적: mars_inventory_manager.py의 여러 적재물 파일 처리(--manifests)를 확인하는 테스트
+#       (실행: 4-2 폴더에서 python -m pytest)
+
+from mars_inventory_manager import find_manifests, main_manifests, parse_args
+
+MANIFEST_HEADER = 'Substance,Weight (g/cm³),Specific Gravity,Strength,Flammability\n'
+
+
+def write(path, text):
+    path.write_text(text, encoding='utf-8')
+    return str(path)
+
+
+def test_find_manifests_skips_danger_report(tmp_path):
+    manifest = write(tmp_path / 'module_a.csv',
+                     MANIFEST_HEADER + 'Ethanol,0.789,0.79,Low,0.92\nWater,1.0,1.0,Low,0.0\n')
+    # 이전에 저장한 위험 물품 보고서 (첫 열과 마지막 열은 적재물 목록과 같음)
+    write(tmp_path / 'Mars_Base_Inventory_danger.csv', 'Substance,Flammability\nEthanol,0.92\n')
+    write(tmp_path / 'parts.csv', 'parts,strength\nGlass,32\n')
+
+    assert find_manifests(str(tmp_path)) == [manifest]
+
+
+def test_merge_does_not_count_danger_report_twice(tmp_path, capsys):
+    write(tmp_path / 'module_a.csv',
+          MANIFEST_HEADER + 'Ethanol,0.789,0.79,Low,0.92\nWater,1.0,1.0,Low,0.0\n')
+    write(tmp_path / 'Mars_Base_Inventory_danger.csv', 'Substance,Flammability\nEthanol,0.92\n')
+    output = tmp_path / 'merged.csv'
+
+    main_manifests(parse_args(['--manifests', str(tmp_path), '--output', str(output),
+                               '--workers', '1']))
+
+    assert '입력 파일 1개에서 위험 물품 1건' in capsys.readouterr().out
+    assert output.read_text(encoding='utf-8').splitlines() == [
+        'Substance,Flammability,Source',
+        'Ethanol,0.92,module_a.csv'
+    ]
@@ -1,12 +1,22 @@
+import asyncio
 import json
 import multiprocessing
-import os
-import platform
 import random
+import signal
 import threading
 import time
 
-import psutil  # 외부 라이브러리
+from telemetry_bus import SLOT_NAMES, TelemetryBus, WriterCrashed
+from system_metrics import MetricsCollector
+from telemetry_history import TelemetryHistory
+from telemetry_pubsub import DEFAULT_SOCKET_PATH, TelemetryServer
+from telemetry_sink import JsonLinesSink, print_collected
+
+HISTORY_HOURS = 24
+SENSOR_INTERVAL = 5
+# 롤링 통계 창 크기 (표본 수, 5초 주기 기준 1분 / 10분 / 1시간)
+HISTORY_WINDOWS = (12, 120, 720)
+TELEMETRY_DIR = 'telemetry'
 
 
 class DummySensor:
@@ -33,7 +43,7 @@ class DummySensor:
 
 
 class MissionComputer:
-    def __init__(self):
+    def __init__(self, output=None):
         self.env_values = {
             'mars_base_internal_temperature': 0,
             'mars_base_external_temperature': 0,
@@ -43,38 +53,165 @@ class MissionComputer:
             'mars_base_internal_oxygen': 0
         }
         self.sensor = DummySensor()
+        self.history = TelemetryHistory(HISTORY_HOURS * 3600 // SENSOR_INTERVAL, HISTORY_WINDOWS)
+        self.metrics = MetricsCollector()
+        # 수집한 값을 받는 함수 output(name, data) - 기본값은 화면 출력, JsonLinesSink도 사용 가능
+        self.output = output or print_collected
+        self.intervals = {
+            'sensor': SENSOR_INTERVAL,
+            'info': 20,
+            'load': 20
+        }
+        self._loop = None
+        self._stop_event = None
+        self._wakeups = {}
+
+    def read_sensor_data(self):
+        self.sensor.set_env()
+        # 센서의 딕셔너리를 그대로 가리키지 않고 값만 복사 (센서가 값을 바꿔도 영향 없음)
+        self.env_values.update(self.sensor.get_env())
+        self.history.append(time.time(), self.env_values)
+        return self.env_values
+
+    def get_sensor_trend(self, window=HISTORY_WINDOWS[0]):
+        return self.history.summary(window)
+
+    def read_mission_computer_info(self):
+        # 바뀌지 않는 정보이므로 MetricsCollector가 처음 한 번 조회한 값을 사용
+        return dict(self.metrics.host_info)
+
+    def read_mission_computer_load(self):
+        # 1초 동안 기다리지 않고, 이전 호출 이후 구간의 CPU 사용률을 계산
+        return self.metrics.load()
+
+    def read_system_metrics(self):
+        return self.metrics.sample()
 
     def get_sensor_data(self):
         while True:
-            self.sensor.set_env()
-            self.env_values = self.sensor.get_env()
-            print(json.dumps(self.env_values, indent=4))
-            time.sleep(5)
+            self.output('sensor', self.read_sensor_data())
+            time.sleep(SENSOR_INTERVAL)
 
     def get_mission_computer_info(self):
         while True:
-            info = {
-                'os': platform.system(),
-                'os_version': platform.version(),
-                'cpu_type': platform.processor(),
-                'cpu_core_count': os.cpu_count(),
-                'memory_size(GB)': round(
-                    os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES') / (1024 ** 3), 2
-                )
-            }
-            print(json.dumps(info, indent=4))
+            self.output('info', self.read_mission_computer_info())
             time.sleep(20)
 
     def get_mission_computer_load(self):
         while True:
-            cpu = psutil.cpu_percent(interval=1)
-            mem = psutil.virtual_memory().percent
-            load = {
-                'cpu_usage(%)': round(cpu, 2),
-                'memory_usage(%)': round(mem, 2)
-            }
-            print(json.dumps(load, indent=4))
-            time.sleep(19)
+            self.output('load', self.read_mission_computer_load())
+            time.sleep(20)
+
+    def collectors(self):
+        # 이름: (수집 함수, 블로킹 여부) - 블로킹 함수는 executor 스레드에서 실행
+        # (info는 저장된 값, load는 기다리지 않는 측정이므로 이벤트 루프에서 바로 실행)
+        return {
+            'sensor': (self.read_sensor_data, False),
+            'info': (self.read_mission_computer_info, False),
+            'load': (self.read_mission_computer_load, False)
+        }
+
+    def set_interval(self, name, seconds):
+        # 실행 중에도 주기를 바꿀 수 있음 (다른 스레드에서 호출해도 안전)
+        if name not in self.intervals:
+            raise KeyError(name)
+        if seconds <= 0:
+            raise ValueError('주기는 0보다 커야 합니다.')
+        self.intervals[name] = seconds
+        self._call_in_loop(self._wake, name)
+
+    def stop(self):
+        self._call_in_loop(self._request_stop)
+
+    def _call_in_loop(self, callback, *args):
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            callback(*args)
+        else:
+            loop.call_soon_threadsafe(callback, *args)
+
+    def _wake(self, name):
+        event = self._wakeups.get(name)
+        if event is not None:
+            event.set()
+
+    def _request_stop(self):
+        if self._stop_event is not None:
+            self._stop_event.set()
+        for event in self._wakeups.values():
+            event.set()
+
+    async def _run_collector(self, name, func, blocking, output):
+        # 고정 주기(fixed-rate): 다음 실행 시각을 '이전 예정 시각 + 주기'로 정해서
+        # 작업에 걸린 시간이 다음 대기 시간에 더해지지 않게 함 (드리프트 보정)
+        loop = asyncio.get_running_loop()
+        wakeup = self._wakeups[name]
+        interval = self.intervals[name]
+        deadline = loop.time()
+
+        while not self._stop_event.is_set():
+            try:
+                if blocking:
+                    data = await loop.run_in_executor(None, func)
+                else:
+                    data = func()
+            except Exception as e:
+                # 수집기 하나가 실패해도 다른 수집기와 다음 틱은 계속 실행
+                print(f'{name} 수집 오류: {e}')
+            else:
+                output(name, data)
+
+            deadline += interval
+            while not self._stop_event.is_set():
+                if self.intervals[name] != interval:
+                    # 주기가 바뀌면 마지막 실행 시각 기준으로 새 주기를 적용
+                    deadline += self.intervals[name] - interval
+                    interval = self.intervals[name]
+                now = loop.time()
+                if deadline <= now:
+                    # 작업이 주기보다 오래 걸려 놓친 틱은 몰아서 실행하지 않고 건너뜀
+                    deadline += (now - deadline) // interval * interval
+                    break
+                wakeup.clear()
+                try:
+                    await asyncio.wait_for(wakeup.wait(), deadline - now)
+                except asyncio.TimeoutError:
+                    break
+
+    async def run_async(self, output=None, duration=None):
+        # 모든 수집기를 하나의 이벤트 루프에서 실행
+        # duration(초)이 지나거나 stop()이 호출되면 진행 중인 작업을 마치고 종료
+        if output is None:
+            output = self.output
+        self._loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+        self._wakeups = {name: asyncio.Event() for name in self.intervals}
+
+        tasks = [
+            asyncio.create_task(self._run_collector(name, func, blocking, output))
+            for name, (func, blocking) in self.collectors().items()
+        ]
+        try:
+            if duration is None:
+                await self._stop_event.wait()
+            else:
+                try:
+                    await asyncio.wait_for(self._stop_event.wait(), duration)
+                except asyncio.TimeoutError:
+                    pass
+            self._request_stop()
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self._loop = None
 
 
 def run_info(instance):
@@ -89,8 +226,8 @@ def run_sensor(instance):
     instance.get_sensor_data()
 
 
-def run_threads():
-    run_computer = MissionComputer()
+def run_threads(output=None):
+    run_computer = MissionComputer(output)
 
     t_info = threading.Thread(target=run_computer.get_mission_computer_info)
     t_load = threading.Thread(target=run_computer.get_mission_computer_load)
@@ -105,37 +242,152 @@ def run_threads():
     t_sensor.join()
 
 
+def run_publisher(bus_name, kind, interval):
+    # 수집한 값을 출력하지 않고 공유 메모리 버스의 kind 슬롯에 올리는 프로세스
+    run_computer = MissionComputer()
+    read = {
+        'sensor': run_computer.read_sensor_data,
+        'info': run_computer.read_mission_computer_info,
+        'load': run_computer.read_mission_computer_load
+    }[kind]
+    bus = TelemetryBus.attach(bus_name)
+    try:
+        deadline = time.monotonic()
+        while not bus.stop_requested:
+            bus.publish(kind, read())
+            deadline += interval
+            now = time.monotonic()
+            if deadline <= now:
+                deadline += (now - deadline) // interval * interval + interval
+            bus.wait(deadline - now)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        bus.close()
+
+
+def run_monitor(bus_name, intervals):
+    # 버스의 모든 슬롯을 읽어 한 번에 출력하는 프로세스 (여러 개 띄워도 됨)
+    bus = TelemetryBus.attach(bus_name)
+    try:
+        while not bus.wait(intervals['sensor']):
+            snapshot = {}
+            for kind in SLOT_NAMES:
+                try:
+                    record = bus.read(kind)
+                except WriterCrashed as e:
+                    print(e)
+                    record = None
+                snapshot[kind] = {
+                    'status': bus.status(kind, stale_after=intervals[kind] * 3),
+                    'data': record['data'] if record else None
+                }
+            print(json.dumps(snapshot, indent=4))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        bus.close()
+
+
 def run_processes():
-    run_computer1 = MissionComputer()
-    run_computer2 = MissionComputer()
-    run_computer3 = MissionComputer()
+    run_computer = MissionComputer()
+    bus = TelemetryBus.create()
 
-    p_info = multiprocessing.Process(target=run_info, args=(run_computer1,))
-    p_load = multiprocessing.Process(target=run_load, args=(run_computer2,))
-    p_sensor = multiprocessing.Process(target=run_sensor, args=(run_computer3,))
+    processes = [
+        multiprocessing.Process(
+            target=run_publisher,
+            args=(bus.name, kind, run_computer.intervals[kind])
+        )
+        for kind in SLOT_NAMES
+    ]
+    processes.append(multiprocessing.Process(
+        target=run_monitor, args=(bus.name, run_computer.intervals)
+    ))
 
-    p_info.start()
-    p_load.start()
-    p_sensor.start()
+    for process in processes:
+        process.start()
 
-    p_info.join()
-    p_load.join()
-    p_sensor.join()
+    try:
+        # is_alive()는 종료된 자식 프로세스를 정리(reap)하므로 비정상 종료도 감지됨
+        while any(process.is_alive() for process in processes):
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        bus.request_stop()
+        for process in processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+        bus.close()
+        bus.unlink()
+
+
+def run_async(output=None, socket_path=None):
+    # socket_path를 주면 수집한 값을 그 Unix 소켓의 구독자들에게도 보냄
+    run_computer = MissionComputer(output)
+
+    async def runner():
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, run_computer.stop)
+            except (NotImplementedError, RuntimeError):
+                pass
+        if socket_path is None:
+            await run_computer.run_async()
+            return
+
+        async with TelemetryServer(socket_path) as server:
+            local_output = run_computer.output
+
+            def publish(name, data):
+                local_output(name, data)
+                server(name, data)
+
+            await run_computer.run_async(output=publish)
+
+    asyncio.run(runner())
 
 
 def main():
     print('실행 모드를 선택하세요:')
     print('1: 멀티 스레드')
     print('2: 멀티 프로세스')
-    choice = input('선택 (1/2): ').strip()
+    print('3: asyncio 스케줄러')
+    choice = input('선택 (1/2/3): ').strip()
 
-    if choice == '1':
-        run_threads()
-    elif choice == '2':
+    if choice == '2':
         run_processes()
-    else:
-        print('잘못된 입력입니다. 기본값(멀티 스레드)으로 실행합니다.')
-        run_threads()
+        return
+
+    output = None
+    if input('JSON Lines 파일로 저장할까요? (y/N): ').strip().lower() == 'y':
+        output = JsonLinesSink(TELEMETRY_DIR)
+        print(f'{TELEMETRY_DIR} 폴더에 저장합니다.')
+
+    try:
+        if choice == '1':
+            run_threads(output)
+        elif choice == '3':
+            socket_path = input(f'구독 서버 소켓 경로 (Enter: {DEFAULT_SOCKET_PATH}, -: 사용 안 함): ').strip()
+            if socket_path == '-':
+                socket_path = None
+            elif not socket_path:
+                socket_path = DEFAULT_SOCKET_PATH
+            try:
+                run_async(output, socket_path)
+            except RuntimeError as e:
+                # 같은 소켓 경로로 이미 다른 서버가 실행 중인 경우
+                print(f'오류: {e}')
+        else:
+            print('잘못된 입력입니다. 기본값(멀티 스레드)으로 실행합니다.')
+            run_threads(output)
+    finally:
+        if output is not None:
+            output.close()
+            print(json.dumps(output.stats(), indent=4))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,224 @@
+# system_metrics.py
+# 목적: 미션 컴퓨터의 시스템 정보와 부하를 기다림 없이(non-blocking) 적은 비용으로 수집하는 모듈.
+#
+# [기존 방식의 문제]
+# - psutil.cpu_percent(interval=1)은 매번 1초 동안 멈춰서 CPU 사용률을 잼
+# - platform.processor() 같은 바뀌지 않는 정보를 20초마다 다시 조회함
+#
+# [동작 방식]
+# - 바뀌지 않는 정보(운영체제, CPU 종류, 코어 수, 메모리 크기)는 처음 한 번만 조회해서 저장
+# - CPU 사용률은 psutil.cpu_times(percpu=True)를 한 번 읽고, 이전 표본과의 차이(delta)로 계산
+#   (사용률 = 1 - 쉰 시간 증가량 / 전체 시간 증가량) → 기다리지 않음, 코어별 값도 같은 표본에서 계산
+# - 이전 표본(기준값)은 CpuDelta 객체에 저장하고, sample()과 load()가 각자 따로 가짐
+#   (기준값을 함께 쓰면 한쪽이 호출될 때마다 다른 쪽의 측정 구간이 짧아짐)
+# - 생성할 때 기준값을 만든 뒤 PRIME_INTERVAL초 기다려서, 첫 호출도 의미 있는 구간으로 계산
+#   (생성 직후 바로 호출하면 CPU 시간이 거의 늘지 않아 0% 같은 값이 나옴)
+# - 프로세스별 RSS 메모리와 CPU 시간은 psutil.Process 객체를 재사용하고 oneshot()으로 한 번에 읽음
+# - sample() 한 번에 걸린 시간(벽시계 / CPU 시간)을 기록해서 수집기 자체의 비용을 확인할 수 있음
+
+import argparse
+import json
+import os
+import platform
+import time
+
+import numpy as np
+import psutil  # 외부 라이브러리
+
+# CPU 시간 중 '쉬는 시간'으로 볼 항목 (운영체제마다 있는 항목만 사용)
+IDLE_FIELDS = ('idle', 'iowait')
+# user/nice에 이미 포함되어 있어 전체 시간에서 빼야 하는 항목 (Linux)
+GUEST_FIELDS = ('guest', 'guest_nice')
+# 첫 측정 구간을 확보하기 위해 생성할 때 한 번 기다리는 시간 (초, 운영체제 시간 단위 10ms의 10배)
+PRIME_INTERVAL = 0.1
+
+
+def read_host_info():
+    return {
+        'os': platform.system(),
+        'os_version': platform.version(),
+        'cpu_type': platform.processor(),
+        'cpu_core_count': os.cpu_count(),
+        'memory_size(GB)': round(
+            os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES') / (1024 ** 3), 2
+        )
+    }
+
+
+class CpuDelta:
+    """
+    직전 호출 이후의 CPU 사용률을 계산하는 클래스 (사용하는 쪽마다 하나씩 만듦)
+
+    - usage(): (전체 사용률, 코어별 사용률 배열)
+    """
+
+    def __init__(self):
+        first = psutil.cpu_times(percpu=True)
+        fields = first[0]._fields
+        self._idle_columns = [fields.index(name) for name in IDLE_FIELDS if name in fields]
+        self._guest_columns = [fields.index(name) for name in GUEST_FIELDS if name in fields]
+        self._last = self._totals(first)
+        self._result = (0.0, np.zeros(len(first)))
+
+    def _totals(self, per_cpu):
+        # (코어 수, 2) 배열: [쉰 시간, 전체 시간]
+        times = np.array(per_cpu, dtype=np.float64)
+        total = times.sum(axis=1) - times[:, self._guest_columns].sum(axis=1)
+        idle = times[:, self._idle_columns].sum(axis=1)
+        return np.stack([idle, total], axis=1)
+
+    def usage(self):
+        current = self._totals(psutil.cpu_times(percpu=True))
+        delta = current - self._last
+        idle, total = delta[:, 0], delta[:, 1]
+        overall_total = total.sum()
+        if overall_total <= 0:
+            # 직전 호출 이후 CPU 시간이 아직 늘지 않음 → 기준값을 그대로 두고 이전 결과를 돌려줌
+            return self._result
+        self._last = current
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            per_core = np.where(total > 0, 100.0 * (1.0 - idle / total), 0.0)
+        overall = 100.0 * (1.0 - idle.sum() / overall_total)
+        self._result = (overall, np.clip(per_core, 0.0, 100.0))
+        return self._result
+
+
+class MetricsCollector:
+    """
+    시스템/프로세스 지표 수집기
+
+    Parameters:
+    - pids: 함께 관찰할 프로세스 ID 목록 (기본값: 현재 프로세스)
+    """
+
+    def __init__(self, pids=None):
+        self.host_info = read_host_info()
+        self.processes = {}
+        for pid in (pids if pids is not None else [os.getpid()]):
+            self.watch(pid)
+
+        # sample()과 load()는 측정 구간이 서로 다르므로 기준값을 따로 둠
+        self._sample_cpu = CpuDelta()
+        self._load_cpu = CpuDelta()
+        time.sleep(PRIME_INTERVAL)
+
+        self.sample_count = 0
+        self.last_overhead = 0.0          # 마지막 sample()의 벽시계 시간 (초)
+        self.last_overhead_cpu = 0.0      # 마지막 sample()의 CPU 시간 (초)
+        self.total_overhead = 0.0
+        self.max_overhead = 0.0
+
+    def watch(self, pid):
+        """pid 프로세스를 관찰 대상에 추가하는 함수"""
+        process = psutil.Process(pid)
+        with process.oneshot():
+            times = process.cpu_times()
+        self.processes[pid] = [process, times.user + times.system, time.monotonic()]
+
+    def unwatch(self, pid):
+        self.processes.pop(pid, None)
+
+    def _process_metrics(self, now):
+        result = {}
+        for pid, state in list(self.processes.items()):
+            process, last_cpu_time, last_time = state
+            try:
+                with process.oneshot():
+                    rss = process.memory_info().rss
+                    times = process.cpu_times()
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                # 종료된 프로세스는 관찰 대상에서 뺌
+                del self.processes[pid]
+                continue
+            cpu_time = times.user + times.system
+            elapsed = now - last_time
+            usage = 100.0 * (cpu_time - last_cpu_time) / elapsed if elapsed > 0 else 0.0
+            state[1] = cpu_time
+            state[2] = now
+            result[pid] = {
+                'rss(MB)': round(rss / (1024 ** 2), 2),
+                'cpu_time(s)': round(cpu_time, 3),
+                'cpu_usage(%)': round(usage, 2)
+            }
+        return result
+
+    def sample(self):
+        """
+        지표 표본 하나를 수집하는 함수 (기다리지 않음)
+
+        - CPU 사용률은 이전 sample()(또는 생성 시점) 이후 구간의 평균 (load()와 무관)
+        """
+        started = time.perf_counter()
+        started_cpu = time.process_time()
+
+        overall, per_core = self._sample_cpu.usage()
+        memory = psutil.virtual_memory().percent
+        now = time.monotonic()
+        result = {
+            'timestamp': time.time(),
+            'cpu_usage(%)': round(float(overall), 2),
+            'cpu_per_core(%)': [round(float(value), 2) for value in per_core],
+            'memory_usage(%)': round(memory, 2),
+            'processes': self._process_metrics(now)
+        }
+
+        self.last_overhead = time.perf_counter() - started
+        self.last_overhead_cpu = time.process_time() - started_cpu
+        self.sample_count += 1
+        self.total_overhead += self.last_overhead
+        self.max_overhead = max(self.max_overhead, self.last_overhead)
+        result['collector_overhead(ms)'] = round(self.last_overhead * 1000, 3)
+        return result
+
+    def load(self):
+        """
+        기존 get_mission_computer_load()와 같은 형식의 부하 정보
+
+        - CPU 사용률은 이전 load()(또는 생성 시점) 이후 구간의 평균 (sample()과 무관)
+        """
+        overall, _ = self._load_cpu.usage()
+        return {
+            'cpu_usage(%)': round(float(overall), 2),
+            'memory_usage(%)': round(psutil.virtual_memory().percent, 2)
+        }
+
+    def overhead(self):
+        """지금까지 sample()의 평균/최대 소요 시간 (밀리초)"""
+        mean = self.total_overhead / self.sample_count if self.sample_count else 0.0
+        return {
+            'samples': self.sample_count,
+            'mean(ms)': round(mean * 1000, 3),
+            'max(ms)': round(self.max_overhead * 1000, 3)
+        }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='시스템 지표 수집기 비용 측정')
+    parser.add_argument('--hz', type=float, default=10.0, help='초당 수집 횟수')
+    parser.add_argument('--seconds', type=float, default=5.0, help='측정 시간 (초)')
+    parser.add_argument('--pid', type=int, action='append', help='함께 관찰할 프로세스 ID')
+    args = parser.parse_args(argv)
+
+    collector = MetricsCollector(args.pid)
+    print(json.dumps(collector.host_info, indent=4))
+
+    interval = 1.0 / args.hz
+    deadline = time.monotonic()
+    end = deadline + args.seconds
+    started_cpu = time.process_time()
+    result = None
+    while deadline < end:
+        result = collector.sample()
+        deadline += interval
+        time.sleep(max(0.0, deadline - time.monotonic()))
+    used_cpu = time.process_time() - started_cpu
+
+    print(json.dumps(result, indent=4))
+    overhead = collector.overhead()
+    overhead['cpu_share(%)'] = round(100.0 * used_cpu / args.seconds, 3)
+    print(json.dumps(overhead, indent=4))
+
+
+if __name__ == '__main__':
+    main()
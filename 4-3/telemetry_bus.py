@@ -0,0 +1,289 @@
+# telemetry_bus.py
+# 목적: 여러 프로세스가 센서/시스템 정보/부하 값을 공유 메모리 한 곳에 올리고(publish),
+#       다른 프로세스들이 피클(pickle)이나 큐 없이 바로 읽을 수 있게 하는 모듈.
+#
+# [공유 메모리 배치]
+# - 헤더(매직 번호, 버전, 슬롯 수) 뒤에 종류별(sensor / info / load) 슬롯이 고정된 순서로 놓임
+# - 슬롯 하나 = 순번(seq), 작성 프로세스 ID, 하트비트 시각, 기록 시각, 숫자 값 배열, 텍스트 바이트
+#   (numpy 구조화 배열로 공유 메모리 버퍼를 그대로 바라봄 → 복사/직렬화 없음)
+# - 헤더의 종료 요청 플래그로 모든 프로세스에 종료를 알림
+#   (multiprocessing.Event는 대기 중인 프로세스가 강제 종료되면 set()이 멈출 수 있어서 사용하지 않음)
+#
+# [시퀀스 락(seqlock)]
+# - 작성자: seq를 1 늘림(홀수 = 쓰는 중) → 값 기록 → seq를 1 더 늘림(짝수 = 완료)
+# - 읽는 쪽: seq 확인 → 값 복사 → seq 다시 확인, 두 값이 같고 짝수일 때만 그 값을 사용
+#   (읽는 쪽은 잠금을 잡지 않으므로 읽는 프로세스가 몇 개든 작성자를 막지 않음)
+# - 슬롯마다 작성자는 한 프로세스만 있어야 함
+#
+# [작성자 비정상 종료 감지]
+# - 슬롯에 작성자의 프로세스 ID를 기록해 두고, os.kill(pid, 0)으로 살아 있는지 확인
+# - 쓰는 도중(seq가 홀수)에 작성자가 죽었으면 WriterCrashed 예외
+# - 마지막 기록(하트비트)이 오래전이면 status()가 'stale'을 돌려줌
+# - 작성자가 close()로 정상 종료하면 자기가 쓴 슬롯의 pid를 음수(-pid)로 바꿔 둠
+#   → 비정상 종료('crashed')와 구분해서 status()가 'stopped'를 돌려주고, 마지막 값은 계속 읽을 수 있음
+
+import json
+import os
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from telemetry_history import CHANNELS
+
+BUS_MAGIC = 0x4D41525354454C45    # 'MARSTELE'
+BUS_VERSION = 1
+
+# 슬롯 종류와 숫자 값 이름 (info는 JSON 텍스트로 저장)
+SLOT_FIELDS = {
+    'sensor': CHANNELS,
+    'info': (),
+    'load': ('cpu_usage(%)', 'memory_usage(%)')
+}
+SLOT_NAMES = tuple(SLOT_FIELDS)
+MAX_VALUES = 8
+TEXT_SIZE = 1024
+
+HEADER_DTYPE = np.dtype([
+    ('magic', '<u8'),
+    ('version', '<u4'),
+    ('slot_count', '<u4'),
+    ('stop_requested', '<u4'),
+    ('reserved', '<u4')
+])
+SLOT_DTYPE = np.dtype([
+    ('seq', '<u8'),
+    ('pid', '<i8'),
+    ('heartbeat', '<f8'),
+    ('timestamp', '<f8'),
+    ('text_length', '<u4'),
+    ('value_count', '<u4'),
+    ('values', '<f8', (MAX_VALUES,)),
+    ('text', 'u1', (TEXT_SIZE,))
+], align=True)
+
+# 작성 중인 슬롯을 다시 읽어 볼 최대 횟수
+READ_RETRIES = 1000
+
+# wait()에서 종료 요청을 확인하는 간격 (초)
+STOP_POLL_INTERVAL = 0.1
+
+
+class WriterCrashed(RuntimeError):
+    """작성자 프로세스가 슬롯을 쓰는 도중에 종료되었을 때 발생하는 예외"""
+
+
+def bus_size():
+    return HEADER_DTYPE.itemsize + SLOT_DTYPE.itemsize * len(SLOT_NAMES)
+
+
+def process_alive(pid):
+    if pid <= 0:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # 다른 사용자의 프로세스 → 존재함
+        return True
+    return True
+
+
+class TelemetryBus:
+    """
+    공유 메모리 텔레메트리 버스
+
+    - TelemetryBus.create(): 새 공유 메모리 블록을 만듦 (부모 프로세스에서 한 번)
+    - TelemetryBus.attach(name): 이미 있는 블록에 연결 (수집/조회 프로세스)
+    - close(): 연결 해제, unlink(): 블록 삭제 (만든 프로세스가 마지막에 호출)
+    """
+
+    def __init__(self, shm, owner):
+        self.shm = shm
+        self.owner = owner
+        self.name = shm.name
+        self.header = np.ndarray((), dtype=HEADER_DTYPE, buffer=shm.buf)
+        self.slots = np.ndarray((len(SLOT_NAMES),), dtype=SLOT_DTYPE, buffer=shm.buf,
+                                offset=HEADER_DTYPE.itemsize)
+        self.pid = os.getpid()
+        self._written = set()    # 이 연결로 값을 기록한 슬롯 번호 (close()에서 정상 종료 표시)
+
+    @classmethod
+    def create(cls, name=None):
+        shm = shared_memory.SharedMemory(name=name, create=True, size=bus_size())
+        bus = cls(shm, owner=True)
+        bus.slots[...] = np.zeros((), dtype=SLOT_DTYPE)
+        bus.header['version'] = BUS_VERSION
+        bus.header['slot_count'] = len(SLOT_NAMES)
+        # 매직 번호를 마지막에 써서, 초기화가 끝난 블록만 attach()가 받아들이게 함
+        bus.header['magic'] = BUS_MAGIC
+        return bus
+
+    @classmethod
+    def attach(cls, name):
+        shm = shared_memory.SharedMemory(name=name)
+        bus = cls(shm, owner=False)
+        if (int(bus.header['magic']) != BUS_MAGIC
+                or int(bus.header['version']) != BUS_VERSION
+                or int(bus.header['slot_count']) != len(SLOT_NAMES)):
+            bus.close()
+            raise ValueError(f'텔레메트리 버스 형식이 다릅니다: {name}')
+        return bus
+
+    def close(self):
+        if self.slots is None:
+            return
+        # 기록하던 슬롯은 '정상 종료'로 표시 (seqlock 안에서 pid를 음수로 바꿈)
+        for index in self._written:
+            slot = self.slots[index]
+            if int(slot['pid']) != self.pid:
+                # 그사이 다른 작성자가 이어서 쓰고 있는 슬롯은 건드리지 않음
+                continue
+            slot['seq'] += 1
+            slot['pid'] = -self.pid
+            slot['seq'] += 1
+        self._written.clear()
+        # numpy 배열이 버퍼를 잡고 있으면 공유 메모리를 닫을 수 없으므로 먼저 해제
+        self.header = None
+        self.slots = None
+        self.shm.close()
+
+    def unlink(self):
+        self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        if self.owner:
+            self.unlink()
+
+    def request_stop(self):
+        """버스에 연결된 모든 프로세스에 종료를 요청하는 함수"""
+        self.header['stop_requested'] = 1
+
+    @property
+    def stop_requested(self):
+        return bool(self.header['stop_requested'])
+
+    def wait(self, timeout):
+        """
+        timeout초 동안 기다리는 함수 (그 사이 종료 요청이 오면 바로 돌아옴)
+
+        Returns:
+        - bool: 종료 요청이 있으면 True
+        """
+        deadline = time.monotonic() + max(0, timeout)
+        while not self.stop_requested:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(remaining, STOP_POLL_INTERVAL))
+        return True
+
+    def _index(self, kind):
+        try:
+            return SLOT_NAMES.index(kind)
+        except ValueError:
+            raise KeyError(f'알 수 없는 슬롯입니다: {kind}') from None
+
+    def _slot(self, kind):
+        return self.slots[self._index(kind)]
+
+    def publish(self, kind, data, timestamp=None):
+        """
+        슬롯에 값을 기록하는 함수
+
+        - sensor / load: SLOT_FIELDS의 이름을 키로 가진 딕셔너리
+        - info: JSON으로 바꿀 수 있는 딕셔너리 (TEXT_SIZE 바이트 이하)
+        """
+        index = self._index(kind)
+        slot = self.slots[index]
+        fields = SLOT_FIELDS[kind]
+        if fields:
+            text = b''
+        else:
+            text = json.dumps(data, ensure_ascii=False).encode('utf-8')
+            if len(text) > TEXT_SIZE:
+                raise ValueError(f'{kind} 값이 너무 깁니다: {len(text)} 바이트')
+        now = time.time()
+
+        if int(slot['seq']) & 1:
+            # 이전 작성자가 쓰는 도중에 종료된 슬롯 → 짝수로 맞춘 뒤 새로 씀
+            slot['seq'] += 1
+        slot['seq'] += 1     # 홀수: 쓰는 중
+        slot['pid'] = self.pid
+        slot['timestamp'] = now if timestamp is None else timestamp
+        slot['heartbeat'] = now
+        for i, field in enumerate(fields):
+            slot['values'][i] = data[field]
+        slot['value_count'] = len(fields)
+        slot['text'][:len(text)] = np.frombuffer(text, dtype=np.uint8)
+        slot['text_length'] = len(text)
+        slot['seq'] += 1     # 짝수: 완료
+        self._written.add(index)
+
+    def read(self, kind):
+        """
+        슬롯의 일관된 최신 값을 읽는 함수 (아직 기록이 없으면 None)
+
+        Returns:
+        - dict: {'timestamp': 기록 시각, 'pid': 작성자, 'data': 딕셔너리}
+          (작성자가 정상 종료한 슬롯이면 마지막으로 기록한 값)
+
+        [예외]
+        WriterCrashed: 작성자가 쓰는 도중에 종료되었을 때
+        """
+        slot = self._slot(kind)
+        for _ in range(READ_RETRIES):
+            before = int(slot['seq'])
+            if before & 1:
+                # 정상 종료 표시 중에는 pid가 음수일 수 있으므로 절댓값으로 확인
+                if not process_alive(abs(int(slot['pid']))):
+                    raise WriterCrashed(f'{kind} 작성자(pid {int(slot["pid"])})가 '
+                                        f'기록 도중 종료되었습니다.')
+                time.sleep(0)
+                continue
+            if before == 0:
+                return None
+            snapshot = slot.copy()
+            if int(slot['seq']) == before:
+                return self._decode(kind, snapshot)
+        raise TimeoutError(f'{kind} 슬롯을 읽지 못했습니다 (작성이 계속 진행 중).')
+
+    def _decode(self, kind, snapshot):
+        fields = SLOT_FIELDS[kind]
+        if fields:
+            data = {field: float(snapshot['values'][i]) for i, field in enumerate(fields)}
+        else:
+            text = snapshot['text'][:int(snapshot['text_length'])].tobytes()
+            data = json.loads(text.decode('utf-8'))
+        return {
+            'timestamp': float(snapshot['timestamp']),
+            'pid': abs(int(snapshot['pid'])),
+            'data': data
+        }
+
+    def status(self, kind, stale_after=None):
+        """
+        슬롯 상태를 돌려주는 함수
+
+        - 'empty': 아직 기록 없음
+        - 'stopped': 작성자가 close()로 정상 종료함
+        - 'crashed': 작성자 프로세스가 close() 없이 종료됨
+        - 'stale': 하트비트가 stale_after초 넘게 갱신되지 않음
+        - 'ok': 정상
+        """
+        slot = self._slot(kind)
+        if int(slot['seq']) == 0:
+            return 'empty'
+        pid = int(slot['pid'])
+        if pid < 0:
+            return 'stopped'
+        if not process_alive(pid):
+            return 'crashed'
+        if stale_after is not None and time.time() - float(slot['heartbeat']) > stale_after:
+            return 'stale'
+        return 'ok'
@@ -0,0 +1,192 @@
+# telemetry_history.py
+# 목적: 센서 값(mars_base_* 6개 채널)의 최근 기록을 고정 크기 배열에 보관하고,
+#       최근 w개 표본의 평균/최솟값/최댓값을 O(1)로 조회하는 모듈.
+#
+# [동작 방식]
+# - (capacity, 1 + 채널 수) 크기의 float64 배열을 처음에 한 번만 만들어 두고 순환 버퍼로 사용
+#   (0번 열: 타임스탬프, 1번 열부터: 채널 값). 가득 차면 가장 오래된 행을 덮어씀
+# - 표본을 추가할 때 딕셔너리나 리스트를 새로 만들지 않음 (미리 만든 배열에 값만 씀)
+# - 조회할 창(window) 크기는 표본 개수로 미리 정해 둠 (예: 5초 주기에서 720개 = 1시간)
+#   · 평균: 창의 합계를 유지하면서 새 값은 더하고 창을 벗어나는 값은 뺌
+#   · 최솟값/최댓값: van Herk/Gil-Werman 방식
+#     표본을 창 크기만큼의 블록으로 나누고, 직전 블록의 '뒤에서부터 누적 최솟값'과
+#     현재 블록의 '앞에서부터 누적 최솟값' 두 개만 비교
+#     (블록이 끝날 때 한 번 O(w)로 계산 → 표본 하나당 평균 O(1))
+
+import numpy as np
+
+CHANNELS = (
+    'mars_base_internal_temperature',
+    'mars_base_external_temperature',
+    'mars_base_internal_humidity',
+    'mars_base_external_illuminance',
+    'mars_base_internal_co2',
+    'mars_base_internal_oxygen'
+)
+
+
+class RollingWindow:
+    """
+    최근 size개 표본의 합계/최솟값/최댓값을 채널별로 유지하는 클래스
+    (값은 TelemetryHistory가 push()/finish_block()으로 넣어 줌)
+    """
+
+    def __init__(self, size, channels):
+        self.size = size
+        self.total = np.zeros(channels)
+        self.prefix_min = np.full(channels, np.inf)     # 현재 블록의 앞에서부터 누적 최솟값
+        self.prefix_max = np.full(channels, -np.inf)
+        self.suffix_min = np.empty((size, channels))    # 직전 블록의 뒤에서부터 누적 최솟값
+        self.suffix_max = np.empty((size, channels))
+        self.has_previous = False    # 완성된 블록이 하나라도 있는지
+        self.offset = -1             # 마지막 표본의 블록 안 위치 (0 ~ size-1)
+        self._result = np.empty(channels)
+
+    def push(self, row, leaving):
+        """새 표본(row)을 더하는 함수 (leaving: 창을 벗어나는 표본, 없으면 None)"""
+        self.offset = (self.offset + 1) % self.size
+        self.total += row
+        if leaving is not None:
+            self.total -= leaving
+        if self.offset == 0:
+            self.prefix_min[:] = row
+            self.prefix_max[:] = row
+        else:
+            np.minimum(self.prefix_min, row, out=self.prefix_min)
+            np.maximum(self.prefix_max, row, out=self.prefix_max)
+
+    def finish_block(self, block):
+        """블록(size개 표본)이 끝났을 때 뒤에서부터의 누적 최솟값/최댓값을 계산하는 함수"""
+        np.minimum.accumulate(block[::-1], axis=0, out=self.suffix_min[::-1])
+        np.maximum.accumulate(block[::-1], axis=0, out=self.suffix_max[::-1])
+        # 창이 블록과 정확히 겹치는 순간이므로 합계를 다시 계산해서 누적 오차를 없앰
+        block.sum(axis=0, out=self.total)
+        self.has_previous = True
+
+    def _combine(self, ufunc, prefix, suffix):
+        if self.offset == self.size - 1:
+            # 창 = 방금 끝난 블록 전체
+            self._result[:] = suffix[0]
+        elif self.has_previous:
+            # 창 = 직전 블록의 (offset+1)번째부터 끝까지 + 현재 블록의 처음부터 offset번째까지
+            ufunc(suffix[self.offset + 1], prefix, out=self._result)
+        else:
+            self._result[:] = prefix
+        return self._result.copy()
+
+    def minimum(self):
+        return self._combine(np.minimum, self.prefix_min, self.suffix_min)
+
+    def maximum(self):
+        return self._combine(np.maximum, self.prefix_max, self.suffix_max)
+
+
+class TelemetryHistory:
+    """
+    최근 capacity개 센서 표본을 보관하는 순환 버퍼
+
+    Parameters:
+    - capacity (int): 보관할 표본 수 (예: 5초 주기로 24시간 → 17280)
+    - windows: 평균/최솟값/최댓값을 O(1)로 조회할 창 크기(표본 수) 목록
+    - channels: 채널 이름 목록 (기본값: mars_base_* 6개)
+    """
+
+    def __init__(self, capacity, windows=(), channels=CHANNELS):
+        if capacity <= 0:
+            raise ValueError('capacity는 0보다 커야 합니다.')
+        self.capacity = capacity
+        self.channels = tuple(channels)
+        self.data = np.zeros((capacity, 1 + len(self.channels)))
+        self.timestamps = self.data[:, 0]
+        self.values = self.data[:, 1:]
+        self.count = 0    # 지금까지 추가된 전체 표본 수
+        self._row = np.empty(len(self.channels))
+        self.windows = {}
+        for size in windows:
+            if not 0 < size <= capacity:
+                raise ValueError(f'창 크기는 1 ~ {capacity} 사이여야 합니다: {size}')
+            self.windows[size] = RollingWindow(size, len(self.channels))
+
+    def __len__(self):
+        return min(self.count, self.capacity)
+
+    def append(self, timestamp, env_values):
+        """
+        표본 하나를 추가하는 함수 (O(1), 가장 오래된 표본을 덮어씀)
+
+        - env_values: 채널 이름을 키로 가진 딕셔너리 (DummySensor.get_env()의 결과)
+        """
+        row = self._row
+        for i, name in enumerate(self.channels):
+            row[i] = env_values[name]
+
+        position = self.count % self.capacity
+        # 창을 벗어나는 값은 덮어쓰기 전에 빼야 함 (창 크기 = capacity인 경우)
+        for size, window in self.windows.items():
+            leaving = self.values[(position - size) % self.capacity] \
+                if self.count >= size else None
+            window.push(row, leaving)
+
+        self.data[position, 0] = timestamp
+        self.values[position] = row
+        self.count += 1
+
+        for window in self.windows.values():
+            if window.offset == window.size - 1:
+                window.finish_block(self._last(window.size))
+
+    def _last(self, size):
+        """최근 size개 표본의 값 (오래된 것부터, 순환 버퍼가 이어지는 곳이면 복사본)"""
+        end = self.count % self.capacity or self.capacity
+        if size <= end:
+            return self.values[end - size:end]
+        return np.concatenate([self.values[self.capacity - (size - end):], self.values[:end]])
+
+    def _window(self, size):
+        try:
+            return self.windows[size]
+        except KeyError:
+            raise KeyError(f'등록되지 않은 창 크기입니다: {size} '
+                           f'(사용 가능: {sorted(self.windows)})') from None
+
+    def mean(self, size):
+        """최근 size개 표본의 채널별 평균 (표본이 size개보다 적으면 있는 표본만으로 계산)"""
+        if self.count == 0:
+            return np.full(len(self.channels), np.nan)
+        return self._window(size).total / min(self.count, size)
+
+    def minimum(self, size):
+        """최근 size개 표본의 채널별 최솟값"""
+        if self.count == 0:
+            return np.full(len(self.channels), np.nan)
+        return self._window(size).minimum()
+
+    def maximum(self, size):
+        """최근 size개 표본의 채널별 최댓값"""
+        if self.count == 0:
+            return np.full(len(self.channels), np.nan)
+        return self._window(size).maximum()
+
+    def summary(self, size):
+        """{채널 이름: {'mean': 평균, 'min': 최솟값, 'max': 최댓값}} 형태의 요약"""
+        means, minimums, maximums = self.mean(size), self.minimum(size), self.maximum(size)
+        return {
+            name: {'mean': float(means[i]), 'min': float(minimums[i]), 'max': float(maximums[i])}
+            for i, name in enumerate(self.channels)
+        }
+
+    def latest(self):
+        """가장 최근 표본 (타임스탬프, 채널 값 배열), 표본이 없으면 None"""
+        if self.count == 0:
+            return None
+        position = (self.count - 1) % self.capacity
+        return float(self.timestamps[position]), self.values[position].copy()
+
+    def to_arrays(self):
+        """보관 중인 전체 기록을 오래된 순서로 (타임스탬프 배열, 값 배열)로 돌려주는 함수"""
+        if self.count <= self.capacity:
+            rows = self.data[:self.count]
+        else:
+            start = self.count % self.capacity
+            rows = np.concatenate([self.data[start:], self.data[:start]])
+        return rows[:, 0].copy(), rows[:, 1:].copy()
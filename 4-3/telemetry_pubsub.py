@@ -0,0 +1,290 @@
+# telemetry_pubsub.py
+# 목적: 수집한 값을 Unix 도메인 소켓으로 여러 구독자(대시보드, 경보 도구 등)에게
+#       실시간으로 나눠 보내는(fan-out) 발행/구독(pub/sub) 서버.
+#
+# [프로토콜]
+# - 구독자는 소켓에 연결한 뒤 한 줄을 보냄: {"subscribe": ["sensor", "load"]}
+#   (빈 목록이거나 "*"이면 모든 종류, 나중에 다시 보내면 구독 종류가 바뀜)
+#   첫 요청을 받기 전에는 아무 레코드도 보내지 않음
+# - 형식이 잘못된 요청에는 {"kind": "error", "message": ...}로 답하고 기존 구독을 유지
+# - 서버는 한 줄에 하나씩 JSON을 보냄: {"timestamp": ..., "kind": "sensor", "data": {...}}
+# - 느린 구독자 때문에 버려진 레코드가 있으면 다음에 {"kind": "dropped", "count": n}을 먼저 보냄
+#
+# [동작 방식]
+# - asyncio로 모든 연결을 하나의 스레드에서 처리 (구독자마다 스레드를 만들지 않음)
+# - 레코드는 JSON으로 한 번만 바꾸고, 같은 바이트를 모든 구독자가 함께 사용
+# - 구독자마다 크기가 정해진 큐(deque(maxlen))를 두고, 가득 차면 가장 오래된 레코드를 버림
+#   → 느린 구독자가 서버나 다른 구독자를 막지 않음
+# - 구독자마다 보내기 작업(task)이 큐에 쌓인 것을 한 번에 모아 보내고 drain()으로 기다림
+
+import argparse
+import asyncio
+import collections
+import json
+import os
+import stat
+import time
+
+DEFAULT_SOCKET_PATH = '/tmp/mars_telemetry.sock'
+DEFAULT_QUEUE_SIZE = 256
+# 동시에 연결을 기다릴 수 있는 구독자 수 (기본값 100이면 수백 개가 한꺼번에 연결할 때 거절됨)
+LISTEN_BACKLOG = 1024
+TOPICS = ('sensor', 'info', 'load')
+
+
+def parse_topics(line):
+    """
+    구독 요청 한 줄에서 구독 종류 목록을 꺼내는 함수
+
+    Returns:
+    - list: 구독 종류 문자열 목록 (빈 목록 = 모든 종류), 형식이 잘못되었으면 None
+    """
+    try:
+        request = json.loads(line)
+    except ValueError:
+        return None
+    if not isinstance(request, dict):
+        return None
+    topics = request.get('subscribe', [])
+    if isinstance(topics, str):
+        topics = [topics]
+    if not isinstance(topics, list) or not all(isinstance(topic, str) for topic in topics):
+        return None
+    return topics
+
+
+class Subscriber:
+    """연결된 구독자 하나 (구독 종류, 보낼 레코드 큐, 카운터)"""
+
+    def __init__(self, writer, queue_size):
+        self.writer = writer
+        self.topics = set()              # None = 모든 종류, 빈 집합 = 아직 구독 요청 전
+        self.queue = collections.deque(maxlen=queue_size)
+        self.ready = asyncio.Event()
+        self.notices = []                # 레코드보다 먼저 보낼 알림 줄
+        self.sent = 0
+        self.dropped = 0
+        self._reported_dropped = 0
+
+    def wants(self, kind):
+        return self.topics is None or kind in self.topics
+
+    def push(self, line):
+        if len(self.queue) == self.queue.maxlen:
+            # deque(maxlen)은 가득 차면 가장 오래된 항목을 자동으로 버림
+            self.dropped += 1
+        self.queue.append(line)
+        self.ready.set()
+
+    def notify(self, message):
+        """레코드가 아닌 알림(오류 등)을 보낼 줄로 큐에 넣는 함수 (sent에는 세지 않음)"""
+        self.notices.append(json.dumps(message, ensure_ascii=False).encode('utf-8') + b'\n')
+        self.ready.set()
+
+    def take(self):
+        """큐에 쌓인 레코드를 모두 꺼내 하나의 바이트열로 만드는 함수"""
+        lines = self.notices
+        self.notices = []
+        if self.dropped != self._reported_dropped:
+            notice = {'kind': 'dropped', 'count': self.dropped - self._reported_dropped}
+            lines.append(json.dumps(notice).encode('utf-8') + b'\n')
+            self._reported_dropped = self.dropped
+        # sent에는 실제로 보낸 레코드만 셈 (알림 줄은 제외)
+        self.sent += len(self.queue)
+        while self.queue:
+            lines.append(self.queue.popleft())
+        return b''.join(lines)
+
+
+class TelemetryServer:
+    """
+    Unix 도메인 소켓 발행/구독 서버
+
+    - server(name, data) 또는 server.publish(name, data)로 레코드를 발행
+      (MissionComputer.run_async(output=server)로 바로 연결 가능)
+    - 이벤트 루프가 아닌 다른 스레드에서 호출해도 안전함
+
+    Parameters:
+    - path (str): 소켓 파일 경로
+    - queue_size (int): 구독자마다 보관할 최대 레코드 수
+    """
+
+    def __init__(self, path=DEFAULT_SOCKET_PATH, queue_size=DEFAULT_QUEUE_SIZE):
+        self.path = path
+        self.queue_size = queue_size
+        self.subscribers = set()
+        self.published = 0
+        self._server = None
+        self._loop = None
+        self._tasks = set()
+
+    async def start(self):
+        """
+        소켓을 열고 연결을 받기 시작하는 함수
+
+        [예외]
+        RuntimeError: 같은 경로에서 다른 서버가 이미 실행 중이거나, 소켓이 아닌 파일이 있을 때
+        """
+        self._loop = asyncio.get_running_loop()
+        await self._remove_stale_socket()
+        self._server = await asyncio.start_unix_server(self._handle_client, path=self.path,
+                                                       backlog=LISTEN_BACKLOG)
+        return self
+
+    async def _remove_stale_socket(self):
+        # 소켓 파일이 있어도 다른 서버가 쓰는 중일 수 있으므로 먼저 연결해 봄
+        try:
+            _, writer = await asyncio.open_unix_connection(self.path)
+        except FileNotFoundError:
+            return
+        except ConnectionRefusedError:
+            # 소켓 파일이 아닌 것(일반 파일 등)은 실수로 지우지 않도록 거부
+            if not stat.S_ISSOCK(os.lstat(self.path).st_mode):
+                raise RuntimeError(f'{self.path}은(는) 소켓 파일이 아니어서 사용할 수 없습니다.')
+            # 이전 실행이 비정상 종료되어 남은 소켓 파일 → 지우고 다시 만듦
+            os.unlink(self.path)
+            return
+        writer.close()
+        raise RuntimeError(f'{self.path}에서 이미 다른 서버가 실행 중입니다.')
+
+    async def close(self):
+        if self._server is None:
+            return
+        self._server.close()
+        for subscriber in list(self.subscribers):
+            subscriber.writer.close()
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        await self._server.wait_closed()
+        self._server = None
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def __call__(self, name, data):
+        self.publish(name, data)
+
+    def publish(self, name, data, timestamp=None):
+        record = {'timestamp': time.time() if timestamp is None else timestamp,
+                  'kind': name, 'data': data}
+        line = json.dumps(record, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+        line += b'\n'
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            self._fan_out(name, line)
+        else:
+            loop.call_soon_threadsafe(self._fan_out, name, line)
+
+    def _fan_out(self, name, line):
+        self.published += 1
+        for subscriber in self.subscribers:
+            if subscriber.wants(name):
+                subscriber.push(line)
+
+    async def _handle_client(self, reader, writer):
+        subscriber = Subscriber(writer, self.queue_size)
+        self.subscribers.add(subscriber)
+        sender = asyncio.create_task(self._send_loop(subscriber))
+        self._tasks.add(sender)
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # 줄이 너무 김 (스트림 버퍼 한도 초과) → 잘못된 구독자로 보고 연결을 끊음
+                    break
+                if not line:
+                    break
+                topics = parse_topics(line)
+                if topics is None:
+                    # 형식이 잘못된 요청은 거부하고 기존 구독을 유지
+                    subscriber.notify({'kind': 'error',
+                                       'message': 'subscribe는 문자열 목록이어야 합니다.'})
+                    continue
+                subscriber.topics = None if not topics or '*' in topics else set(topics)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.subscribers.discard(subscriber)
+            sender.cancel()
+            writer.close()
+            self._tasks.discard(sender)
+
+    async def _send_loop(self, subscriber):
+        writer = subscriber.writer
+        try:
+            while True:
+                await subscriber.ready.wait()
+                subscriber.ready.clear()
+                data = subscriber.take()
+                if data:
+                    writer.write(data)
+                    # 구독자가 느리면 여기서 기다리는 동안 새 레코드는 큐에 쌓이고 오래된 것부터 버려짐
+                    await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.subscribers.discard(subscriber)
+
+    def stats(self):
+        return {
+            'subscribers': len(self.subscribers),
+            'published': self.published,
+            'sent': sum(subscriber.sent for subscriber in self.subscribers),
+            'dropped': sum(subscriber.dropped for subscriber in self.subscribers)
+        }
+
+
+async def subscribe(path=DEFAULT_SOCKET_PATH, topics=()):
+    """
+    서버에 구독을 요청하고 받은 레코드를 하나씩 돌려주는 비동기 제너레이터
+
+    예시:
+    async for record in subscribe(topics=['sensor']):
+        print(record['data'])
+    """
+    reader, writer = await asyncio.open_unix_connection(path)
+    try:
+        writer.write(json.dumps({'subscribe': list(topics)}).encode('utf-8') + b'\n')
+        await writer.drain()
+        while True:
+            line = await reader.readline()
+            if not line:
+                return
+            yield json.loads(line)
+    finally:
+        writer.close()
+
+
+async def print_subscription(path, topics):
+    async for record in subscribe(path, topics):
+        print(json.dumps(record, ensure_ascii=False))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='텔레메트리 구독 (한 줄에 하나씩 JSON 출력)')
+    parser.add_argument('topics', nargs='*', help=f'구독할 종류 {TOPICS} (기본값: 전부)')
+    parser.add_argument('--socket', default=DEFAULT_SOCKET_PATH, help='소켓 파일 경로')
+    args = parser.parse_args(argv)
+
+    try:
+        asyncio.run(print_subscription(args.socket, args.topics))
+    except (KeyboardInterrupt, ConnectionError, FileNotFoundError) as e:
+        if not isinstance(e, KeyboardInterrupt):
+            print(f'오류: {args.socket}에 연결할 수 없습니다. ({e})')
+
+
+if __name__ == '__main__':
+    main()
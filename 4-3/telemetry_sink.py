@@ -0,0 +1,217 @@
+# telemetry_sink.py
+# 목적: 수집기가 만든 값을 화면에 들여쓰기 JSON으로 출력하는 대신,
+#       한 줄에 하나씩 JSON(JSON Lines) 파일로 모아서 저장하는 모듈.
+#
+# [동작 방식]
+# - 수집기는 sink(name, data)를 호출하면 그 자리에서 JSON 한 줄(바이트)로 바꿔 큐에 넣기만 함
+#   → 디스크 쓰기를 기다리지 않음, 호출한 뒤 data를 고쳐도 기록될 값이 바뀌지 않음
+#   → JSON으로 바꿀 수 없는 값이면 호출한 쪽에서 바로 예외(TypeError/ValueError)가 발생함
+#   (큐가 가득 차면 기다리지 않고 버리고, 버린 개수를 dropped로 셈)
+# - 백그라운드 스레드가 큐에서 꺼내 버퍼에 모아 두었다가
+#   버퍼 크기(flush_bytes) 또는 시간(flush_interval)이 차면 한 번에 파일에 씀
+# - 파일 크기(max_bytes) 또는 시간(rotate_interval)이 넘으면 새 파일로 바꿈(rotation)
+# - compress=True이면 gzip으로 압축 (.jsonl.gz, 기록할 때마다 flush해서 중간에도 읽을 수 있음)
+# - 프로그램이 끝날 때(atexit) 남은 버퍼를 모두 기록함
+#
+# 한 줄 형식: {"timestamp": 1700000000.0, "kind": "sensor", "data": {...}}
+
+import atexit
+import gzip
+import json
+import os
+import queue
+import threading
+import time
+
+# 큐에서 꺼낸 값이 이것이면 백그라운드 스레드를 끝냄
+_STOP = object()
+
+
+def print_collected(name, data):
+    # 기존 방식: 들여쓰기 JSON을 화면에 출력
+    print(json.dumps(data, indent=4))
+
+
+class JsonLinesSink:
+    """
+    버퍼링 + 파일 교체를 지원하는 JSON Lines 저장소
+
+    Parameters:
+    - directory (str): 파일을 저장할 폴더
+    - prefix (str): 파일 이름 앞부분 (예: telemetry-20250101-120000-0.jsonl)
+    - compress (bool): gzip 압축 여부
+    - max_bytes (int): 파일 하나의 최대 크기 (압축 후 기준, None이면 크기로 바꾸지 않음)
+    - rotate_interval (float): 파일을 바꾸는 주기 (초, None이면 시간으로 바꾸지 않음)
+    - flush_bytes (int): 버퍼가 이 크기를 넘으면 파일에 씀
+    - flush_interval (float): 마지막 기록 후 이 시간(초)이 지나면 파일에 씀
+    - queue_size (int): 아직 기록하지 못한 레코드를 최대 몇 개까지 보관할지
+    """
+
+    def __init__(self, directory='.', prefix='telemetry', compress=False,
+                 max_bytes=64 * 1024 * 1024, rotate_interval=3600,
+                 flush_bytes=64 * 1024, flush_interval=1.0, queue_size=10000):
+        self.directory = directory
+        self.prefix = prefix
+        self.compress = compress
+        self.max_bytes = max_bytes
+        self.rotate_interval = rotate_interval
+        self.flush_bytes = flush_bytes
+        self.flush_interval = flush_interval
+
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.records = 0         # 파일에 기록된 레코드 수
+        self.bytes = 0           # 파일에 기록된 바이트 수 (압축 전)
+        self.flushes = 0         # 파일 쓰기 횟수
+        self.dropped = 0         # 큐가 가득 차서 버린 레코드 수
+        self.errors = 0          # 쓰기 오류 수
+        self.files = []          # 지금까지 만든 파일 경로
+        self.started = time.monotonic()
+
+        self._raw = None
+        self._file = None
+        self._opened_at = 0.0
+        self._sequence = 0
+        self._closed = False
+        self._lock = threading.Lock()    # 여러 수집기 스레드가 dropped를 함께 늘릴 때 사용
+
+        os.makedirs(directory, exist_ok=True)
+        self._thread = threading.Thread(target=self._run, name='telemetry-sink', daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def __call__(self, name, data):
+        self.emit(name, data)
+
+    def emit(self, name, data, timestamp=None):
+        """
+        레코드를 JSON 한 줄로 바꿔 큐에 넣는 함수 (기다리지 않음, 큐가 가득 차면 버림)
+
+        Returns:
+        - bool: 큐에 넣었으면 True, 버렸으면 False
+
+        [예외]
+        TypeError / ValueError: data를 JSON으로 바꿀 수 없을 때
+        """
+        record = {'timestamp': time.time() if timestamp is None else timestamp,
+                  'kind': name, 'data': data}
+        line = json.dumps(record, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+        try:
+            if self._closed:
+                raise queue.Full
+            self.queue.put_nowait(line + b'\n')
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+            return False
+        return True
+
+    def _open(self):
+        stamp = time.strftime('%Y%m%d-%H%M%S')
+        extension = '.jsonl.gz' if self.compress else '.jsonl'
+        path = os.path.join(self.directory,
+                            f'{self.prefix}-{stamp}-{self._sequence}{extension}')
+        self._sequence += 1
+        self._raw = open(path, 'ab')
+        self._file = gzip.GzipFile(fileobj=self._raw, mode='ab') if self.compress else self._raw
+        self._opened_at = time.monotonic()
+        self.files.append(path)
+
+    def _close_file(self):
+        if self._file is None:
+            return
+        if self._file is not self._raw:
+            self._file.close()
+        self._raw.close()
+        self._raw = None
+        self._file = None
+
+    def _should_rotate(self):
+        if self._file is None:
+            return False
+        if self.max_bytes is not None and self._raw.tell() >= self.max_bytes:
+            return True
+        if self.rotate_interval is not None and \
+                time.monotonic() - self._opened_at >= self.rotate_interval:
+            return True
+        return False
+
+    def _write(self, buffer, count):
+        if self._should_rotate():
+            self._close_file()
+        if self._file is None:
+            self._open()
+        self._file.write(buffer)
+        self._file.flush()
+        self.records += count
+        self.bytes += len(buffer)
+        self.flushes += 1
+
+    def _run(self):
+        buffer = bytearray()
+        count = 0
+        deadline = time.monotonic() + self.flush_interval
+        running = True
+
+        while running:
+            try:
+                item = self.queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                item = None
+
+            if item is _STOP:
+                running = False
+            elif item is not None:
+                buffer += item
+                count += 1
+
+            now = time.monotonic()
+            if buffer and (not running or len(buffer) >= self.flush_bytes or now >= deadline):
+                try:
+                    self._write(buffer, count)
+                except OSError:
+                    self.errors += 1
+                    with self._lock:
+                        self.dropped += count
+                buffer = bytearray()
+                count = 0
+            if now >= deadline:
+                deadline = now + self.flush_interval
+
+        self._close_file()
+
+    def close(self):
+        """남은 레코드를 모두 기록하고 파일을 닫는 함수 (여러 번 호출해도 됨)"""
+        if self._closed:
+            return
+        self._closed = True
+        self.queue.put(_STOP)
+        self._thread.join()
+        # 닫는 도중에 들어와 기록되지 못한 레코드는 버린 것으로 셈
+        while True:
+            try:
+                self.queue.get_nowait()
+            except queue.Empty:
+                break
+            with self._lock:
+                self.dropped += 1
+        atexit.unregister(self.close)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def stats(self):
+        """처리량과 카운터"""
+        elapsed = time.monotonic() - self.started
+        return {
+            'records': self.records,
+            'bytes': self.bytes,
+            'flushes': self.flushes,
+            'dropped': self.dropped,
+            'errors': self.errors,
+            'queued': self.queue.qsize(),
+            'records_per_sec': round(self.records / elapsed, 1) if elapsed > 0 else 0.0,
+            'files': len(self.files)
+        }